@@ -53,6 +53,8 @@ import requests
 from web3 import Web3
 from web3.middleware import geth_poa_middleware
 
+from ternary_logic import canonicalize
+
 # ---------------------------------------------------------------------------
 # LOGGING
 # ---------------------------------------------------------------------------
@@ -88,6 +90,26 @@ def load_config(config_path: str = "TL_Config.json") -> dict:
         return json.load(f)
 
 
+def hex_to_bytes(value: str) -> bytes:
+    """
+    Decode a 0x-prefixed (or bare) hex string.
+
+    str.lstrip("0x") is not a prefix strip: it also eats leading zero
+    digits, so "0x0a1b..." would decode one nibble short.
+    """
+    if value[:2] in ("0x", "0X"):
+        value = value[2:]
+    return bytes.fromhex(value)
+
+
+def keccak256(data: bytes) -> bytes:
+    """
+    keccak256 as computed on-chain. Pass as MerkleLedger(digest=keccak256)
+    so proofs verify in TL_Ledger_Core.verifyMerkleInclusion.
+    """
+    return bytes(Web3.keccak(data))
+
+
 # ---------------------------------------------------------------------------
 # DATA CLASSES
 # ---------------------------------------------------------------------------
@@ -521,15 +543,22 @@ class TLContractClient:
           - laneOriginHash != keccak256("GOVERNANCE_LANE")
         This is the terminal constitutional gate.
 
+        permission_token.merkle_root and merkle_proof must come from the
+        same ternary_logic.MerkleLedger(digest=keccak256).anchor(index)
+        call: the contract folds the proof into logHash with sorted-pair
+        keccak256 and compares the result with merkle_root. The entry's
+        hash-chain merkleRoot is not a tree root, and a SHA-256 tree
+        proves nothing on-chain.
+
         Returns the transaction hash on success.
         """
-        token_id_bytes   = bytes.fromhex(permission_token.token_id.lstrip("0x"))
-        log_hash_bytes   = bytes.fromhex(permission_token.log_hash.lstrip("0x"))
-        merkle_root_bytes = bytes.fromhex(permission_token.merkle_root.lstrip("0x"))
-        signer_key_bytes = bytes.fromhex(permission_token.signer_key_id.lstrip("0x"))
+        token_id_bytes   = hex_to_bytes(permission_token.token_id)
+        log_hash_bytes   = hex_to_bytes(permission_token.log_hash)
+        merkle_root_bytes = hex_to_bytes(permission_token.merkle_root)
+        signer_key_bytes = hex_to_bytes(permission_token.signer_key_id)
         lane_origin_hash = Web3.keccak(text="GOVERNANCE_LANE")
-        sig_bytes        = bytes.fromhex(permission_token.signature_value.lstrip("0x"))
-        proof_bytes      = [bytes.fromhex(p.lstrip("0x")) for p in merkle_proof]
+        sig_bytes        = hex_to_bytes(permission_token.signature_value)
+        proof_bytes      = [hex_to_bytes(p) for p in merkle_proof]
 
         nonce = self.w3.eth.get_transaction_count(self.account.address)
         gas_limit = self.gas_config.get("GAS_LIMIT_REGISTER_TOKEN", 200_000)
@@ -614,6 +643,9 @@ class TLDataBridge:
 
         State 0 (EpistemicHold) and State -1 (Refuse) never reach the contract.
         EpistemicHold is free. Refuse is free. PermissionToken carries a fee.
+
+        merkle_proof: inclusion proof of the PermissionToken's logHash in its
+        merkleRoot, as returned by MerkleLedger.proof_hex().
         """
         trace_id = str(uuid.uuid4())
         merkle_proof = merkle_proof or []
@@ -651,8 +683,9 @@ class TLDataBridge:
         # ------------------------------------------------------------------
         # STEP 2: GOVERNANCE LANE
         # ------------------------------------------------------------------
+        # RFC 8785 canonical form, so the API and auditors can recompute it
         transaction_hash = Web3.keccak(
-            text=json.dumps(transaction_data, sort_keys=True)
+            text=canonicalize(transaction_data)
         ).hex()
 
         try:
@@ -40,13 +40,16 @@ THRESHOLD GOVERNANCE:
 """
 
 import hashlib
-import json
 import uuid
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # TL Framework imports
 from ternary_logic import TLEngine, TLState, TLValue, verify_mandate, calculate_confidence
+from ternary_logic import DurableLedger, LedgerSummary, MerkleLedger
+from ternary_logic import canonical_digest, keccak256
+from ternary_logic import verify_merkle_proof
+from ternary_logic import ChainReport, ChainVerifier, CheckpointLog
 
 
 # =============================================================================
@@ -120,18 +123,18 @@ def commit_log_entry(
     log_id = str(uuid.uuid4())
     committed_at = datetime.now(timezone.utc).isoformat()
 
-    # Canonical serialization of decision content (RFC 8785 in production)
-    canonical_payload = json.dumps({
+    # Decision content, canonicalized per RFC 8785 (JCS) for hashing
+    payload = {
         "logId": log_id,
         "state": decision.state.name,
         "stateValue": decision.state.value,
         "confidence": decision.confidence,
         "reasoning": decision.reasoning,
         "committedAt": committed_at
-    }, sort_keys=True)
+    }
 
-    # SHA-256 hash of canonical payload
-    log_hash = hashlib.sha256(canonical_payload.encode("utf-8")).hexdigest()
+    # SHA-256 of the canonical payload, hashed as it is serialized
+    log_hash = canonical_digest(payload).hexdigest()
 
     # Merkle hash chain: each entry references its predecessor
     merkle_root = hashlib.sha256(
@@ -173,7 +176,10 @@ def commit_log_entry(
     return entry
 
 
-def build_permission_token(log_entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def build_permission_token(
+    log_entry: Dict[str, Any],
+    merkle_root: str
+) -> Optional[Dict[str, Any]]:
     """
     Construct a PermissionToken for PROCEED decisions.
 
@@ -185,6 +191,11 @@ def build_permission_token(log_entry: Dict[str, Any]) -> Optional[Dict[str, Any]
     schema-invalid. No token from outside the Governance Lane can authorize
     execution. (tl_schema.json PermissionToken_v1_0_0, NL=NA Layer 2.)
 
+    merkle_root is the keccak256 tree root from ImmutableLedger.anchor(),
+    not the entry's hash-chain merkleRoot: register_permission_token folds
+    the token's merkle_proof into logHash on-chain and compares the result
+    with this root.
+
     Returns None if the decision state is not PROCEED.
     """
     if log_entry["currentState"] != TLState.PROCEED.value:
@@ -196,7 +207,7 @@ def build_permission_token(log_entry: Dict[str, Any]) -> Optional[Dict[str, Any]
     return {
         "tokenId": str(uuid.uuid4()),
         "logHash": log_entry["logHash"],
-        "merkleRoot": log_entry["merkleRoot"],
+        "merkleRoot": merkle_root,
         "laneOrigin": "GOVERNANCE_LANE",  # NL=NA Layer 2 const. Schema-invalid for any other value.
         "issuedAt": issued_at.isoformat(),
         "expiresAt": expires_at.isoformat(),
@@ -222,11 +233,35 @@ class ImmutableLedger:
     Every governance decision is committed here before any action fires.
     In production this is hardware-backed non-volatile storage with
     TPM 2.0 PCR measurements and Thales Luna 7 HSM signing.
+
+    Alongside the chain, every logHash is a leaf of a Merkle tree, so one
+    entry's inclusion is proven with O(log n) hashes instead of a replay
+    of the chain. On-chain anchoring builds the tree with keccak256.
+
+    Pass store=DurableLedger(directory) to keep entries on disk: commit()
+    then returns only once the entry is durable, and a restarted ledger
+    resumes the chain from the stored entries. Pass a CheckpointLog to
+    sign the chain root every N entries, so verify_chain() can detect a
+    rewritten or truncated ledger as well as broken links.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        store: Optional[DurableLedger] = None,
+        checkpoints: Optional[CheckpointLog] = None
+    ):
         self._entries = []
         self._genesis_hash = hashlib.sha256(b"TL_GENESIS").hexdigest()
+        self._tree = MerkleLedger(digest=keccak256)
+        self._summary = LedgerSummary(genesis_hash=self._genesis_hash)
+        self._store = store
+        self._checkpoints = checkpoints
+        if store is not None:
+            # Resume the chain from the entries already on disk
+            for entry in store.iter_entries():
+                self._entries.append(entry)
+                self._tree.append_leaf(entry["logHash"])
+                self._summary.add(entry)
 
     @property
     def previous_hash(self) -> str:
@@ -236,23 +271,51 @@ class ImmutableLedger:
 
     def commit(self, entry: Dict[str, Any]) -> str:
         """Commit a log entry. Returns the log hash."""
+        if self._store is not None:
+            self._store.commit(entry)  # returns once the entry is on disk
         self._entries.append(entry)
+        self._tree.append_leaf(entry["logHash"])
+        self._summary.add(entry)
+        if self._checkpoints is not None:
+            self._checkpoints.record(len(self._entries) - 1, entry)
         return entry["logHash"]
 
+    @property
+    def tree_root(self) -> Optional[str]:
+        """Merkle root over every committed logHash."""
+        return self._tree.root_hex
+
+    def inclusion_proof(self, index: int) -> list:
+        """Proof that entry index is under tree_root, in the bridge's
+        merkle_proof format."""
+        return self._tree.proof_hex(index)
+
+    def anchor(self, index: int) -> Tuple[str, List[str]]:
+        """tree_root and entry index's proof against it: the merkleRoot
+        and merkle_proof a PermissionToken is registered with."""
+        return self._tree.anchor(index)
+
+    def verify_chain(self, max_workers: int = 1) -> ChainReport:
+        """Audit the chain: recompute every logHash and merkleRoot, check
+        every link and any signed checkpoints."""
+        source = self._store if self._store is not None else self._entries
+        verifier = ChainVerifier(
+            self._genesis_hash, self._checkpoints, max_workers=max_workers
+        )
+        return verifier.verify(source)
+
     @property
     def size(self) -> int:
         return len(self._entries)
 
     def get_summary(self) -> Dict[str, Any]:
-        return {
-            "totalEntries": self.size,
-            "latestMerkleRoot": self.previous_hash,
-            "states": {
-                "PROCEED": sum(1 for e in self._entries if e["currentState"] == 1),
-                "EPISTEMIC_HOLD": sum(1 for e in self._entries if e["currentState"] == 0),
-                "REFUSE": sum(1 for e in self._entries if e["currentState"] == -1)
-            }
-        }
+        """Counts, latest root and first/last commit times, kept up to
+        date on every commit: O(1) however long the ledger is."""
+        return self._summary.to_dict()
+
+    def get_bucket_counts(self, since=None, until=None) -> List[Dict[str, Any]]:
+        """Per-state commit counts per minute, oldest first."""
+        return self._summary.bucket_counts(since, until)
 
 
 # =============================================================================
@@ -391,7 +454,10 @@ def run_quickstart():
     # STEP 2: Initialize Immutable Ledger (Pillar II)
     # -------------------------------------------------------------------------
 
-    ledger = ImmutableLedger()
+    # Checkpoint signing key: demo only. Production keys live in the HSM.
+    ledger = ImmutableLedger(
+        checkpoints=CheckpointLog(b"quickstart-demo-key", interval=2)
+    )
     license_scopes = ["financial.trading", "audit.governance", "compliance.regulatory"]
 
     print()
@@ -440,10 +506,15 @@ def run_quickstart():
     )
     ledger.commit(log_proceed)
 
-    # Permission Token: the only key that opens the actuation gate
-    token = build_permission_token(log_proceed)
+    # Permission Token: the only key that opens the actuation gate. It
+    # carries the tree root its on-chain merkle_proof verifies against.
+    merkle_root, merkle_proof = ledger.anchor(ledger.size - 1)
+    token = build_permission_token(log_proceed, merkle_root)
     assert token is not None
     assert token["laneOrigin"] == "GOVERNANCE_LANE"
+    assert verify_merkle_proof(
+        token["logHash"], merkle_proof, token["merkleRoot"], digest=keccak256
+    )
 
     print(f"  State:           {decision_proceed.state.name} ({decision_proceed.state.value})")
     print(f"  Confidence:      {decision_proceed.confidence:.3f}")
@@ -451,6 +522,7 @@ def run_quickstart():
     print(f"  Log committed:   {log_proceed['logHash'][:16]}...")
     print(f"  Merkle root:     {log_proceed['merkleRoot'][:16]}...")
     print(f"  Permission token: {token['tokenId'][:16]}...")
+    print(f"  Token proof:     {len(merkle_proof)} hashes against {token['merkleRoot'][2:18]}...")
     print(f"  laneOrigin:      {token['laneOrigin']}")
     print(f"  Token expires:   {token['expiresAt']}")
     print(f"  NL=NA:           Log committed before actuation authorized")
@@ -501,7 +573,7 @@ def run_quickstart():
     ledger.commit(log_hold)
 
     # No Permission Token issued for Epistemic Hold
-    token_hold = build_permission_token(log_hold)
+    token_hold = build_permission_token(log_hold, ledger.tree_root)
     assert token_hold is None
 
     # EscrowRecord created (Pillar I)
@@ -563,7 +635,7 @@ def run_quickstart():
     ledger.commit(log_refuse)
 
     # No Permission Token issued for Refuse
-    token_refuse = build_permission_token(log_refuse)
+    token_refuse = build_permission_token(log_refuse, ledger.tree_root)
     assert token_refuse is None
 
     print(f"  State:           {decision_refuse.state.name} ({decision_refuse.state.value})")
@@ -651,6 +723,19 @@ def run_quickstart():
     print(f"  REFUSE:          {ledger_summary['states']['REFUSE']}")
     print(f"  Latest root:     {ledger_summary['latestMerkleRoot'][:16]}...")
 
+    # Inclusion of the first entry, proven without replaying the chain
+    proof = ledger.inclusion_proof(0)
+    assert verify_merkle_proof(
+        log_proceed["logHash"], proof, ledger.tree_root, digest=keccak256
+    )
+    print(f"  Tree root:       {ledger.tree_root[2:18]}...")
+    print(f"  Entry 0 proof:   {len(proof)} hashes, verified")
+
+    audit = ledger.verify_chain()
+    assert audit.ok, audit.first_break
+    print(f"  Chain audit:     {audit.entries_checked} entries, "
+          f"{audit.checkpoints_checked} signed checkpoints, intact")
+
     print()
     print("-" * 70)
     print("ENGINE STATISTICS")
@@ -43,15 +43,16 @@ WHY EPISTEMIC HOLD MATTERS IN SUPPLY CHAINS:
 """
 
 import hashlib
-import json
 import uuid
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
 
 import numpy as np
 
 # TL Framework imports
 from ternary_logic import TLEngine, TLState, TLValue, verify_mandate
+from ternary_logic import CheckpointLog, DurableLedger, LedgerSummary
+from ternary_logic import MerkleLedger, canonical_digest, keccak256
 
 
 # =============================================================================
@@ -94,16 +95,16 @@ def commit_log_entry(
     log_id = str(uuid.uuid4())
     committed_at = datetime.now(timezone.utc).isoformat()
 
-    canonical = json.dumps({
+    payload = {
         "logId": log_id,
         "state": decision.state.name,
         "stateValue": decision.state.value,
         "confidence": decision.confidence,
         "reasoning": decision.reasoning,
         "committedAt": committed_at
-    }, sort_keys=True)
+    }
 
-    log_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    log_hash = canonical_digest(payload).hexdigest()
     merkle_root = hashlib.sha256(
         (previous_hash + log_hash).encode("utf-8")
     ).hexdigest()
@@ -136,8 +137,15 @@ def commit_log_entry(
     return entry
 
 
-def build_permission_token(log_entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """PermissionToken for PROCEED. laneOrigin const GOVERNANCE_LANE. NL=NA Layer 2."""
+def build_permission_token(
+    log_entry: Dict[str, Any],
+    merkle_root: str
+) -> Optional[Dict[str, Any]]:
+    """PermissionToken for PROCEED. laneOrigin const GOVERNANCE_LANE. NL=NA Layer 2.
+
+    merkle_root is the keccak256 tree root from ImmutableLedger.anchor(),
+    the root the token's merkle_proof verifies against on-chain.
+    """
     if log_entry["currentState"] != TLState.PROCEED.value:
         return None
 
@@ -147,7 +155,7 @@ def build_permission_token(log_entry: Dict[str, Any]) -> Optional[Dict[str, Any]
     return {
         "tokenId": str(uuid.uuid4()),
         "logHash": log_entry["logHash"],
-        "merkleRoot": log_entry["merkleRoot"],
+        "merkleRoot": merkle_root,
         "laneOrigin": "GOVERNANCE_LANE",  # NL=NA Layer 2 const
         "issuedAt": issued_at.isoformat(),
         "expiresAt": expires_at.isoformat(),
@@ -162,13 +170,28 @@ def build_permission_token(log_entry: Dict[str, Any]) -> Optional[Dict[str, Any]
 
 
 class ImmutableLedger:
-    """Pillar II: append-only hash chain. See Quickstart_Example.py."""
+    """Pillar II: append-only hash chain plus Merkle tree of logHashes.
+    See Quickstart_Example.py."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        store: Optional[DurableLedger] = None,
+        checkpoints: Optional[CheckpointLog] = None
+    ):
         self._entries = []
         self._genesis_hash = hashlib.sha256(
             b"TL_SUPPLY_CHAIN_GENESIS"
         ).hexdigest()
+        self._tree = MerkleLedger(digest=keccak256)  # on-chain tree hash
+        self._summary = LedgerSummary(genesis_hash=self._genesis_hash)
+        self._store = store
+        self._checkpoints = checkpoints
+        if store is not None:
+            # Resume the chain from the entries already on disk
+            for entry in store.iter_entries():
+                self._entries.append(entry)
+                self._tree.append_leaf(entry["logHash"])
+                self._summary.add(entry)
 
     @property
     def previous_hash(self) -> str:
@@ -178,29 +201,38 @@ class ImmutableLedger:
         )
 
     def commit(self, entry: Dict[str, Any]) -> str:
+        if self._store is not None:
+            self._store.commit(entry)  # returns once the entry is on disk
         self._entries.append(entry)
+        self._tree.append_leaf(entry["logHash"])
+        self._summary.add(entry)
+        if self._checkpoints is not None:
+            self._checkpoints.record(len(self._entries) - 1, entry)
         return entry["logHash"]
 
+    @property
+    def tree_root(self) -> Optional[str]:
+        return self._tree.root_hex
+
+    def inclusion_proof(self, index: int) -> List[str]:
+        return self._tree.proof_hex(index)
+
+    def anchor(self, index: int) -> Tuple[str, List[str]]:
+        """(tree root, proof of entry index against it) for a PermissionToken."""
+        return self._tree.anchor(index)
+
     @property
     def size(self) -> int:
         return len(self._entries)
 
     def get_summary(self) -> Dict[str, Any]:
-        return {
-            "totalEntries": self.size,
-            "latestMerkleRoot": self.previous_hash,
-            "states": {
-                "PROCEED": sum(
-                    1 for e in self._entries if e["currentState"] == 1
-                ),
-                "EPISTEMIC_HOLD": sum(
-                    1 for e in self._entries if e["currentState"] == 0
-                ),
-                "REFUSE": sum(
-                    1 for e in self._entries if e["currentState"] == -1
-                )
-            }
-        }
+        """Counts, latest root and first/last commit times, kept up to
+        date on every commit: O(1) however long the ledger is."""
+        return self._summary.to_dict()
+
+    def get_bucket_counts(self, since=None, until=None) -> List[Dict[str, Any]]:
+        """Per-state commit counts per minute, oldest first."""
+        return self._summary.bucket_counts(since, until)
 
 
 # =============================================================================
@@ -796,8 +828,10 @@ class GlobalSupplyChainManager:
         )
         self.ledger.commit(log_entry)
 
-        # Step 7: Permission Token (PROCEED only)
-        token = build_permission_token(log_entry)
+        # Step 7: Permission Token (PROCEED only), carrying the tree root
+        # its merkle_proof verifies against
+        merkle_root, merkle_proof = self.ledger.anchor(self.ledger.size - 1)
+        token = build_permission_token(log_entry, merkle_root)
 
         # Step 8: Response plan based on state
         response_plan = self._build_response_plan(
@@ -818,6 +852,7 @@ class GlobalSupplyChainManager:
             "permissionToken": (
                 token["tokenId"][:16] + "..." if token else None
             ),
+            "merkleProof": merkle_proof if token else None,
             "laneOrigin": token["laneOrigin"] if token else "N/A",
             "responsePlan": response_plan,
             "regulatoryCompliant": compliance["compliant"],
@@ -63,28 +63,118 @@ __license__ = "MIT"
 from .core import (
     TLState,
     TLValue,
+    CompactTLValue,
+    FrozenTLValue,
     TLEngine,
     EpistemicHoldEvent,
     TLDecorator,
+    TLBatchResult,
+    UNFORCED,
 )
 
+# Decision log and hold storage
+from .decision_log import ColumnarDecisionLog
+from .holds import HoldRegistry
+from .retention import RetentionPolicy, SegmentedLog
+from .audit_export import NDJSONAuditExporter
+from .hold_store import HoldPage, SQLiteHoldStore
+
+# Threshold profiles
+from .thresholds import ThresholdProfile, ThresholdProfileTable, ThresholdVersion
+
+# Monitoring
+from .monitoring import HoldRateMonitor
+
+# Decorator result cache
+from .decision_cache import DecisionCache
+
+# Engine variants
+from .concurrent_engine import ConcurrentTLEngine
+from .async_engine import AsyncTLEngine
+from .replay import ParallelReplay, ReplayResult
+
 # Utility functions
 from .core import (
     calculate_confidence,
+    calculate_confidence_batch,
     analyze_uncertainty,
     verify_mandate,
+    verify_mandate_batch,
+    MandateBatchResult,
+)
+
+# Binary record codec
+from .core import decode_record, iter_decode_records
+
+# Mandates
+from .mandates import DEFAULT_MANDATES, Mandate, MandateCheck, MandateRegistry
+
+# Canonical JSON, Merkle ledger, durable storage, summaries and
+# chain verification
+from .merkle import MerkleLedger, keccak256, verify_merkle_proof
+from .ledger_store import DurableLedger
+from .ledger_summary import LedgerSummary
+from .canonical_json import canonical_digest, canonicalize, canonicalize_into
+from .ledger_verify import (
+    ChainCheckpoint,
+    ChainIssue,
+    ChainReport,
+    ChainVerifier,
+    CheckpointLog,
 )
 
 # Public API
 __all__ = [
     "TLState",
     "TLValue",
+    "CompactTLValue",
+    "FrozenTLValue",
     "TLEngine",
     "EpistemicHoldEvent",
     "TLDecorator",
+    "DecisionCache",
+    "TLBatchResult",
+    "UNFORCED",
+    "ColumnarDecisionLog",
+    "HoldRegistry",
+    "RetentionPolicy",
+    "SegmentedLog",
+    "NDJSONAuditExporter",
+    "SQLiteHoldStore",
+    "HoldPage",
+    "ThresholdProfile",
+    "ThresholdProfileTable",
+    "ThresholdVersion",
+    "HoldRateMonitor",
+    "ConcurrentTLEngine",
+    "AsyncTLEngine",
+    "ParallelReplay",
+    "ReplayResult",
     "calculate_confidence",
+    "calculate_confidence_batch",
     "analyze_uncertainty",
     "verify_mandate",
+    "verify_mandate_batch",
+    "MandateBatchResult",
+    "Mandate",
+    "MandateCheck",
+    "MandateRegistry",
+    "DEFAULT_MANDATES",
+    "decode_record",
+    "iter_decode_records",
+    "canonicalize",
+    "canonicalize_into",
+    "canonical_digest",
+    "MerkleLedger",
+    "keccak256",
+    "verify_merkle_proof",
+    "DurableLedger",
+    "LedgerSummary",
+    "CheckpointLog",
+    "ChainCheckpoint",
+    "ChainVerifier",
+    "ChainReport",
+    "ChainIssue",
     "__version__",
     "__author__",
     "__email__",
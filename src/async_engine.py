@@ -0,0 +1,193 @@
+"""
+asyncio front end for TLEngine.
+
+State determination is a handful of comparisons and stays on the event
+loop. Everything that can block is moved off it:
+
+    - per-decision and per-hold log lines use the engine's 'queued'
+      log mode, so formatting and handler I/O run on a listener thread
+    - audit persistence: records are handed to an optional blocking
+      ``audit_sink`` in batches on an executor, never inline
+    - export_audit_trail runs on an executor
+
+A slow audit flush therefore delays only the flush itself; the loop keeps
+processing ticks while it runs.
+
+Usage:
+    >>> from ternary_logic import AsyncTLEngine, TLDecorator
+    >>> engine = AsyncTLEngine(
+    ...     proceed_threshold=YOUR_INSTITUTION_PROCEED_THRESHOLD,
+    ...     hold_threshold=YOUR_INSTITUTION_HOLD_THRESHOLD,
+    ...     audit_sink=write_records_to_store
+    ... )
+    >>> @TLDecorator(engine)
+    ... async def momentum_signal(tick):
+    ...     return 0.82, "Momentum confirmed"
+    >>> decision = await momentum_signal(tick)
+"""
+
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .core import EpistemicHoldEvent, TLEngine, TLState, TLValue
+from .thresholds import ThresholdVersion
+
+logger = logging.getLogger(__name__)
+
+AuditBatch = List[Tuple[str, Any]]
+
+
+class AsyncTLEngine:
+    """Coroutine API over a TLEngine for asyncio decision pipelines.
+
+    Args:
+        proceed_threshold: As for TLEngine. REQUIRED.
+        hold_threshold:    As for TLEngine. REQUIRED.
+        executor:          Executor for blocking work. Default: the loop's
+                           default executor.
+        audit_sink:        Optional blocking callable that persists a list
+                           of (kind, record) audit records, as delivered to
+                           TLEngine audit listeners. Called on the executor.
+        engine_class:      TLEngine subclass to wrap. Default: TLEngine.
+        **engine_kwargs:   Passed to the engine. log_mode defaults to
+                           'queued' so log handlers never run on the loop.
+    """
+
+    def __init__(
+        self,
+        proceed_threshold: Optional[float] = None,
+        hold_threshold: Optional[float] = None,
+        executor: Optional[Executor] = None,
+        audit_sink: Optional[Callable[[AuditBatch], None]] = None,
+        engine_class: type = TLEngine,
+        **engine_kwargs
+    ):
+        engine_kwargs.setdefault('log_mode', 'queued')
+        self.engine = engine_class(
+            proceed_threshold=proceed_threshold,
+            hold_threshold=hold_threshold,
+            **engine_kwargs
+        )
+        self.executor = executor
+        self.audit_sink = audit_sink
+        self._pending: Deque[Tuple[str, Any]] = deque()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._sink_error: Optional[BaseException] = None
+        if audit_sink is not None:
+            self.engine.add_audit_listener(self._enqueue)
+
+    # -- evaluation (on the loop) ----------------------------------------
+
+    async def evaluate(
+        self,
+        confidence: float,
+        reasoning: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        force_state: Optional[TLState] = None,
+        profile: Optional[str] = None
+    ) -> TLValue:
+        """Evaluate on the event loop; persistence is scheduled, not awaited."""
+        value = self.engine.evaluate(
+            confidence, reasoning, metadata, force_state, profile
+        )
+        self._schedule_flush()
+        return value
+
+    async def evaluate_batch(self, confidences, **kwargs):
+        """Batch evaluation; see TLEngine.evaluate_batch."""
+        result = self.engine.evaluate_batch(confidences, **kwargs)
+        self._schedule_flush()
+        return result
+
+    async def resolve_hold(self, event_id: str, action: str):
+        """Resolve an Epistemic Hold with documented action."""
+        self.engine.resolve_hold(event_id, action)
+        self._schedule_flush()
+
+    async def update_thresholds(self, *args, **kwargs) -> ThresholdVersion:
+        """Hot-swap thresholds; see TLEngine.update_thresholds."""
+        version = self.engine.update_thresholds(*args, **kwargs)
+        self._schedule_flush()
+        return version
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Engine statistics (O(1), safe to call on the loop)."""
+        return self.engine.get_statistics()
+
+    @property
+    def epistemic_hold_rate(self) -> float:
+        return self.engine.epistemic_hold_rate
+
+    @property
+    def decision_log(self):
+        return self.engine.decision_log
+
+    @property
+    def epistemic_holds(self) -> List[EpistemicHoldEvent]:
+        return self.engine.epistemic_holds
+
+    # -- persistence (off the loop) --------------------------------------
+
+    def _enqueue(self, kind: str, record: Any):
+        self._pending.append((kind, record))
+
+    def _schedule_flush(self):
+        if self._pending and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._drain()
+            )
+
+    async def _drain(self):
+        # Records leave the queue only once the sink has returned, so a
+        # failed batch is retried on the next flush instead of lost.
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            batch = list(self._pending)
+            try:
+                await loop.run_in_executor(
+                    self.executor, self.audit_sink, batch
+                )
+            except Exception as exc:
+                logger.exception(
+                    f"Audit sink failed; {len(self._pending)} records kept "
+                    f"for retry"
+                )
+                self._sink_error = exc
+                return
+            for _ in batch:
+                self._pending.popleft()
+
+    async def flush(self):
+        """Wait until every pending audit record has reached the sink.
+
+        Raises:
+            Exception: The audit sink's error, if it failed. The records
+                       it was given stay queued for the next flush.
+        """
+        while self._pending or (
+            self._flush_task is not None and not self._flush_task.done()
+        ):
+            self._sink_error = None
+            self._schedule_flush()
+            await self._flush_task
+            if self._sink_error is not None:
+                error, self._sink_error = self._sink_error, None
+                raise error
+
+    async def export_audit_trail(self, filepath: str):
+        """Export the audit trail on the executor."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self.executor, self.engine.export_audit_trail, filepath
+        )
+
+    async def aclose(self):
+        """Flush pending audit records and stop background logging."""
+        await self.flush()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self.engine.close)
@@ -0,0 +1,306 @@
+"""
+Streaming NDJSON audit export.
+
+TLEngine.export_audit_trail writes a complete snapshot on demand. The
+NDJSONAuditExporter instead runs continuously: it listens to an engine's
+audit records (decisions, Epistemic Hold events, hold resolutions and
+threshold updates), snapshots and queues them, and a background thread
+appends them as newline-delimited JSON. Files rotate by size and/or age,
+may be gzip-compressed, and a checkpoint file records how far the export
+has progressed so a restarted exporter resumes from the last written
+offset instead of starting over. The checkpoint also identifies the last
+decision and hold written, and an exporter refuses to resume against an
+engine whose logs do not contain them at the checkpointed offsets.
+
+Each line is one record: {"record_type": <kind>, ...record.to_dict()}.
+
+Usage:
+    >>> from ternary_logic import NDJSONAuditExporter
+    >>> exporter = NDJSONAuditExporter('audit/stream', max_bytes=64 << 20)
+    >>> exporter.attach(engine)
+    >>> ...
+    >>> exporter.close()
+"""
+
+import gzip
+import hashlib
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# Engine audit record kind -> checkpoint counter key.
+_COUNTERS = {
+    'decision': 'decisions',
+    'epistemic_hold': 'epistemic_holds',
+    'hold_resolution': 'hold_resolutions',
+    'threshold_update': 'threshold_updates',
+}
+
+# Record kinds backfilled from the engine's logs on attach.
+_BACKFILLED = ('decision', 'epistemic_hold')
+
+
+def _snapshot(record: Any) -> Dict[str, Any]:
+    return record if isinstance(record, dict) else record.to_dict()
+
+
+def _fingerprint(kind: str, data: Dict[str, Any]) -> str:
+    """Identity of a backfilled record, stable between the live record
+    and the engine's log of it. Hold events have ids; decisions are
+    identified by timestamp, state and reasoning (the fields every
+    decision log keeps exactly)."""
+    if kind == 'epistemic_hold':
+        return data['event_id']
+    key = f"{data['timestamp']}|{data['state']}|{data['reasoning']}"
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+class NDJSONAuditExporter:
+    """Continuously export an engine's audit records as rotated NDJSON.
+
+    Args:
+        directory: Where export files and the checkpoint are written.
+        prefix: File name prefix for export files.
+        max_bytes: Rotate once a file holds this many (uncompressed) bytes.
+        max_seconds: Rotate once a file has been open this long.
+        compress: Write gzip-compressed files (.ndjson.gz).
+        poll_interval: How often the writer wakes up to check rotation.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = 'audit',
+        max_bytes: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        compress: bool = False,
+        poll_interval: float = 0.5
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.compress = compress
+        self.poll_interval = poll_interval
+
+        self.checkpoint_path = self.directory / f"{prefix}.checkpoint.json"
+        self._checkpoint = self._load_checkpoint()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._file = None
+        self._opened_at = 0.0
+        self._engine = None
+        self._thread: Optional[threading.Thread] = None
+
+    # -- checkpoint -------------------------------------------------------
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        checkpoint = {
+            'decisions': 0,
+            'epistemic_holds': 0,
+            'hold_resolutions': 0,
+            'threshold_updates': 0,
+            'segment': -1,
+            'file': None,
+            'bytes': 0,
+            'last': {},
+        }
+        if self.checkpoint_path.exists():
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                checkpoint.update(json.load(f))
+        return checkpoint
+
+    def _save_checkpoint(self):
+        tmp = self.checkpoint_path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._checkpoint, f)
+        os.replace(tmp, self.checkpoint_path)
+
+    @property
+    def offsets(self) -> Dict[str, int]:
+        """Records written so far, per record kind."""
+        return {key: self._checkpoint[key] for key in _COUNTERS.values()}
+
+    # -- lifecycle --------------------------------------------------------
+
+    def attach(self, engine, backfill: bool = True):
+        """Start exporting an engine's audit records.
+
+        With backfill, decisions and hold events already in the engine's
+        logs beyond the checkpoint offsets are queued first, so a restarted
+        exporter resumes where the previous one stopped.
+
+        Raises:
+            RuntimeError: If the exporter is already attached.
+            ValueError: If backfilling and the engine's logs do not hold
+                        the last exported records at the checkpointed
+                        offsets (a different or reset engine). Attach with
+                        backfill=False to export only new records.
+        """
+        if self._engine is not None:
+            raise RuntimeError("Exporter is already attached to an engine")
+        if backfill:
+            pending = [
+                (kind, self._resume_history(kind, log))
+                for kind, log in zip(
+                    _BACKFILLED, (engine.decision_log, engine.epistemic_holds)
+                )
+            ]
+            for kind, records in pending:
+                for record in records:
+                    self._queue.put((kind, _snapshot(record)))
+        self._engine = engine
+        engine.add_audit_listener(self)
+        self._thread = threading.Thread(
+            target=self._run, name='tl-audit-export', daemon=True
+        )
+        self._thread.start()
+
+    def _resume_history(self, kind: str, log: Iterable) -> Iterator[Any]:
+        """Records of log after the checkpoint, once the last exported one
+        is confirmed to sit at the checkpointed offset."""
+        iter_records = getattr(log, 'iter_records', None)
+        records = iter_records() if iter_records is not None else iter(log)
+        counter = _COUNTERS[kind]
+        start = self._checkpoint[counter]
+        if start == 0:
+            return records
+        expected = self._checkpoint['last'].get(counter)
+        if expected is None:
+            logger.warning(
+                "Audit checkpoint predates record identities; resuming "
+                f"{counter} at offset {start} unverified"
+            )
+            return itertools.islice(records, start, None)
+        last = next(itertools.islice(records, start - 1, None), None)
+        if last is None or _fingerprint(kind, _snapshot(last)) != expected:
+            raise ValueError(
+                f"Audit checkpoint does not match this engine: record "
+                f"{start - 1} of its {counter} is not the last one "
+                f"exported. Attach with backfill=False to export only "
+                f"new records."
+            )
+        return records
+
+    def __call__(self, kind: str, record: Any):
+        """Audit listener: queue a snapshot of a record for the writer
+        thread, so later changes (a hold's resolution) are not exported
+        with it."""
+        self._queue.put((kind, _snapshot(record)))
+
+    def flush(self):
+        """Block until every queued record is written and checkpointed."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """Detach from the engine, drain the queue and close the file."""
+        if self._engine is not None:
+            self._engine.remove_audit_listener(self)
+            self._engine = None
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        self._close_file()
+
+    # -- writer thread ----------------------------------------------------
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                self._rotate_if_due()
+                continue
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch = [item]
+            stop = False
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                for kind, record in batch:
+                    self._write(kind, record)
+                if self._file is not None:
+                    self._file.flush()
+                self._save_checkpoint()
+            except Exception:
+                logger.exception("Audit export batch failed")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                self._queue.task_done()
+                return
+
+    def _write(self, kind: str, data: Dict[str, Any]):
+        line = json.dumps(
+            {'record_type': kind, **data}, separators=(',', ':')
+        ).encode('utf-8') + b'\n'
+        self._rotate_if_due()
+        if self._file is None:
+            self._open_file()
+        self._file.write(line)
+        self._checkpoint['bytes'] += len(line)
+        self._checkpoint[_COUNTERS[kind]] += 1
+        if kind in _BACKFILLED:
+            self._checkpoint['last'][_COUNTERS[kind]] = _fingerprint(kind, data)
+        if self.max_bytes is not None and self._checkpoint['bytes'] >= self.max_bytes:
+            self._close_file()
+
+    def _rotate_if_due(self):
+        if (
+            self._file is not None
+            and self.max_seconds is not None
+            and time.monotonic() - self._opened_at >= self.max_seconds
+        ):
+            self._close_file()
+
+    def _open_file(self):
+        cp = self._checkpoint
+        previous = cp['file'] and self.directory / cp['file']
+        # Resume a plain-text file at the last checkpointed byte, dropping
+        # any partial write past it. Gzip files always start fresh.
+        if previous and not self.compress and previous.exists() and (
+            self.max_bytes is None or cp['bytes'] < self.max_bytes
+        ):
+            f = open(previous, 'r+b')
+            f.truncate(cp['bytes'])
+            f.seek(cp['bytes'])
+            self._file = f
+        else:
+            cp['segment'] += 1
+            suffix = '.ndjson.gz' if self.compress else '.ndjson'
+            name = f"{self.prefix}-{cp['segment']:06d}{suffix}"
+            path = self.directory / name
+            self._file = gzip.open(path, 'ab') if self.compress else open(path, 'ab')
+            cp['file'] = name
+            cp['bytes'] = 0
+        self._opened_at = time.monotonic()
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            # The next record opens a new file.
+            self._checkpoint['file'] = None
+            self._save_checkpoint()
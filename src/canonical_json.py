@@ -0,0 +1,268 @@
+"""
+RFC 8785 JSON Canonicalization Scheme (JCS) for hashed governance payloads.
+
+A logHash is only reproducible if every writer and every auditor turns the
+same payload into the same bytes. json.dumps(sort_keys=True) does not
+guarantee that: its separators, ASCII escaping, float formatting and code
+point key order are Python's, not a standard's. JCS fixes each of them:
+
+    - no whitespace; members separated by ',' and ':'
+    - object keys sorted by their UTF-16 code units
+    - strings escape only '"', '\\' and control characters, and lower
+      case \\u00XX for controls without a short escape; everything else is
+      written as UTF-8
+    - numbers in ECMAScript Number.prototype.toString form: the shortest
+      digits that round-trip, integers without '.0', -0 as 0, exponent
+      form only below 1e-6 or from 1e21
+    - NaN and Infinity are rejected
+
+Canonicalization runs on every ledger commit, so the common case is kept
+short. A dict of strings, numbers, booleans and None (the decision
+payload) is written in one pass against a cached key order with its
+separators already encoded. canonical_digest() and canonicalize_into()
+feed a hash object or a caller-owned buffer in bounded chunks, so a large
+value is never held as one string.
+
+Usage:
+    >>> from ternary_logic import canonicalize, canonical_digest
+    >>> canonicalize({"b": 1.0, "a": [True, None, 1e21]})
+    '{"a":[true,null,1e+21],"b":1}'
+    >>> canonical_digest(payload).hexdigest()        # sha256 by default
+    >>> buffer = bytearray()
+    >>> for payload in payloads:
+    ...     canonicalize_into(payload, buffer)
+"""
+
+import hashlib
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Integers in this range are exact doubles whose ES6 form is str(n).
+_MAX_SAFE_INTEGER = 2 ** 53
+
+# Between these magnitudes Python's repr() of a non-integer float is
+# already in ES6 form: fixed notation with the shortest round-trip digits.
+_REPR_MIN = 1e-4
+_REPR_MAX = float(_MAX_SAFE_INTEGER)
+
+# Key tuple (in the caller's insertion order) -> members in JCS order, as
+# (key, '{"key":' or ',"key":'). Payloads are built by the same few code
+# paths, so a handful of key sets cover nearly every call.
+_KEY_ORDER_CACHE: Dict[Tuple[str, ...], Tuple[Tuple[str, str], ...]] = {}
+_KEY_ORDER_CACHE_SIZE = 256
+
+# Parts held before a streaming sink is fed.
+_FLUSH_PARTS = 4096
+
+
+def format_number(value: Any) -> str:
+    """ES6 Number.prototype.toString form of an int or float.
+
+    Raises:
+        ValueError: For NaN, infinities and integers that are not exactly
+                    representable as IEEE 754 doubles.
+    """
+    if isinstance(value, int):
+        if -_MAX_SAFE_INTEGER <= value <= _MAX_SAFE_INTEGER:
+            return str(int(value))
+        as_float = float(value)
+        if as_float != value:
+            raise ValueError(
+                f"Integer {value} is not exactly representable as a double"
+            )
+        return _format_float(as_float)
+    return _format_float(float(value))
+
+
+def _format_float(value: float) -> str:
+    if value != value or value in (float('inf'), float('-inf')):
+        raise ValueError(f"{value} is not a valid JSON number")
+    magnitude = abs(value)
+    if magnitude < _REPR_MAX:
+        if value.is_integer():
+            return str(int(value))                # also maps -0.0 to '0'
+        if magnitude >= _REPR_MIN:
+            return repr(value)
+
+    # Decompose repr() into its shortest digits and the decimal exponent n
+    # with value = 0.<digits> * 10**n, then lay it out per ES6 7.1.12.1.
+    text = repr(value)
+    sign = ''
+    if text[0] == '-':
+        sign, text = '-', text[1:]
+    mantissa, _, exponent = text.partition('e')
+    whole, _, fraction = mantissa.partition('.')
+    digits = (whole + fraction).lstrip('0')
+    stripped = digits.rstrip('0')
+    k = len(stripped)
+    n = k + int(exponent or 0) - len(fraction) + (len(digits) - k)
+    digits = stripped
+
+    if k <= n <= 21:
+        return sign + digits + '0' * (n - k)
+    if 0 < n <= 21:
+        return sign + digits[:n] + '.' + digits[n:]
+    if -6 < n <= 0:
+        return sign + '0.' + '0' * -n + digits
+    e = n - 1
+    return (
+        sign + digits[0] + ('.' + digits[1:] if k > 1 else '')
+        + 'e' + ('+' if e >= 0 else '-') + str(abs(e))
+    )
+
+
+def _utf16_key(key: str) -> bytes:
+    return key.encode('utf-16-be', 'surrogatepass')
+
+
+def _key_order(keys: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    order = _KEY_ORDER_CACHE.get(keys)
+    if order is None:
+        for key in keys:
+            if not isinstance(key, str):
+                raise TypeError(
+                    f"Object keys must be str, not {type(key).__name__}"
+                )
+        ordered = sorted(keys, key=_utf16_key)
+        order = tuple(
+            (key, ('{' if i == 0 else ',') + encode_basestring(key) + ':')
+            for i, key in enumerate(ordered)
+        )
+        if len(_KEY_ORDER_CACHE) >= _KEY_ORDER_CACHE_SIZE:
+            _KEY_ORDER_CACHE.clear()
+        _KEY_ORDER_CACHE[keys] = order
+    return order
+
+
+def _scalar(value: Any) -> Optional[str]:
+    """JCS text of a primitive, or None for containers and unknown types."""
+    kind = type(value)
+    if kind is str:
+        return encode_basestring(value)
+    if kind is float:
+        return _format_float(value)
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if kind is int:
+        if -_MAX_SAFE_INTEGER <= value <= _MAX_SAFE_INTEGER:
+            return str(value)
+        return format_number(value)
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if isinstance(value, (int, float)):            # IntEnum, numpy floats
+        return format_number(value)
+    return None
+
+
+def _flat_dict(value: dict) -> Optional[str]:
+    """One-pass fast path for a dict of primitives; None otherwise."""
+    if not value:
+        return '{}'
+    parts = []
+    append = parts.append
+    for key, prefix in _key_order(tuple(value)):
+        text = _scalar(value[key])
+        if text is None:
+            return None
+        append(prefix)
+        append(text)
+    append('}')
+    return ''.join(parts)
+
+
+def _write(
+    value: Any,
+    parts: List[str],
+    flush: Optional[Callable[[List[str]], None]]
+):
+    text = _scalar(value)
+    if text is not None:
+        parts.append(text)
+    elif isinstance(value, dict):
+        if not value:
+            parts.append('{}')
+            return
+        for key, prefix in _key_order(tuple(value)):
+            parts.append(prefix)
+            _write(value[key], parts, flush)
+            if flush is not None and len(parts) >= _FLUSH_PARTS:
+                flush(parts)
+        parts.append('}')
+    elif isinstance(value, (list, tuple)):
+        separator = '['
+        for item in value:
+            parts.append(separator)
+            _write(item, parts, flush)
+            if flush is not None and len(parts) >= _FLUSH_PARTS:
+                flush(parts)
+            separator = ','
+        parts.append(']' if separator == ',' else '[]')
+    else:
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+
+
+def _stream(value: Any, sink: Callable[[bytes], Any]):
+    """Feed the UTF-8 canonical form of value to sink in bounded chunks."""
+    if type(value) is dict:
+        text = _flat_dict(value)
+        if text is not None:
+            sink(text.encode('utf-8'))
+            return
+
+    def flush(parts: List[str]):
+        sink(''.join(parts).encode('utf-8'))
+        parts.clear()
+
+    parts: List[str] = []
+    _write(value, parts, flush)
+    if parts:
+        flush(parts)
+
+
+def canonicalize(value: Any) -> str:
+    """RFC 8785 canonical JSON text of value.
+
+    Dicts, lists and tuples, str, int, float, bool and None are accepted.
+
+    Raises:
+        TypeError: For other types and for non-str object keys.
+        ValueError: For NaN, infinities and integers beyond double range.
+    """
+    if type(value) is dict:
+        text = _flat_dict(value)
+        if text is not None:
+            return text
+    parts: List[str] = []
+    _write(value, parts, None)
+    return ''.join(parts)
+
+
+def canonicalize_into(value: Any, buffer: bytearray) -> bytearray:
+    """Append the UTF-8 canonical form of value to buffer and return it.
+
+    Lets a writer reuse one buffer across many payloads.
+    """
+    _stream(value, buffer.extend)
+    return buffer
+
+
+def canonical_digest(value: Any, hasher: Any = None) -> Any:
+    """Hash the UTF-8 canonical form of value while serializing it.
+
+    Args:
+        value: The JSON value.
+        hasher: A hashlib-style object with update(); a new sha256 if None.
+
+    Returns:
+        The hasher, e.g. for .hexdigest().
+    """
+    if hasher is None:
+        hasher = hashlib.sha256()
+    _stream(value, hasher.update)
+    return hasher
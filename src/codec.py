@@ -0,0 +1,298 @@
+"""
+Compact binary encoding for TL records.
+
+TLValue.to_json() and the NDJSON segment/export paths spell out every
+field name and ISO timestamp for every record. The binary form packs the
+fixed fields (state, confidence, timestamp, threshold epoch, string
+lengths) into one struct and appends the variable parts as length-prefixed
+UTF-8; free-form dicts (metadata, hold inputs) are embedded as compact
+JSON. A decision with empty metadata takes 50 bytes plus its reasoning
+text.
+
+Every record is framed with an 8-byte header:
+
+    magic b'TL' | format version (u8) | record kind (u8) | body length (u32)
+
+so streams can be concatenated, skipped through without decoding, and
+rejected cleanly when written by an unsupported future version.
+
+This module holds the wire layout only. TLValue, CompactTLValue,
+FrozenTLValue and EpistemicHoldEvent provide to_bytes()/from_bytes(), and
+ternary_logic.core.decode_record / iter_decode_records decode any of them.
+
+Round trips are exact for JSON-compatible metadata, including naive or
+fixed-offset timestamps (an aware timestamp keeps its UTC offset, not its
+tz name).
+
+Usage:
+    >>> from ternary_logic import decode_record, iter_decode_records
+    >>> blob = value.to_bytes()
+    >>> decode_record(blob) == value
+    >>> with open('decisions.tlb', 'rb') as f:
+    ...     for record in iter_decode_records(f):
+    ...         ...
+"""
+
+import json
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+MAGIC = b'TL'
+VERSION = 1
+
+KIND_TL_VALUE = 1
+KIND_COMPACT_TL_VALUE = 2
+KIND_FROZEN_TL_VALUE = 3
+KIND_HOLD_EVENT = 4
+
+_HEADER = struct.Struct('<2sBBI')
+HEADER_SIZE = _HEADER.size
+
+# state, flags, confidence, timestamp, utc offset (s), threshold epoch,
+# then byte lengths of reasoning, profile and metadata JSON.
+_VALUE = struct.Struct('<bBdqiqIII')
+_VALUE_PROFILE = 0x01
+_VALUE_METADATA = 0x02
+_VALUE_AWARE = 0x04
+
+# flags, timestamp, utc offset, resolution timestamp, utc offset, then
+# byte lengths of event_id, trigger_reason, resolution_action and the
+# JSON payload [data_inputs, model_outputs, signal_conflicts,
+# uncertainty_metrics].
+_HOLD = struct.Struct('<BqiqiIIII')
+_HOLD_ACTION = 0x01
+_HOLD_RESOLVED_AT = 0x02
+_HOLD_AWARE = 0x04
+_HOLD_RESOLVED_AWARE = 0x08
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+# One encoder instance: json.dumps builds a new one per call whenever
+# non-default options are passed.
+_encode_json = json.JSONEncoder(
+    separators=(',', ':'), ensure_ascii=False
+).encode
+_decode_json = json.JSONDecoder().decode
+
+
+def _dumps(value: Any) -> bytes:
+    return _encode_json(value).encode('utf-8')
+
+
+def datetime_to_us(value: datetime) -> Tuple[int, Optional[int]]:
+    """(wall-clock microseconds since the epoch, UTC offset in seconds or
+    None for a naive datetime)."""
+    offset = value.utcoffset()
+    if offset is None:
+        return (value - _EPOCH) // _MICROSECOND, None
+    return (
+        (value.replace(tzinfo=None) - _EPOCH) // _MICROSECOND,
+        int(offset.total_seconds())
+    )
+
+
+def us_to_datetime(us: int, offset: Optional[int]) -> datetime:
+    """Inverse of datetime_to_us."""
+    value = _EPOCH + timedelta(0, 0, us)
+    if offset is None:
+        return value
+    return value.replace(tzinfo=timezone(timedelta(seconds=offset)))
+
+
+def _frame(kind: int, body: bytes) -> bytes:
+    return _HEADER.pack(MAGIC, VERSION, kind, len(body)) + body
+
+
+def _read_header(data: Buffer, offset: int = 0) -> Tuple[int, int]:
+    """Validate the header at offset; return (kind, body length)."""
+    if len(data) - offset < HEADER_SIZE:
+        raise ValueError("Truncated TL record header")
+    magic, version, kind, length = _HEADER.unpack_from(data, offset)
+    if magic != MAGIC:
+        raise ValueError(f"Not a TL binary record (magic {bytes(magic)!r})")
+    if version != VERSION:
+        raise ValueError(
+            f"Unsupported TL binary format version {version} "
+            f"(this build reads version {VERSION})"
+        )
+    return kind, length
+
+
+# -- values -----------------------------------------------------------------
+
+def encode_value(
+    kind: int,
+    state_value: int,
+    confidence: float,
+    reasoning: str,
+    metadata: Optional[Dict[str, Any]],
+    timestamp: int,
+    utc_offset: Optional[int],
+    profile: Optional[str],
+    threshold_epoch: int
+) -> bytes:
+    """Frame one TL value. ``timestamp`` is microseconds (TLValue) or
+    nanoseconds (compact values) since the epoch."""
+    reasoning_b = reasoning.encode('utf-8')
+    profile_b = profile.encode('utf-8') if profile is not None else b''
+    metadata_b = _dumps(metadata) if metadata else b''
+    flags = (
+        (_VALUE_PROFILE if profile is not None else 0)
+        | (_VALUE_METADATA if metadata is not None else 0)
+        | (_VALUE_AWARE if utc_offset is not None else 0)
+    )
+    body = b''.join((
+        _VALUE.pack(
+            state_value, flags, confidence, timestamp, utc_offset or 0,
+            threshold_epoch, len(reasoning_b), len(profile_b), len(metadata_b)
+        ),
+        reasoning_b, profile_b, metadata_b
+    ))
+    return _frame(kind, body)
+
+
+def decode_value(body: Buffer) -> Tuple[
+    int, float, str, Optional[Dict[str, Any]], int, Optional[int],
+    Optional[str], int
+]:
+    """(state_value, confidence, reasoning, metadata, timestamp,
+    utc_offset, profile, threshold_epoch) from a value body."""
+    (state_value, flags, confidence, timestamp, utc_offset, epoch,
+     n_reasoning, n_profile, n_metadata) = _VALUE.unpack_from(body)
+    pos = _VALUE.size
+    reasoning = body[pos:pos + n_reasoning].decode('utf-8')
+    pos += n_reasoning
+    profile = (
+        body[pos:pos + n_profile].decode('utf-8')
+        if flags & _VALUE_PROFILE else None
+    )
+    pos += n_profile
+    if flags & _VALUE_METADATA:
+        metadata = (
+            _decode_json(body[pos:pos + n_metadata].decode('utf-8'))
+            if n_metadata else {}
+        )
+    else:
+        metadata = None
+    return (
+        state_value, confidence, reasoning, metadata, timestamp,
+        utc_offset if flags & _VALUE_AWARE else None, profile, epoch
+    )
+
+
+# -- hold events ------------------------------------------------------------
+
+def encode_hold_event(
+    event_id: str,
+    trigger_reason: str,
+    data_inputs: Dict[str, Any],
+    model_outputs: Dict[str, Any],
+    signal_conflicts: List[str],
+    uncertainty_metrics: Dict[str, float],
+    resolution_action: Optional[str],
+    resolution_timestamp: Optional[datetime],
+    timestamp: datetime
+) -> bytes:
+    """Frame one Epistemic Hold event."""
+    ts, ts_offset = datetime_to_us(timestamp)
+    if resolution_timestamp is not None:
+        resolved, resolved_offset = datetime_to_us(resolution_timestamp)
+    else:
+        resolved, resolved_offset = 0, None
+    event_id_b = event_id.encode('utf-8')
+    reason_b = trigger_reason.encode('utf-8')
+    action_b = (
+        resolution_action.encode('utf-8')
+        if resolution_action is not None else b''
+    )
+    payload_b = _dumps(
+        [data_inputs, model_outputs, signal_conflicts, uncertainty_metrics]
+    )
+    flags = (
+        (_HOLD_ACTION if resolution_action is not None else 0)
+        | (_HOLD_RESOLVED_AT if resolution_timestamp is not None else 0)
+        | (_HOLD_AWARE if ts_offset is not None else 0)
+        | (_HOLD_RESOLVED_AWARE if resolved_offset is not None else 0)
+    )
+    body = b''.join((
+        _HOLD.pack(
+            flags, ts, ts_offset or 0, resolved, resolved_offset or 0,
+            len(event_id_b), len(reason_b), len(action_b), len(payload_b)
+        ),
+        event_id_b, reason_b, action_b, payload_b
+    ))
+    return _frame(KIND_HOLD_EVENT, body)
+
+
+def decode_hold_event(body: Buffer) -> Tuple[Any, ...]:
+    """EpistemicHoldEvent fields, in constructor order, from a hold body."""
+    (flags, ts, ts_offset, resolved, resolved_offset,
+     n_id, n_reason, n_action, n_payload) = _HOLD.unpack_from(body)
+    pos = _HOLD.size
+    event_id = body[pos:pos + n_id].decode('utf-8')
+    pos += n_id
+    trigger_reason = body[pos:pos + n_reason].decode('utf-8')
+    pos += n_reason
+    resolution_action = (
+        body[pos:pos + n_action].decode('utf-8')
+        if flags & _HOLD_ACTION else None
+    )
+    pos += n_action
+    data_inputs, model_outputs, signal_conflicts, uncertainty_metrics = (
+        _decode_json(body[pos:pos + n_payload].decode('utf-8'))
+    )
+    resolution_timestamp = (
+        us_to_datetime(
+            resolved,
+            resolved_offset if flags & _HOLD_RESOLVED_AWARE else None
+        )
+        if flags & _HOLD_RESOLVED_AT else None
+    )
+    return (
+        event_id, trigger_reason, data_inputs, model_outputs,
+        signal_conflicts, uncertainty_metrics, resolution_action,
+        resolution_timestamp,
+        us_to_datetime(ts, ts_offset if flags & _HOLD_AWARE else None)
+    )
+
+
+# -- framing ----------------------------------------------------------------
+
+def unframe(data: Buffer) -> Tuple[int, bytes]:
+    """(kind, body) of a buffer holding exactly one record."""
+    kind, length = _read_header(data)
+    if len(data) != HEADER_SIZE + length:
+        raise ValueError(
+            f"TL record length mismatch: header says {length} body bytes, "
+            f"buffer has {len(data) - HEADER_SIZE}"
+        )
+    return kind, bytes(data[HEADER_SIZE:])
+
+
+def iter_frames(source: Union[Buffer, BinaryIO]) -> Iterator[Tuple[int, bytes]]:
+    """Yield (kind, body) for each record in a buffer or binary file."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+        pos = 0
+        while pos < len(data):
+            kind, length = _read_header(data, pos)
+            start = pos + HEADER_SIZE
+            if start + length > len(data):
+                raise ValueError("Truncated TL record body")
+            yield kind, data[start:start + length]
+            pos = start + length
+        return
+    while True:
+        header = source.read(HEADER_SIZE)
+        if not header:
+            return
+        kind, length = _read_header(header)
+        body = source.read(length)
+        if len(body) != length:
+            raise ValueError("Truncated TL record body")
+        yield kind, body
@@ -0,0 +1,202 @@
+"""
+Thread-safe TLEngine with per-thread decision shards.
+
+TLEngine appends to shared lists and updates shared counters without
+synchronization, which is only safe from a single thread. ConcurrentTLEngine
+gives every calling thread its own shard (decision buffer, hold buffer and
+running totals, guarded by an uncontended per-shard lock) and merges the
+shards when the logs or statistics are read. Hold registration and
+resolution go through one registry lock, so a hold can be resolved from any
+thread exactly once.
+
+Because shards never contend on the evaluate path, throughput scales with
+threads on free-threaded CPython builds; on GIL builds the engine is still
+safe and loses no decisions.
+
+Usage:
+    >>> from ternary_logic import ConcurrentTLEngine
+    >>> engine = ConcurrentTLEngine(
+    ...     proceed_threshold=YOUR_INSTITUTION_PROCEED_THRESHOLD,
+    ...     hold_threshold=YOUR_INSTITUTION_HOLD_THRESHOLD
+    ... )
+    >>> # engine.evaluate(...) may now be called from a thread pool
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .core import (
+    EpistemicHoldEvent,
+    TLBatchResult,
+    TLEngine,
+    TLState,
+    TLValue,
+)
+from .retention import RetentionPolicy
+
+# Batch offsets are namespaced per shard so hold event ids never collide.
+_SHARD_OFFSET_STRIDE = 1 << 40
+
+
+class _Shard:
+    """Decisions, holds and running totals owned by one thread."""
+
+    __slots__ = (
+        'shard_id', 'lock', 'decisions', 'decision_seqs',
+        'holds', 'hold_seqs', 'counts', 'confidence_sum'
+    )
+
+    def __init__(self, shard_id: int):
+        self.shard_id = shard_id
+        self.lock = threading.Lock()
+        self.decisions: List[Any] = []
+        self.decision_seqs: List[int] = []
+        self.holds: List[EpistemicHoldEvent] = []
+        self.hold_seqs: List[int] = []
+        self.counts: Dict[TLState, int] = {state: 0 for state in TLState}
+        self.confidence_sum = 0.0
+
+
+class ConcurrentTLEngine(TLEngine):
+    """TLEngine that may be called from many threads at once.
+
+    Takes the same arguments as TLEngine except decision_log and
+    retention: decisions are kept in per-thread shards. decision_log and
+    epistemic_holds are read-only merged snapshots, ordered by the
+    monotonic clock reading taken when each record was stored.
+    """
+
+    def _init_logs(
+        self,
+        decision_log: Optional[Any],
+        retention: Optional[RetentionPolicy]
+    ):
+        if decision_log is not None or retention is not None:
+            raise ValueError(
+                "ConcurrentTLEngine keeps per-thread decision shards; "
+                "decision_log and retention are not supported."
+            )
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._shards_lock = threading.Lock()
+        self._shard_ids = itertools.count()
+        self._hold_lock = threading.RLock()
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            with self._shards_lock:
+                shard = _Shard(next(self._shard_ids))
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    # -- writes -----------------------------------------------------------
+
+    def _record_decision(self, value: TLValue):
+        shard = self._shard()
+        with shard.lock:
+            shard.decisions.append(value)
+            shard.decision_seqs.append(time.perf_counter_ns())
+            shard.counts[value.state] += 1
+            shard.confidence_sum += value.confidence
+        if self._audit_listeners:
+            self._notify('decision', value)
+
+    def _append_batch(self, result: TLBatchResult) -> int:
+        shard = self._shard()
+        values = list(result)
+        counts = result.counts()
+        with shard.lock:
+            offset = (
+                shard.shard_id * _SHARD_OFFSET_STRIDE + len(shard.decisions)
+            )
+            shard.decisions.extend(values)
+            shard.decision_seqs.extend(
+                itertools.repeat(time.perf_counter_ns(), len(values))
+            )
+            shard.counts[TLState.PROCEED] += counts['proceed_count']
+            shard.counts[TLState.EPISTEMIC_HOLD] += counts['hold_count']
+            shard.counts[TLState.REFUSE] += counts['refuse_count']
+            shard.confidence_sum += float(result.confidences.sum())
+        if self._audit_listeners:
+            for value in values:
+                self._notify('decision', value)
+        return offset
+
+    def _record_hold(self, event: EpistemicHoldEvent):
+        shard = self._shard()
+        with shard.lock:
+            shard.holds.append(event)
+            shard.hold_seqs.append(time.perf_counter_ns())
+        with self._hold_lock:
+            self.hold_registry.add(event)
+        if self.hold_store is not None:
+            self.hold_store.add(event)
+        if self._audit_listeners:
+            self._notify('epistemic_hold', event)
+
+    def resolve_hold(self, event_id: str, action: str):
+        """Resolve an Epistemic Hold with documented action (thread-safe)."""
+        with self._hold_lock:
+            super().resolve_hold(event_id, action)
+
+    def _release_hold(self, event: EpistemicHoldEvent):
+        # Shards keep every hold (no retention log to release from), and
+        # epistemic_holds here is a merged copy: never build it per resolve.
+        pass
+
+    # -- reads ------------------------------------------------------------
+
+    def _counter_snapshot(self) -> Tuple[Dict[TLState, int], float]:
+        counts = {state: 0 for state in TLState}
+        confidence_sum = 0.0
+        for shard in list(self._shards):
+            with shard.lock:
+                for state, count in shard.counts.items():
+                    counts[state] += count
+                confidence_sum += shard.confidence_sum
+        return counts, confidence_sum
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._hold_lock:
+            return super().get_statistics()
+
+    def oldest_unresolved_hold(self) -> Optional[EpistemicHoldEvent]:
+        with self._hold_lock:
+            return super().oldest_unresolved_hold()
+
+    def next_hold_to_review(self) -> Optional[EpistemicHoldEvent]:
+        with self._hold_lock:
+            return super().next_hold_to_review()
+
+    def _merged(self, records: str, seqs: str) -> List[Any]:
+        snapshots = []
+        for shard in list(self._shards):
+            with shard.lock:
+                snapshots.append(
+                    list(zip(getattr(shard, seqs), getattr(shard, records)))
+                )
+        return [
+            record for _, record in
+            heapq.merge(*snapshots, key=lambda entry: entry[0])
+        ]
+
+    @property
+    def decision_log(self) -> List[TLValue]:
+        """All decisions from every thread, merged in time order."""
+        return self._merged('decisions', 'decision_seqs')
+
+    @property
+    def epistemic_holds(self) -> List[EpistemicHoldEvent]:
+        """All hold records from every thread, merged in time order."""
+        return self._merged('holds', 'hold_seqs')
+
+    @property
+    def shard_count(self) -> int:
+        """Number of threads that have recorded decisions."""
+        return len(self._shards)
@@ -50,14 +50,61 @@ Repository: https://github.com/FractonicMind/TernaryLogic
 """
 
 from enum import Enum
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable
-from datetime import datetime
+from dataclasses import dataclass, field, FrozenInstanceError
+from typing import Dict, Iterator, List, Optional, Any, Callable, Sequence, Union
+from datetime import datetime, timedelta
 import json
 import hashlib
+import functools
+import inspect
+import itertools
 import logging
+import math
+import sys
+import threading
+import time
+
+import numpy as np
+
+if __name__ == "__main__" and not __package__:
+    # Executed directly (python src/core.py): the relative imports below
+    # need a parent package, so re-run this module as part of src.
+    import os
+    import runpy
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    runpy.run_module('src.core', run_name='__main__', alter_sys=True)
+    sys.exit(0)
+
+from .codec import (
+    KIND_COMPACT_TL_VALUE,
+    KIND_FROZEN_TL_VALUE,
+    KIND_HOLD_EVENT,
+    KIND_TL_VALUE,
+    datetime_to_us,
+    decode_hold_event,
+    decode_value,
+    encode_hold_event,
+    encode_value,
+    iter_frames,
+    unframe,
+    us_to_datetime,
+)
+from .decision_cache import DecisionCache, make_key
+from .decision_logging import make_decision_logger
+from .holds import HoldRegistry
+from .mandates import DEFAULT_MANDATES, Mandate, MandateRegistry
+from .monitoring import HoldRateMonitor
+from .retention import RetentionPolicy, SegmentedLog
+from .thresholds import (
+    ProfileStatistics,
+    ThresholdProfileTable,
+    ThresholdVersion,
+    classify_codes,
+    validate_thresholds,
+)
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -79,12 +126,16 @@ class TLValue:
         reasoning: Human-readable explanation
         metadata: Additional context data
         timestamp: When this value was created
+        profile: Threshold profile that produced the state, if any
+        threshold_epoch: Engine threshold version that produced the state
     """
     state: TLState
     confidence: float
     reasoning: str
     metadata: Dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    profile: Optional[str] = None
+    threshold_epoch: int = 0
 
     def __post_init__(self):
         if not 0.0 <= self.confidence <= 1.0:
@@ -108,19 +159,211 @@ class TLValue:
             return "below_hold_threshold"
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data = {
             'state': self.state.name,
             'state_value': self.state.value,
             'confidence': self.confidence,
             'position': self.position_label,
             'reasoning': self.reasoning,
             'metadata': self.metadata,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': self.timestamp.isoformat(),
+            'threshold_epoch': self.threshold_epoch
         }
+        if self.profile is not None:
+            data['profile'] = self.profile
+        return data
 
     def to_json(self) -> str:
         return json.dumps(self.to_dict(), indent=2)
 
+    def to_bytes(self) -> bytes:
+        """Compact binary encoding; see codec.py."""
+        timestamp, utc_offset = datetime_to_us(self.timestamp)
+        return encode_value(
+            KIND_TL_VALUE, self.state.value, self.confidence, self.reasoning,
+            self.metadata, timestamp, utc_offset, self.profile,
+            self.threshold_epoch
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'TLValue':
+        """Decode a record written by to_bytes()."""
+        return _decode_as(cls, data)
+
+    @classmethod
+    def _from_body(cls, body: bytes) -> 'TLValue':
+        (state_value, confidence, reasoning, metadata, timestamp,
+         utc_offset, profile, epoch) = decode_value(body)
+        return cls(
+            _STATES_BY_CODE[state_value], confidence, reasoning,
+            metadata if metadata is not None else {},
+            us_to_datetime(timestamp, utc_offset), profile, epoch
+        )
+
+
+# Wall-clock anchor for monotonic nanosecond timestamps: one time_ns()
+# reading at import, advanced by perf_counter_ns() afterwards.
+_WALL_ANCHOR_NS = time.time_ns()
+_PERF_ANCHOR_NS = time.perf_counter_ns()
+_CLOCK_OFFSET_NS = _WALL_ANCHOR_NS - _PERF_ANCHOR_NS
+_perf_counter_ns = time.perf_counter_ns
+_EPOCH = datetime(1970, 1, 1)
+
+
+def monotonic_time_ns() -> int:
+    """Nanoseconds since the Unix epoch that never go backwards."""
+    return _perf_counter_ns() + _CLOCK_OFFSET_NS
+
+
+class CompactTLValue:
+    """
+    Slotted Ternary Logic value for hot paths.
+
+    Carries the same information as TLValue with less per-instance cost:
+    no __dict__, an integer nanosecond timestamp from a monotonic clock,
+    and no metadata dict unless one is given or first accessed. The
+    datetime and ISO strings are only built by the timestamp property and
+    by to_dict()/to_json().
+
+    Attributes:
+        state: The TL state (PROCEED/EPISTEMIC_HOLD/REFUSE)
+        confidence: Confidence score [0.0, 1.0]
+        reasoning: Human-readable explanation
+        metadata: Additional context data
+        timestamp_ns: Creation time, nanoseconds since the Unix epoch (UTC)
+        profile: Threshold profile that produced the state, if any
+        threshold_epoch: Engine threshold version that produced the state
+    """
+
+    __slots__ = (
+        'state', 'confidence', 'reasoning', '_metadata', 'timestamp_ns',
+        'profile', 'threshold_epoch'
+    )
+
+    def __init__(
+        self,
+        state: TLState,
+        confidence: float,
+        reasoning: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp_ns: Optional[int] = None,
+        profile: Optional[str] = None,
+        threshold_epoch: int = 0
+    ):
+        if not 0.0 <= confidence <= 1.0:
+            raise ValueError(
+                f"Confidence must be in [0.0, 1.0], got {confidence}"
+            )
+        self.state = state
+        self.confidence = confidence
+        self.reasoning = reasoning
+        self._metadata = metadata
+        self.timestamp_ns = (
+            timestamp_ns if timestamp_ns is not None
+            else _perf_counter_ns() + _CLOCK_OFFSET_NS
+        )
+        self.profile = profile
+        self.threshold_epoch = threshold_epoch
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        if self._metadata is None:
+            object.__setattr__(self, '_metadata', {})
+        return self._metadata
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a naive UTC datetime (microsecond precision)."""
+        return _EPOCH + timedelta(microseconds=self.timestamp_ns // 1000)
+
+    position_label = TLValue.position_label
+    to_dict = TLValue.to_dict
+    to_json = TLValue.to_json
+
+    def to_bytes(self) -> bytes:
+        """Compact binary encoding, keeping the nanosecond timestamp."""
+        return encode_value(
+            KIND_FROZEN_TL_VALUE if isinstance(self, FrozenTLValue)
+            else KIND_COMPACT_TL_VALUE,
+            self.state.value, self.confidence, self.reasoning,
+            self._metadata, self.timestamp_ns, None, self.profile,
+            self.threshold_epoch
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CompactTLValue':
+        """Decode a record written by to_bytes()."""
+        return _decode_as(cls, data)
+
+    @classmethod
+    def _from_body(cls, body: bytes) -> 'CompactTLValue':
+        (state_value, confidence, reasoning, metadata, timestamp,
+         _, profile, epoch) = decode_value(body)
+        return cls(
+            _STATES_BY_CODE[state_value], confidence, reasoning, metadata,
+            timestamp, profile, epoch
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactTLValue):
+            return NotImplemented
+        return (
+            self.state == other.state
+            and self.confidence == other.confidence
+            and self.reasoning == other.reasoning
+            and (self._metadata or {}) == (other._metadata or {})
+            and self.timestamp_ns == other.timestamp_ns
+            and self.profile == other.profile
+            and self.threshold_epoch == other.threshold_epoch
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(state={self.state}, "
+            f"confidence={self.confidence!r}, reasoning={self.reasoning!r}, "
+            f"metadata={self._metadata!r}, timestamp_ns={self.timestamp_ns}, "
+            f"profile={self.profile!r}, threshold_epoch={self.threshold_epoch})"
+        )
+
+
+class FrozenTLValue(CompactTLValue):
+    """Immutable CompactTLValue; attribute assignment raises."""
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        state: TLState,
+        confidence: float,
+        reasoning: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp_ns: Optional[int] = None,
+        profile: Optional[str] = None,
+        threshold_epoch: int = 0
+    ):
+        if not 0.0 <= confidence <= 1.0:
+            raise ValueError(
+                f"Confidence must be in [0.0, 1.0], got {confidence}"
+            )
+        _set = object.__setattr__
+        _set(self, 'state', state)
+        _set(self, 'confidence', confidence)
+        _set(self, 'reasoning', reasoning)
+        _set(self, '_metadata', metadata)
+        _set(self, 'timestamp_ns', (
+            timestamp_ns if timestamp_ns is not None else monotonic_time_ns()
+        ))
+        _set(self, 'profile', profile)
+        _set(self, 'threshold_epoch', threshold_epoch)
+
+    def __setattr__(self, name: str, value: Any):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
 
 @dataclass
 class EpistemicHoldEvent:
@@ -161,6 +404,196 @@ class EpistemicHoldEvent:
             'timestamp': self.timestamp.isoformat()
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EpistemicHoldEvent':
+        """Rebuild an event from its to_dict() form."""
+        resolved_at = data.get('resolution_timestamp')
+        return cls(
+            event_id=data['event_id'],
+            trigger_reason=data['trigger_reason'],
+            data_inputs=data['data_inputs'],
+            model_outputs=data['model_outputs'],
+            signal_conflicts=data['signal_conflicts'],
+            uncertainty_metrics=data['uncertainty_metrics'],
+            resolution_action=data.get('resolution_action'),
+            resolution_timestamp=(
+                datetime.fromisoformat(resolved_at) if resolved_at else None
+            ),
+            timestamp=datetime.fromisoformat(data['timestamp'])
+        )
+
+    def to_bytes(self) -> bytes:
+        """Compact binary encoding; see codec.py."""
+        return encode_hold_event(
+            self.event_id, self.trigger_reason, self.data_inputs,
+            self.model_outputs, self.signal_conflicts,
+            self.uncertainty_metrics, self.resolution_action,
+            self.resolution_timestamp, self.timestamp
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'EpistemicHoldEvent':
+        """Decode a record written by to_bytes()."""
+        return _decode_as(cls, data)
+
+    @classmethod
+    def _from_body(cls, body: bytes) -> 'EpistemicHoldEvent':
+        return cls(*decode_hold_event(body))
+
+
+_RECORD_TYPES = {
+    KIND_TL_VALUE: TLValue,
+    KIND_COMPACT_TL_VALUE: CompactTLValue,
+    KIND_FROZEN_TL_VALUE: FrozenTLValue,
+    KIND_HOLD_EVENT: EpistemicHoldEvent,
+}
+
+
+def _decode_body(kind: int, body: bytes) -> Any:
+    record_type = _RECORD_TYPES.get(kind)
+    if record_type is None:
+        raise ValueError(f"Unknown TL record kind: {kind}")
+    return record_type._from_body(body)
+
+
+def _decode_as(cls: type, data: bytes) -> Any:
+    record = decode_record(data)
+    if not isinstance(record, cls):
+        raise ValueError(
+            f"Record is a {type(record).__name__}, not a {cls.__name__}"
+        )
+    return record
+
+
+def decode_record(data: bytes) -> Any:
+    """Decode one binary record (any to_bytes() output).
+
+    Raises:
+        ValueError: If data is not exactly one record of a supported
+                    format version.
+    """
+    return _decode_body(*unframe(data))
+
+
+def iter_decode_records(source: Any) -> Iterator[Any]:
+    """Decode concatenated binary records from a buffer or binary file."""
+    for kind, body in iter_frames(source):
+        yield _decode_body(kind, body)
+
+
+# Sentinel code for "no forced state" in integer force_states arrays.
+UNFORCED = -128
+
+_STATES_BY_CODE = {state.value: state for state in TLState}
+
+
+class TLBatchResult:
+    """Lightweight view over a batch of TL decisions.
+
+    Wraps the int8 state codes and confidences produced by
+    TLEngine.evaluate_batch. TLValue objects are only built when an
+    individual decision is indexed, so large batches stay array-backed.
+    """
+
+    __slots__ = (
+        'states', 'confidences', 'reasonings', 'metadata', 'timestamp',
+        'profiles', 'threshold_epoch'
+    )
+
+    def __init__(
+        self,
+        states: np.ndarray,
+        confidences: np.ndarray,
+        reasonings: Sequence[str],
+        metadata: Sequence[Dict[str, Any]],
+        timestamp: datetime,
+        profiles: Optional[Sequence[Optional[str]]] = None,
+        threshold_epoch: int = 0
+    ):
+        self.states = states
+        self.confidences = confidences
+        self.reasonings = reasonings
+        self.metadata = metadata
+        self.timestamp = timestamp
+        self.profiles = (
+            profiles if profiles is not None else _Broadcast(None, len(states))
+        )
+        self.threshold_epoch = threshold_epoch
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __getitem__(self, index: int) -> TLValue:
+        return TLValue(
+            state=self.state_at(index),
+            confidence=float(self.confidences[index]),
+            reasoning=self.reasonings[index],
+            metadata=self.metadata[index] or {},
+            timestamp=self.timestamp,
+            profile=self.profiles[index],
+            threshold_epoch=self.threshold_epoch
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def state_at(self, index: int) -> TLState:
+        """Return the TLState of a single decision without building a TLValue."""
+        return _STATES_BY_CODE[int(self.states[index])]
+
+    def counts(self) -> Dict[str, int]:
+        """Count decisions per state."""
+        return {
+            'proceed_count': int(np.count_nonzero(self.states == 1)),
+            'hold_count': int(np.count_nonzero(self.states == 0)),
+            'refuse_count': int(np.count_nonzero(self.states == -1))
+        }
+
+
+class _Broadcast:
+    """Read-only sequence repeating one value, used for shared batch fields."""
+
+    __slots__ = ('value', 'length')
+
+    def __init__(self, value: Any, length: int):
+        self.value = value
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> Any:
+        if not -self.length <= index < self.length:
+            raise IndexError(index)
+        return self.value
+
+
+def _coerce_force_states(
+    force_states: Union[np.ndarray, Sequence[Optional[TLState]]],
+    n: int
+) -> np.ndarray:
+    """Normalize force_states to an int8 array using UNFORCED for gaps."""
+    arr = np.asarray(force_states)
+    if arr.dtype.kind in 'iu':
+        codes = arr.astype(np.int8)
+    else:
+        codes = np.fromiter(
+            (UNFORCED if f is None else f.value for f in force_states),
+            dtype=np.int8,
+            count=len(force_states)
+        )
+    if codes.shape != (n,):
+        raise ValueError(
+            f"force_states must have one entry per confidence "
+            f"({n}), got shape {codes.shape}"
+        )
+    valid = (codes == UNFORCED) | ((codes >= -1) & (codes <= 1))
+    if not valid.all():
+        bad = codes[~valid][0]
+        raise ValueError(f"Invalid forced state code: {bad}")
+    return codes
+
 
 class TLEngine:
     """Core Ternary Logic decision engine for economic intelligence.
@@ -173,13 +606,26 @@ class TLEngine:
 
     See docs/Threshold_Calibration.md for calibration methodology.
     See ThresholdProfile schema in the API spec for governance requirements.
+
+    Recalibrated thresholds are applied to a live engine with
+    update_thresholds(). Each change publishes a new ThresholdVersion;
+    every decision records the epoch of the version it was evaluated
+    under, and a batch is evaluated entirely under one version.
     """
 
     def __init__(
         self,
         proceed_threshold: Optional[float] = None,
         hold_threshold: Optional[float] = None,
-        epistemic_hold_rate_target: float = 0.20
+        epistemic_hold_rate_target: float = 0.20,
+        decision_log: Optional[Any] = None,
+        retention: Optional[RetentionPolicy] = None,
+        log_mode: str = 'all',
+        log_sample_rate: int = 100,
+        value_class: type = TLValue,
+        profiles: Optional[ThresholdProfileTable] = None,
+        monitor: Optional[HoldRateMonitor] = None,
+        hold_store: Optional[Any] = None
     ):
         """
         Initialize TL Engine with institutionally calibrated thresholds.
@@ -197,53 +643,114 @@ class TLEngine:
                                Default 0.20 (20%). Studies indicate 15-25% is
                                optimal. Monitor and report; recalibrate
                                thresholds if consistently outside this range.
+            decision_log:      Optional list-like store for decisions, e.g.
+                               decision_log.ColumnarDecisionLog for a compact
+                               array-backed log. Default: a plain list.
+            retention:         Optional RetentionPolicy. Keeps only a recent
+                               window of decisions and hold records in memory
+                               and seals older ones into on-disk segments.
+                               Cannot be combined with decision_log.
+            log_mode:          Per-decision log lines: 'all' (default),
+                               'off', 'sampled' or 'queued'. See
+                               decision_logging for the trade-offs. The
+                               audit trail is recorded in every mode.
+            log_sample_rate:   With log_mode='sampled', log one in this many
+                               decisions and holds.
+            value_class:       Type of the values evaluate() returns: TLValue
+                               (default), or CompactTLValue / FrozenTLValue
+                               for slotted values with lazy timestamps.
+            profiles:          Optional ThresholdProfileTable. Decisions
+                               evaluated with a profile id use that
+                               profile's thresholds; others use the two
+                               thresholds above.
+            monitor:           Optional HoldRateMonitor fed with every
+                               recorded decision, for rolling 1m/5m/1h
+                               and EWMA rates next to the lifetime rate.
+            hold_store:        Optional durable hold store, e.g.
+                               hold_store.SQLiteHoldStore. New holds and
+                               resolutions are written through to it
+                               asynchronously, and holds it has left
+                               unresolved are restored at construction.
 
         Raises:
             ValueError: If proceed_threshold or hold_threshold is None,
                         or if thresholds do not satisfy the ordering constraint.
         """
-        if proceed_threshold is None:
-            raise ValueError(
-                "proceed_threshold is required and has no default value. "
-                "This threshold must be calibrated by your institution through "
-                "historical backtesting, regulatory requirements, and "
-                "board-approved risk appetite. "
-                "No universal value is appropriate for all systems. "
-                "See docs/Threshold_Calibration.md for calibration methodology."
-            )
-        if hold_threshold is None:
-            raise ValueError(
-                "hold_threshold is required and has no default value. "
-                "This threshold must be calibrated by your institution through "
-                "historical backtesting, regulatory requirements, and "
-                "board-approved risk appetite. "
-                "No universal value is appropriate for all systems. "
-                "See docs/Threshold_Calibration.md for calibration methodology."
-            )
-        if not 0.0 < hold_threshold < proceed_threshold < 1.0:
+        validate_thresholds(proceed_threshold, hold_threshold)
+
+        if value_class is not TLValue and not (
+            isinstance(value_class, type)
+            and issubclass(value_class, CompactTLValue)
+        ):
             raise ValueError(
-                f"Thresholds must satisfy: 0.0 < hold_threshold < "
-                f"proceed_threshold < 1.0. "
-                f"Got hold_threshold={hold_threshold}, "
-                f"proceed_threshold={proceed_threshold}."
+                f"value_class must be TLValue or a CompactTLValue subclass, "
+                f"got {value_class!r}"
             )
 
-        self.proceed_threshold = proceed_threshold
-        self.hold_threshold = hold_threshold
         self.epistemic_hold_rate_target = epistemic_hold_rate_target
-        self.epistemic_holds: List[EpistemicHoldEvent] = []
-        self.decision_log: List[TLValue] = []
+        self.value_class = value_class
+        self.profiles = profiles
+        self.profile_statistics = ProfileStatistics()
+        self.monitor = monitor
+        self._threshold_lock = threading.Lock()
+        self._thresholds = ThresholdVersion(
+            0, proceed_threshold, hold_threshold,
+            profiles.snapshot() if profiles is not None else None
+        )
+        self.threshold_history: List[ThresholdVersion] = [self._thresholds]
+        self.hold_registry = HoldRegistry()
+        self._init_logs(decision_log, retention)
+        # Running totals so statistics never rescan the logs.
+        self._state_counts: Dict[TLState, int] = {state: 0 for state in TLState}
+        self._confidence_sum = 0.0
+        self._audit_listeners: List[Callable[[str, Any], None]] = []
+        self._decision_logger = make_decision_logger(
+            log_mode, logger, log_sample_rate
+        )
+        self.hold_store = None
+        if hold_store is not None:
+            self._restore_holds(hold_store)
+            self.hold_store = hold_store
         logger.info(
             f"TL Engine initialized with institution-calibrated thresholds: "
             f"PROCEED >= {proceed_threshold}, REFUSE < {hold_threshold}"
         )
 
+    def _init_logs(
+        self,
+        decision_log: Optional[Any],
+        retention: Optional[RetentionPolicy]
+    ):
+        """Create the decision log and hold record stores."""
+        if retention is not None and decision_log is not None:
+            raise ValueError(
+                "retention and decision_log cannot be combined; "
+                "retention provides its own segmented decision log."
+            )
+        if retention is not None:
+            self.decision_log = SegmentedLog(
+                retention, 'decisions', decode=_decode_body
+            )
+            # Unresolved holds stay reachable until resolved, then spill.
+            self.epistemic_holds = SegmentedLog(
+                retention, 'holds',
+                retain=lambda e: not e.resolution_action,
+                on_spill=lambda e: self.hold_registry.discard(e.event_id),
+                decode=_decode_body
+            )
+        else:
+            self.decision_log: List[TLValue] = (
+                decision_log if decision_log is not None else []
+            )
+            self.epistemic_holds: List[EpistemicHoldEvent] = []
+
     def evaluate(
         self,
         confidence: float,
         reasoning: str,
         metadata: Optional[Dict[str, Any]] = None,
-        force_state: Optional[TLState] = None
+        force_state: Optional[TLState] = None,
+        profile: Optional[str] = None
     ) -> TLValue:
         """
         Evaluate economic conditions and return TL state.
@@ -258,35 +765,247 @@ class TLEngine:
         confidence=0.0 to override this determination entirely. Even
         a confidence of 1.0 does not prevent an Epistemic Hold if a
         mandate check fails.
+
+        With profile, the thresholds of that entry in the engine's
+        ThresholdProfileTable are used instead of the engine's own, and
+        the profile id is recorded on the decision.
         """
+        if profile is None:
+            version = self._thresholds
+            proceed_threshold = version.proceed_threshold
+            hold_threshold = version.hold_threshold
+        else:
+            version = self._profile_version()
+            proceed_threshold, hold_threshold = version.profile_thresholds(
+                profile
+            )
+
         if force_state:
             state = force_state
         else:
-            if confidence >= self.proceed_threshold:
+            if confidence >= proceed_threshold:
                 state = TLState.PROCEED
-            elif confidence < self.hold_threshold:
+            elif confidence < hold_threshold:
                 state = TLState.REFUSE
             else:
                 state = TLState.EPISTEMIC_HOLD
 
-        value = TLValue(
-            state=state,
-            confidence=confidence,
-            reasoning=reasoning,
-            metadata=metadata or {}
-        )
-        self.decision_log.append(value)
+        if self.value_class is TLValue:
+            value = TLValue(
+                state=state,
+                confidence=confidence,
+                reasoning=reasoning,
+                metadata=metadata or {},
+                profile=profile,
+                threshold_epoch=version.epoch
+            )
+        else:
+            value = self.value_class(
+                state, confidence, reasoning, metadata,
+                profile=profile, threshold_epoch=version.epoch
+            )
+        self._record_decision(value)
+        if profile is not None:
+            self.profile_statistics.record(profile, state.value, confidence)
+        if self.monitor is not None:
+            self.monitor.record(state.value)
 
         if state == TLState.EPISTEMIC_HOLD:
-            self._log_epistemic_hold(value)
+            self._log_epistemic_hold(value, proceed_threshold=proceed_threshold)
 
-        logger.info(f"TL Decision: {state.name} (confidence: {confidence:.3f})")
+        self._decision_logger.decision(state.name, confidence)
         return value
 
-    def _log_epistemic_hold(self, value: TLValue):
-        """Create audit record for Epistemic Hold event."""
+    def evaluate_batch(
+        self,
+        confidences: Union[np.ndarray, Sequence[float]],
+        reasonings: Optional[Union[str, Sequence[str]]] = None,
+        metadata: Optional[
+            Union[Dict[str, Any], Sequence[Dict[str, Any]]]
+        ] = None,
+        force_states: Optional[
+            Union[np.ndarray, Sequence[Optional[TLState]]]
+        ] = None,
+        record: bool = True,
+        return_view: bool = False,
+        profiles: Optional[Union[str, Sequence[str], np.ndarray]] = None
+    ) -> Union[np.ndarray, TLBatchResult]:
+        """
+        Evaluate many confidence scores at once.
+
+        State determination is identical to evaluate(), computed with
+        array comparisons against the engine thresholds. Forced states
+        take priority over confidence, exactly as force_state does.
+
+        Args:
+            confidences: 1-D array of confidence scores in [0.0, 1.0].
+            reasonings:  One reasoning string shared by the batch, or one
+                         per decision. Defaults to "Batch evaluation".
+            metadata:    One metadata dict shared by the batch, or one per
+                         decision.
+            force_states: Per-decision forced states, either a sequence of
+                         Optional[TLState] or an integer array of state
+                         values where UNFORCED marks "not forced".
+            record:      Append the decisions to decision_log and create
+                         Epistemic Hold records, as evaluate() does. Pass
+                         False for pure classification (e.g. replays).
+            return_view: Return a TLBatchResult instead of the bare array.
+            profiles:    One threshold profile id for the whole batch, or
+                         one per decision. Each decision is classified
+                         against its profile's thresholds.
+
+        Returns:
+            int8 array of state values (+1/0/-1), or a TLBatchResult.
+
+        Raises:
+            ValueError: If any confidence is outside [0.0, 1.0], the
+                        per-decision inputs do not match the batch length,
+                        or a profile id is unknown.
+        """
+        conf = np.asarray(confidences, dtype=np.float64)
+        if conf.ndim != 1:
+            raise ValueError(
+                f"confidences must be 1-D, got shape {conf.shape}"
+            )
+        n = conf.shape[0]
+        in_range = (conf >= 0.0) & (conf <= 1.0)
+        if not in_range.all():
+            bad = conf[~in_range][0]
+            raise ValueError(f"Confidence must be in [0.0, 1.0], got {bad}")
+
+        # One version for the whole batch, even if thresholds change
+        # while it is being evaluated.
+        profile_codes = None
+        if profiles is None:
+            version = self._thresholds
+            proceed = version.proceed_threshold
+            states = np.zeros(n, dtype=np.int8)
+            states[conf >= proceed] = TLState.PROCEED.value
+            states[conf < version.hold_threshold] = TLState.REFUSE.value
+        else:
+            table = self.profiles
+            version = self._profile_version()
+            snapshot = version.profiles
+            if isinstance(profiles, str):
+                profile_codes = np.full(
+                    n, table.codes([profiles], snapshot)[0], dtype=np.int32
+                )
+                profiles = _Broadcast(profiles, n)
+            else:
+                if len(profiles) != n:
+                    raise ValueError(
+                        f"profiles must have one entry per confidence "
+                        f"({n}), got {len(profiles)}"
+                    )
+                profile_codes = table.codes(profiles, snapshot)
+            states = classify_codes(conf, profile_codes, snapshot)
+            proceed = snapshot[1][profile_codes]
+        if force_states is not None:
+            forced = _coerce_force_states(force_states, n)
+            mask = forced != UNFORCED
+            states[mask] = forced[mask]
+
+        if reasonings is None:
+            reasonings = "Batch evaluation"
+        if isinstance(reasonings, str):
+            reasonings = _Broadcast(reasonings, n)
+        if metadata is None or isinstance(metadata, dict):
+            metadata = _Broadcast(metadata, n)
+        for name, column in (('reasonings', reasonings), ('metadata', metadata)):
+            if len(column) != n:
+                raise ValueError(
+                    f"{name} must have one entry per confidence ({n}), "
+                    f"got {len(column)}"
+                )
+
+        result = TLBatchResult(
+            states, conf, reasonings, metadata, datetime.utcnow(), profiles,
+            version.epoch
+        )
+        if record:
+            self._record_batch(result, proceed)
+            if profile_codes is not None:
+                self.profile_statistics.record_batch(
+                    list(snapshot[0]), profile_codes, states, conf
+                )
+
+        logger.info(
+            "TL Batch: %d decisions (proceed=%d, hold=%d, refuse=%d)",
+            n, *result.counts().values()
+        )
+        return result if return_view else states
+
+    def _record_decision(self, value: TLValue):
+        """Append one decision to the log and update running totals."""
+        self.decision_log.append(value)
+        self._state_counts[value.state] += 1
+        self._confidence_sum += value.confidence
+        if self._audit_listeners:
+            self._notify('decision', value)
+
+    def _record_batch(
+        self,
+        result: TLBatchResult,
+        proceed_thresholds: Union[float, np.ndarray]
+    ):
+        """Append a batch to the decision log and audit its holds.
+
+        proceed_thresholds is the batch's proceed threshold, or one per
+        decision for profile batches.
+        """
+        per_decision = isinstance(proceed_thresholds, np.ndarray)
+        offset = self._append_batch(result)
+        if self.monitor is not None:
+            self.monitor.record_counts(*result.counts().values())
+        timestamp = result.timestamp.isoformat()
+        hold_indices = np.flatnonzero(
+            result.states == TLState.EPISTEMIC_HOLD.value
+        )
+        for i in hold_indices.tolist():
+            value = result[i]
+            hash_input = f"{timestamp}{value.reasoning}{offset + i}"
+            self._log_epistemic_hold(
+                value,
+                event_id=hashlib.sha256(hash_input.encode()).hexdigest()[:16],
+                proceed_threshold=(
+                    float(proceed_thresholds[i]) if per_decision
+                    else proceed_thresholds
+                )
+            )
+
+    def _append_batch(self, result: TLBatchResult) -> int:
+        """Append a batch and update totals; return its starting offset."""
+        offset = self.total_decisions
+        append_batch = getattr(self.decision_log, 'append_batch', None)
+        if append_batch is not None:
+            append_batch(result)
+        else:
+            self.decision_log.extend(result)
+        if self._audit_listeners:
+            for value in result:
+                self._notify('decision', value)
+        counts = result.counts()
+        self._state_counts[TLState.PROCEED] += counts['proceed_count']
+        self._state_counts[TLState.EPISTEMIC_HOLD] += counts['hold_count']
+        self._state_counts[TLState.REFUSE] += counts['refuse_count']
+        self._confidence_sum += float(result.confidences.sum())
+        return offset
+
+    def _log_epistemic_hold(
+        self,
+        value: TLValue,
+        event_id: str = "",
+        proceed_threshold: Optional[float] = None
+    ):
+        """Create audit record for Epistemic Hold event.
+
+        proceed_threshold is the threshold the decision was evaluated
+        against; it defaults to the engine's current one.
+        """
+        if proceed_threshold is None:
+            proceed_threshold = self.proceed_threshold
         event = EpistemicHoldEvent(
-            event_id="",
+            event_id=event_id,
             trigger_reason=value.reasoning,
             data_inputs=value.metadata.get('inputs', {}),
             model_outputs=value.metadata.get('outputs', {}),
@@ -294,34 +1013,268 @@ class TLEngine:
             uncertainty_metrics={
                 'confidence': value.confidence,
                 'distance_to_proceed': abs(
-                    value.confidence - self.proceed_threshold
+                    value.confidence - proceed_threshold
                 )
             }
         )
+        self._record_hold(event)
+        self._decision_logger.hold(event.event_id)
+
+    def _record_hold(self, event: EpistemicHoldEvent):
+        """Store and index a new Epistemic Hold record."""
         self.epistemic_holds.append(event)
-        logger.warning(f"EPISTEMIC HOLD triggered: {event.event_id}")
+        self.hold_registry.add(event)
+        if self.hold_store is not None:
+            self.hold_store.add(event)
+        if self._audit_listeners:
+            self._notify('epistemic_hold', event)
+
+    def _restore_holds(self, hold_store: Any):
+        """Reload holds a durable store has left unresolved."""
+        restored = 0
+        for record in hold_store.iter_unresolved():
+            self._record_hold(EpistemicHoldEvent.from_dict(record))
+            restored += 1
+        if restored:
+            logger.info(f"Restored {restored} unresolved Epistemic Holds")
 
     def resolve_hold(self, event_id: str, action: str):
         """Resolve an Epistemic Hold with documented action."""
-        for event in self.epistemic_holds:
-            if event.event_id == event_id:
-                event.resolve(action)
-                return
-        raise ValueError(f"Epistemic Hold event {event_id} not found")
+        if event_id not in self.hold_registry:
+            raise ValueError(f"Epistemic Hold event {event_id} not found")
+        event = self.hold_registry.resolve(event_id, action)
+        if event.resolution_action:
+            self._release_hold(event)
+        if self.hold_store is not None:
+            self.hold_store.resolve(event)
+        if self._audit_listeners:
+            self._notify('hold_resolution', event)
+
+    def _release_hold(self, event: EpistemicHoldEvent):
+        """Let a retention log drop a resolved hold it was keeping."""
+        release = getattr(self.epistemic_holds, 'release', None)
+        if release is not None:
+            release(event)
+
+    def add_audit_listener(self, listener: Callable[[str, Any], None]):
+        """Register a callable notified of every audit record.
+
+        The listener is called as listener(kind, record) where kind is
+        'decision' (record is a TLValue), 'epistemic_hold' or
+        'hold_resolution' (record is an EpistemicHoldEvent), or
+        'threshold_update' (record is a ThresholdVersion). Listeners run
+        synchronously on the evaluating thread and should only enqueue.
+        """
+        self._audit_listeners.append(listener)
+
+    def remove_audit_listener(self, listener: Callable[[str, Any], None]):
+        """Unregister a listener added with add_audit_listener."""
+        self._audit_listeners.remove(listener)
+
+    def close(self):
+        """Flush and stop background logging, if any.
+
+        Pending hold store writes are committed; the store itself stays
+        open and is closed by its owner.
+        """
+        self._decision_logger.close()
+        if self.hold_store is not None:
+            self.hold_store.flush()
+
+    def _notify(self, kind: str, record: Any):
+        for listener in self._audit_listeners:
+            listener(kind, record)
+
+    def _profile_table(self) -> ThresholdProfileTable:
+        if self.profiles is None:
+            raise ValueError(
+                "This engine has no ThresholdProfileTable; pass profiles= "
+                "to TLEngine to evaluate against threshold profiles."
+            )
+        return self.profiles
+
+    # -- threshold versions -------------------------------------------------
+
+    @property
+    def proceed_threshold(self) -> float:
+        """Current proceed threshold."""
+        return self._thresholds.proceed_threshold
+
+    @property
+    def hold_threshold(self) -> float:
+        """Current hold threshold."""
+        return self._thresholds.hold_threshold
+
+    @property
+    def thresholds(self) -> ThresholdVersion:
+        """The threshold version new decisions are evaluated under."""
+        return self._thresholds
+
+    @property
+    def threshold_epoch(self) -> int:
+        """Epoch of the current threshold version."""
+        return self._thresholds.epoch
+
+    def update_thresholds(
+        self,
+        proceed_threshold: Optional[float] = None,
+        hold_threshold: Optional[float] = None,
+        profiles: Optional[Dict[str, tuple]] = None
+    ) -> ThresholdVersion:
+        """Atomically replace thresholds on a live engine.
+
+        Validation is the same as at construction. Everything is
+        validated before anything changes; the new values then take
+        effect together as a new ThresholdVersion with the next epoch.
+        Statistics, logs and holds are kept.
+
+        Args:
+            proceed_threshold: New proceed threshold. Default: unchanged.
+            hold_threshold:    New hold threshold. Default: unchanged.
+            profiles:          Optional mapping of profile id to
+                               (proceed_threshold, hold_threshold) to add
+                               or recalibrate in the profile table.
+
+        Returns:
+            The published ThresholdVersion.
+
+        Raises:
+            ValueError: If the thresholds are invalid, or profiles are
+                        given and the engine has no profile table.
+        """
+        current = self._thresholds
+        if proceed_threshold is None:
+            proceed_threshold = current.proceed_threshold
+        if hold_threshold is None:
+            hold_threshold = current.hold_threshold
+        validate_thresholds(proceed_threshold, hold_threshold)
+        table = self._profile_table() if profiles else None
+        with self._threshold_lock:
+            if table is not None:
+                # Validates every profile before applying any.
+                table.update(profiles)
+            version = self._publish(proceed_threshold, hold_threshold)
+        logger.info(
+            f"TL thresholds updated to epoch {version.epoch}: "
+            f"PROCEED >= {proceed_threshold}, REFUSE < {hold_threshold}"
+        )
+        return version
+
+    def _publish(
+        self, proceed_threshold: float, hold_threshold: float
+    ) -> ThresholdVersion:
+        """Publish a new version; call with _threshold_lock held."""
+        version = ThresholdVersion(
+            self._thresholds.epoch + 1,
+            proceed_threshold,
+            hold_threshold,
+            self.profiles.snapshot() if self.profiles is not None else None
+        )
+        self.threshold_history.append(version)
+        self._thresholds = version
+        if self._audit_listeners:
+            self._notify('threshold_update', version)
+        return version
+
+    def _profile_version(self) -> ThresholdVersion:
+        """Current version, republished if the profile table changed.
+
+        Profiles recalibrated directly on the ThresholdProfileTable get
+        their own epoch the first time a decision uses them.
+        """
+        table = self._profile_table()
+        version = self._thresholds
+        if table.snapshot() is not version.profiles:
+            with self._threshold_lock:
+                version = self._thresholds
+                if table.snapshot() is not version.profiles:
+                    version = self._publish(
+                        version.proceed_threshold, version.hold_threshold
+                    )
+        return version
+
+    def get_profile_statistics(
+        self, profile: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Per-profile decision statistics from running counters.
+
+        Args:
+            profile: One profile id. Default: every profile in the
+                     engine's table, keyed by profile id.
+
+        Raises:
+            ValueError: If the engine has no profile table or the
+                        profile id is unknown.
+        """
+        table = self._profile_table()
+        if profile is not None:
+            thresholds = table.get(profile)
+            return {
+                **self.profile_statistics.summary(profile),
+                'proceed_threshold': thresholds.proceed_threshold,
+                'hold_threshold': thresholds.hold_threshold,
+            }
+        return {
+            profile_id: self.get_profile_statistics(profile_id)
+            for profile_id in table
+        }
+
+    def oldest_unresolved_hold(self) -> Optional[EpistemicHoldEvent]:
+        """Return the longest-waiting unresolved hold, or None."""
+        return self.hold_registry.oldest_unresolved()
+
+    def next_hold_to_review(self) -> Optional[EpistemicHoldEvent]:
+        """Return the unresolved hold closest to PROCEED, or None."""
+        return self.hold_registry.next_for_review()
+
+    def _counter_snapshot(self):
+        """Return (per-state counts, confidence sum) from running totals."""
+        return self._state_counts, self._confidence_sum
+
+    @property
+    def total_decisions(self) -> int:
+        """Number of decisions evaluated over the engine's lifetime."""
+        return sum(self._counter_snapshot()[0].values())
 
     @property
     def epistemic_hold_rate(self) -> float:
-        """Calculate current Epistemic Hold rate."""
-        if not self.decision_log:
+        """Calculate current Epistemic Hold rate.
+
+        O(1): read from running counters maintained by evaluate().
+        """
+        counts = self._counter_snapshot()[0]
+        total = sum(counts.values())
+        if total == 0:
             return 0.0
-        holds = sum(
-            1 for d in self.decision_log if d.state == TLState.EPISTEMIC_HOLD
-        )
-        return holds / len(self.decision_log)
+        return counts[TLState.EPISTEMIC_HOLD] / total
+
+    def get_windowed_statistics(self) -> Dict[str, Any]:
+        """Rolling and EWMA decision rates from the engine's monitor.
+
+        Returns the monitor's snapshot (one entry per window label plus
+        'ewma') with 'target_hold_rate' added.
+
+        Raises:
+            ValueError: If the engine was created without a monitor.
+        """
+        if self.monitor is None:
+            raise ValueError(
+                "This engine has no HoldRateMonitor; pass monitor= to "
+                "TLEngine to track windowed hold rates."
+            )
+        return {
+            **self.monitor.snapshot(),
+            'target_hold_rate': self.epistemic_hold_rate_target,
+        }
 
     def get_statistics(self) -> Dict[str, Any]:
-        """Get engine performance statistics."""
-        total = len(self.decision_log)
+        """Get engine performance statistics.
+
+        O(1): read from running counters maintained by evaluate() and
+        resolve_hold(), independent of how many decisions are logged.
+        """
+        counts, confidence_sum = self._counter_snapshot()
+        total = sum(counts.values())
         if total == 0:
             return {
                 'total_decisions': 0,
@@ -333,10 +1286,10 @@ class TLEngine:
                 'average_confidence': 0.0
             }
 
-        proceed = sum(1 for d in self.decision_log if d.state == TLState.PROCEED)
-        hold = sum(1 for d in self.decision_log if d.state == TLState.EPISTEMIC_HOLD)
-        refuse = sum(1 for d in self.decision_log if d.state == TLState.REFUSE)
-        avg_conf = sum(d.confidence for d in self.decision_log) / total
+        proceed = counts[TLState.PROCEED]
+        hold = counts[TLState.EPISTEMIC_HOLD]
+        refuse = counts[TLState.REFUSE]
+        avg_conf = confidence_sum / total
 
         return {
             'total_decisions': total,
@@ -348,55 +1301,162 @@ class TLEngine:
             'refuse_rate': refuse / total,
             'target_hold_rate': self.epistemic_hold_rate_target,
             'average_confidence': avg_conf,
-            'unresolved_holds': sum(
-                1 for e in self.epistemic_holds if not e.resolution_action
-            )
+            'unresolved_holds': self.hold_registry.unresolved_count
         }
 
     def export_audit_trail(self, filepath: str):
-        """Export complete audit trail to JSON file."""
-        audit_data = {
-            'engine_config': {
-                'proceed_threshold': self.proceed_threshold,
-                'hold_threshold': self.hold_threshold,
-                'target_hold_rate': self.epistemic_hold_rate_target
-            },
-            'statistics': self.get_statistics(),
-            'decision_log': [d.to_dict() for d in self.decision_log],
-            'epistemic_holds': [e.to_dict() for e in self.epistemic_holds],
-            'export_timestamp': datetime.utcnow().isoformat()
+        """Export complete audit trail to JSON file.
+
+        Records are streamed to the file one at a time, including any
+        sealed on-disk segments, so the export never holds the whole
+        trail in memory.
+        """
+        engine_config = {
+            'proceed_threshold': self.proceed_threshold,
+            'hold_threshold': self.hold_threshold,
+            'target_hold_rate': self.epistemic_hold_rate_target,
+            'threshold_epoch': self.threshold_epoch,
+            'threshold_history': [
+                version.to_dict() for version in list(self.threshold_history)
+            ]
         }
+        if self.profiles is not None:
+            engine_config['threshold_profiles'] = self.profiles.to_dict()
         with open(filepath, 'w') as f:
-            json.dump(audit_data, f, indent=2)
+            f.write('{\n')
+            f.write(f'  "engine_config": {json.dumps(engine_config)},\n')
+            f.write(f'  "statistics": {json.dumps(self.get_statistics())},\n')
+            _write_json_array(f, 'decision_log', _iter_records(self.decision_log))
+            f.write(',\n')
+            _write_json_array(
+                f, 'epistemic_holds', _iter_records(self.epistemic_holds)
+            )
+            f.write(',\n')
+            export_timestamp = json.dumps(datetime.utcnow().isoformat())
+            f.write(f'  "export_timestamp": {export_timestamp}\n}}\n')
         logger.info(f"Audit trail exported to {filepath}")
 
 
+def _iter_records(log) -> Any:
+    """Iterate a log's full history as dicts, streaming segments if any."""
+    iter_records = getattr(log, 'iter_records', None)
+    if iter_records is not None:
+        return iter_records()
+    return (record.to_dict() for record in log)
+
+
+def _write_json_array(f, key: str, records) -> None:
+    """Write '"key": [ ... ]' with one JSON record per line."""
+    f.write(f'  {json.dumps(key)}: [')
+    separator = '\n    '
+    for record in records:
+        f.write(separator)
+        f.write(json.dumps(record))
+        separator = ',\n    '
+    f.write('\n  ]')
+
+
+def _unpack_decision(result: Any) -> tuple:
+    """Split a decision function's return value into evaluate() arguments."""
+    if isinstance(result, tuple):
+        if len(result) == 2:
+            confidence, reasoning = result
+            metadata = {}
+        elif len(result) == 3:
+            confidence, reasoning, metadata = result
+        else:
+            raise ValueError(
+                "Function must return (confidence, reasoning) or "
+                "(confidence, reasoning, metadata)"
+            )
+    else:
+        raise ValueError("Function must return tuple")
+    return confidence, reasoning, metadata
+
+
 class TLDecorator:
-    """Decorator for wrapping economic decision functions with TL logic."""
+    """Decorator for wrapping economic decision functions with TL logic.
+
+    Works with plain functions and with ``async def`` functions. For the
+    latter the wrapper is a coroutine function, and if the engine's
+    evaluate() is itself a coroutine (AsyncTLEngine) it is awaited.
+
+    Caching is opt-in. With cache_size, each decorated function gets a
+    DecisionCache of its (confidence, reasoning, metadata) results keyed
+    on a canonical hash of the call arguments. A hit skips the function
+    but is still evaluated, so every call is a fresh audited decision.
+    The cache is available as ``wrapper.cache``. Only cache pure
+    functions.
+
+    Args:
+        engine: Engine (or AsyncTLEngine) that evaluates every call.
+        cache_size: Enable caching with this many entries (LRU).
+        cache_ttl: Seconds a cached result stays valid. None: no expiry.
+    """
 
-    def __init__(self, engine: TLEngine):
+    def __init__(
+        self,
+        engine: TLEngine,
+        cache_size: Optional[int] = None,
+        cache_ttl: Optional[float] = None
+    ):
+        if cache_size is None and cache_ttl is not None:
+            raise ValueError("cache_ttl requires cache_size")
         self.engine = engine
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
 
     def __call__(self, func: Callable) -> Callable:
-        def wrapper(*args, **kwargs):
-            result = func(*args, **kwargs)
-            if isinstance(result, tuple):
-                if len(result) == 2:
-                    confidence, reasoning = result
-                    metadata = {}
-                elif len(result) == 3:
-                    confidence, reasoning, metadata = result
+        cache = (
+            DecisionCache(self.cache_size, self.cache_ttl)
+            if self.cache_size is not None else None
+        )
+
+        if inspect.iscoroutinefunction(func):
+            async def async_wrapper(*args, **kwargs):
+                if cache is None:
+                    decision = _unpack_decision(await func(*args, **kwargs))
                 else:
-                    raise ValueError(
-                        "Function must return (confidence, reasoning) or "
-                        "(confidence, reasoning, metadata)"
-                    )
+                    key = make_key(args, kwargs)
+                    found, decision = cache.get(key)
+                    if found:
+                        decision = _fresh(decision)
+                    else:
+                        decision = _unpack_decision(await func(*args, **kwargs))
+                        cache.put(key, _fresh(decision))
+                value = self.engine.evaluate(*decision)
+                if inspect.isawaitable(value):
+                    value = await value
+                return value
+            async_wrapper = functools.wraps(func)(async_wrapper)
+            async_wrapper.cache = cache
+            return async_wrapper
+
+        def wrapper(*args, **kwargs):
+            if cache is None:
+                return self.engine.evaluate(
+                    *_unpack_decision(func(*args, **kwargs))
+                )
+            key = make_key(args, kwargs)
+            found, decision = cache.get(key)
+            if found:
+                decision = _fresh(decision)
             else:
-                raise ValueError("Function must return tuple")
-            return self.engine.evaluate(confidence, reasoning, metadata)
+                decision = _unpack_decision(func(*args, **kwargs))
+                cache.put(key, _fresh(decision))
+            return self.engine.evaluate(*decision)
+        wrapper = functools.wraps(func)(wrapper)
+        wrapper.cache = cache
         return wrapper
 
 
+def _fresh(decision: tuple) -> tuple:
+    """Copy a decision's metadata so cached and returned decisions never
+    share a dict."""
+    confidence, reasoning, metadata = decision
+    return confidence, reasoning, dict(metadata) if metadata else {}
+
+
 def calculate_confidence(
     data_sources: List[Dict[str, Any]],
     models: List[Any] = None
@@ -443,44 +1503,348 @@ def calculate_confidence(
     return max(0.0, min(1.0, confidence))
 
 
+# builtin sum() uses Neumaier-compensated addition for floats from 3.12 on.
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+
+
+def _builtin_sum(values: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Row sums of the first counts[i] entries, rounded as builtin sum()."""
+    total = np.zeros(values.shape[0])
+    compensation = np.zeros(values.shape[0])
+    for j in range(values.shape[1]):
+        active = counts > j
+        x = values[:, j]
+        t = total + x
+        if _COMPENSATED_SUM:
+            with np.errstate(invalid='ignore'):
+                step = np.where(
+                    np.abs(total) >= np.abs(x), (total - t) + x, (x - t) + total
+                )
+            compensation = np.where(active, compensation + step, compensation)
+        total = np.where(active, t, total)
+    if _COMPENSATED_SUM:
+        use = (compensation != 0.0) & np.isfinite(compensation)
+        total = np.where(use, total + compensation, total)
+    return total
+
+
+def _builtin_square(values: np.ndarray) -> np.ndarray:
+    """Elementwise x ** 2 rounded as for Python floats.
+
+    float ** 2 calls the C library's pow() on |x|, which is not always
+    correctly rounded, so x * x can differ from it in the last bit.
+    """
+    flat = np.abs(values).ravel().tolist()
+    return np.fromiter(
+        map(math.pow, flat, itertools.repeat(2.0)),
+        dtype=np.float64, count=len(flat)
+    ).reshape(values.shape)
+
+
+def _table_columns(table: Any) -> List[str]:
+    names = getattr(getattr(table, 'dtype', None), 'names', None)
+    return list(names) if names is not None else list(table.keys())
+
+
+def _padded(
+    table: Any,
+    fields: Dict[str, float],
+    counts: Optional[Sequence[int]],
+    n: Optional[int]
+) -> tuple:
+    """Per-candidate (n, k) float columns and per-row entry counts.
+
+    Accepts a 2-D structured array or mapping of (n, k) arrays (row i
+    holds candidate i's entries; counts gives how many lead each row), or
+    a table with one row per entry and a 'candidate' column (1-D
+    structured array, mapping of 1-D columns or DataFrame). Fields the
+    table lacks are filled with their default.
+    """
+    columns = _table_columns(table)
+    if 'candidate' in columns:
+        candidate = np.asarray(table['candidate'], dtype=np.int64)
+        if len(candidate) and candidate.min() < 0:
+            raise ValueError("candidate indices must be non-negative")
+        if n is None:
+            n = int(candidate.max()) + 1 if len(candidate) else 0
+        elif len(candidate) and candidate.max() >= n:
+            raise ValueError(
+                f"candidate index {int(candidate.max())} out of range "
+                f"for {n} candidates"
+            )
+        row_counts = np.bincount(candidate, minlength=n)
+        order = np.argsort(candidate, kind='stable')
+        rows = candidate[order]
+        starts = np.cumsum(row_counts) - row_counts
+        positions = np.arange(len(rows)) - starts[rows]
+        k = int(row_counts.max()) if n else 0
+        padded = {}
+        for name, default in fields.items():
+            column = np.full((n, k), default, dtype=np.float64)
+            if name in columns:
+                column[rows, positions] = np.asarray(
+                    table[name], dtype=np.float64
+                )[order]
+            padded[name] = column
+        return padded, row_counts, n
+    if not columns:
+        raise ValueError("Source table has no columns")
+    shape = np.shape(table[columns[0]])
+    if len(shape) != 2:
+        raise ValueError(
+            "Expected (candidates, entries) columns or a 'candidate' column, "
+            f"got shape {shape}"
+        )
+    if n is not None and shape[0] != n:
+        raise ValueError(
+            f"data_sources and models cover different numbers of candidates "
+            f"({n} vs {shape[0]})"
+        )
+    if counts is None:
+        row_counts = np.full(shape[0], shape[1], dtype=np.int64)
+    else:
+        row_counts = np.asarray(counts, dtype=np.int64)
+        if row_counts.shape != (shape[0],):
+            raise ValueError(
+                f"counts must have one entry per candidate ({shape[0]}), "
+                f"got shape {row_counts.shape}"
+            )
+        if row_counts.min(initial=0) < 0 or row_counts.max(initial=0) > shape[1]:
+            raise ValueError(f"counts must be in [0, {shape[1]}]")
+    padded = {
+        name: (
+            np.asarray(table[name], dtype=np.float64) if name in columns
+            else np.full(shape, default, dtype=np.float64)
+        )
+        for name, default in fields.items()
+    }
+    return padded, row_counts, shape[0]
+
+
+def calculate_confidence_batch(
+    data_sources: Any,
+    models: Any = None,
+    source_counts: Optional[Sequence[int]] = None,
+    model_counts: Optional[Sequence[int]] = None
+) -> np.ndarray:
+    """
+    Vectorized calculate_confidence for many candidate actions at once.
+
+    Returns a float64 array with one confidence per candidate, bit-for-bit
+    equal to calling calculate_confidence on each candidate's sources and
+    models (as Python floats), including the default fallbacks and the
+    [0.0, 1.0] clamp.
+
+    Args:
+        data_sources: Per-candidate data sources, as either
+            - a structured array of shape (n, k), or a mapping of field
+              name to (n, k) array, where row i holds candidate i's
+              sources; or
+            - a table with one row per source and a 'candidate' column of
+              candidate indices (1-D structured array, mapping of columns
+              or pandas DataFrame). Sources keep their row order within
+              a candidate.
+            Fields read: 'quality', 'signal_strength' and
+            'historical_accuracy'; a missing field takes its scalar default.
+        models: Model outputs in the same layouts with an 'output' field,
+                or a plain (n, m) float array of outputs.
+        source_counts: With the (n, k) layout, how many leading sources of
+                       each row are real (default: all k).
+        model_counts:  The same for models.
+
+    Raises:
+        ValueError: If the layouts are malformed or data_sources and
+                    models cover different numbers of candidates.
+    """
+    sources, n_sources, n = _padded(
+        data_sources,
+        {'quality': 0.5, 'signal_strength': 0.5, 'historical_accuracy': 0.75},
+        source_counts, None
+    )
+    divisor = np.maximum(n_sources, 1)
+    data_quality = _builtin_sum(sources['quality'], n_sources) / divisor
+    signal_strength = _builtin_sum(sources['signal_strength'], n_sources) / divisor
+    historical_accuracy = (
+        np.where(n_sources > 0, sources['historical_accuracy'][:, 0], 0.5)
+        if sources['historical_accuracy'].shape[1]
+        else np.full(n, 0.5)
+    )
+
+    model_agreement = np.full(n, 0.5)
+    if models is not None:
+        if isinstance(models, np.ndarray) and models.dtype.names is None:
+            models = {'output': models}
+        outputs, n_models, n = _padded(
+            models, {'output': 0.5}, model_counts, n
+        )
+        outputs = outputs['output']
+        divisor = np.maximum(n_models, 1)
+        mean = _builtin_sum(outputs, n_models) / divisor
+        variance = _builtin_sum(
+            _builtin_square(outputs - mean[:, None]), n_models
+        ) / divisor
+        agreement = 1.0 - variance
+        model_agreement = np.where(
+            n_models > 1, np.where(agreement > 0.0, agreement, 0.0), 0.5
+        )
+
+    confidence = 0.25 * (
+        data_quality + model_agreement + historical_accuracy + signal_strength
+    )
+    # Same comparisons as max(0.0, min(1.0, confidence)), NaN included.
+    confidence = np.where(confidence < 1.0, confidence, 1.0)
+    return np.where(confidence > 0.0, confidence, 0.0)
+
+
+# Below this many sources the direct pairwise scan is cheaper than sorting.
+_PAIRWISE_CONFLICT_CUTOFF = 16
+
+_CONFLICT_MODES = ('pairs', 'count', 'any')
+
+
+def _conflict_bounds(ordered: np.ndarray, conflict_threshold: float) -> np.ndarray:
+    """For each position p of ascending, NaN-free confidences, the first
+    q > p with ordered[q] - ordered[p] >= conflict_threshold (or n).
+
+    The difference is monotone in q, so every q from the bound on is a
+    conflict. Bisection uses the exact comparison analyze_uncertainty
+    makes, rather than ordered[p] + threshold, so borderline pairs are
+    classified identically.
+    """
+    n = len(ordered)
+    lo = np.arange(1, n + 1)
+    hi = np.full(n, n)
+    with np.errstate(invalid='ignore'):
+        while True:
+            active = lo < hi
+            if not active.any():
+                return lo
+            mid = (lo + hi) // 2
+            hit = ordered[np.minimum(mid, n - 1)] - ordered >= conflict_threshold
+            hi = np.where(active & hit, mid, hi)
+            lo = np.where(active & ~hit, mid + 1, lo)
+
+
+def _conflict_pairs(
+    confidences: np.ndarray, conflict_threshold: float, count_only: bool
+):
+    """Conflicting (i, j) index pairs, i < j, in the order of a pairwise
+    scan, in O(n log n + k log k); or just their number in O(n log n)."""
+    valid = np.flatnonzero(~np.isnan(confidences))
+    order = valid[np.argsort(confidences[valid], kind='stable')]
+    bounds = _conflict_bounds(confidences[order], conflict_threshold)
+    counts = len(order) - bounds
+    k = int(counts.sum())
+    if count_only:
+        return k
+    first = np.repeat(np.arange(len(order)), counts)
+    starts = np.cumsum(counts) - counts
+    second = np.arange(k) - starts[first] + bounds[first]
+    a, b = order[first], order[second]
+    i, j = np.minimum(a, b), np.maximum(a, b)
+    scan_order = np.lexsort((j, i))
+    return i[scan_order], j[scan_order]
+
+
 def analyze_uncertainty(
     data_sources: List[Dict[str, float]],
-    conflict_threshold: float = 0.3
+    conflict_threshold: float = 0.3,
+    mode: str = 'pairs'
 ) -> Dict[str, Any]:
-    """Analyze uncertainty across multiple data sources."""
+    """Analyze uncertainty across multiple data sources.
+
+    Two sources conflict when their confidences differ by at least
+    conflict_threshold. Conflicts are found by sorting, in
+    O(n log n + k log k) for k conflicts, instead of comparing every pair.
+
+    Args:
+        data_sources: Dicts with 'name' and 'confidence'.
+        conflict_threshold: Smallest difference that counts as a conflict.
+        mode: How much conflict detail to compute:
+              'pairs' - every conflicting pair in 'conflicts' (default);
+              'count' - only 'conflict_count', O(n log n);
+              'any'   - only 'has_conflicts', O(n).
+              'conflicts' is None outside 'pairs' mode, and
+              'conflict_count' is None in 'any' mode.
+
+    Raises:
+        ValueError: If mode is not one of 'pairs', 'count' or 'any'.
+    """
+    if mode not in _CONFLICT_MODES:
+        raise ValueError(
+            f"mode must be one of {_CONFLICT_MODES}, got {mode!r}"
+        )
     if not data_sources:
         return {
             'average_confidence': 0.0,
             'confidence_variance': 0.0,
             'has_conflicts': False,
-            'conflicts': []
+            'conflicts': [] if mode == 'pairs' else None,
+            'conflict_count': 0
         }
 
     confidences = [src['confidence'] for src in data_sources]
     avg = sum(confidences) / len(confidences)
     variance = sum((c - avg) ** 2 for c in confidences) / len(confidences)
 
-    conflicts = []
-    for i, src1 in enumerate(data_sources):
-        for src2 in data_sources[i + 1:]:
-            diff = abs(src1['confidence'] - src2['confidence'])
-            if diff >= conflict_threshold:
-                conflicts.append({
-                    'sources': [src1['name'], src2['name']],
-                    'difference': diff,
-                    'values': [src1['confidence'], src2['confidence']]
-                })
+    conflicts = None
+    conflict_count = None
+    if mode == 'any':
+        values = np.asarray(confidences, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        # The widest spread is itself a pair; no pair can exceed it.
+        with np.errstate(invalid='ignore'):
+            has_conflicts = bool(
+                len(values) > 1
+                and values.max() - values.min() >= conflict_threshold
+            )
+    elif len(data_sources) < _PAIRWISE_CONFLICT_CUTOFF:
+        pairs = [
+            (src1, src2)
+            for i, src1 in enumerate(data_sources)
+            for src2 in data_sources[i + 1:]
+            if abs(src1['confidence'] - src2['confidence']) >= conflict_threshold
+        ]
+        conflict_count = len(pairs)
+        if mode == 'pairs':
+            conflicts = [_conflict_record(src1, src2) for src1, src2 in pairs]
+        has_conflicts = conflict_count > 0
+    else:
+        values = np.asarray(confidences, dtype=np.float64)
+        if mode == 'count':
+            conflict_count = _conflict_pairs(values, conflict_threshold, True)
+        else:
+            first, second = _conflict_pairs(values, conflict_threshold, False)
+            conflicts = [
+                _conflict_record(data_sources[i], data_sources[j])
+                for i, j in zip(first.tolist(), second.tolist())
+            ]
+            conflict_count = len(conflicts)
+        has_conflicts = conflict_count > 0
 
     return {
         'average_confidence': avg,
         'confidence_variance': variance,
-        'has_conflicts': len(conflicts) > 0,
+        'has_conflicts': has_conflicts,
         'conflicts': conflicts,
+        'conflict_count': conflict_count,
         'source_count': len(data_sources)
     }
 
 
-def verify_mandate(mandate_type: str, data: Dict[str, Any]) -> TLValue:
+def _conflict_record(src1: Dict[str, Any], src2: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'sources': [src1['name'], src2['name']],
+        'difference': abs(src1['confidence'] - src2['confidence']),
+        'values': [src1['confidence'], src2['confidence']]
+    }
+
+
+def verify_mandate(
+    mandate_type: str,
+    data: Dict[str, Any],
+    registry: Optional[MandateRegistry] = None
+) -> TLValue:
     """
     Verify Economic Rights or Sustainable Capital mandates.
     Automatic EPISTEMIC_HOLD on any verification failure.
@@ -488,42 +1852,161 @@ def verify_mandate(mandate_type: str, data: Dict[str, Any]) -> TLValue:
     Mandate checks are binary pass/fail and override confidence scores.
     Even a confidence score of 1.0 does not prevent an Epistemic Hold
     if a mandate check fails. This is intentional and constitutional.
-    """
-    if mandate_type == 'economic_rights':
-        checks = {
-            'ownership_verified': data.get('ownership_verified', False),
-            'consent_obtained': data.get('consent_obtained', False),
-            'provenance_signed': data.get('provenance_signed', False),
-            'regulatory_access': data.get('regulatory_access', False)
-        }
-    elif mandate_type == 'sustainable_capital':
-        checks = {
-            'esg_verified': data.get('esg_verified', False),
-            'emissions_anchored': data.get('emissions_anchored', False),
-            'use_of_proceeds_tracked': data.get('use_of_proceeds_tracked', False)
-        }
-    else:
-        raise ValueError(f"Unknown mandate type: {mandate_type}")
 
-    if not all(checks.values()):
-        failed = [k for k, v in checks.items() if not v]
+    mandate_type names a mandate in registry (default: DEFAULT_MANDATES,
+    which holds 'economic_rights' and 'sustainable_capital'). See
+    mandates.py for declaring further mandates.
+    """
+    if registry is None:
+        registry = DEFAULT_MANDATES
+    mandate = registry.get(mandate_type)
+    failed = mandate.failed_checks(data)
+    if failed:
         return TLValue(
             state=TLState.EPISTEMIC_HOLD,
             confidence=0.0,
-            reasoning=f"{mandate_type} mandate failed: {failed}",
+            reasoning=_mandate_reasoning(mandate_type, failed),
             metadata={'failed_checks': failed, 'mandate': mandate_type}
         )
 
     return TLValue(
         state=TLState.PROCEED,
         confidence=1.0,
-        reasoning=f"{mandate_type} verified"
+        reasoning=_mandate_reasoning(mandate_type, failed)
+    )
+
+
+def _mandate_reasoning(mandate_type: str, failed: List[str]) -> str:
+    if failed:
+        return f"{mandate_type} mandate failed: {failed}"
+    return f"{mandate_type} verified"
+
+
+class _LazyColumn:
+    """Read-only sequence computing each item on access."""
+
+    __slots__ = ('item', 'length')
+
+    def __init__(self, item: Callable[[int], Any], length: int):
+        self.item = item
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> Any:
+        if not -self.length <= index < self.length:
+            raise IndexError(index)
+        return self.item(index)
+
+
+class MandateBatchResult(TLBatchResult):
+    """Result of verify_mandate_batch.
+
+    Indexing returns the TLValue verify_mandate gives for that record:
+    PROCEED at confidence 1.0 when every check passed, otherwise
+    EPISTEMIC_HOLD at confidence 0.0 naming the failed checks. Check
+    outcomes stay as one uint64 bitmask per record in ``failures`` (bit i
+    set when check i of the mandate failed); names are decoded on demand.
+    """
+
+    __slots__ = ('mandate', 'failures')
+
+    def __init__(
+        self,
+        mandate: Mandate,
+        failures: np.ndarray,
+        timestamp: datetime
+    ):
+        passed = failures == 0
+        n = len(failures)
+        super().__init__(
+            states=np.where(
+                passed, TLState.PROCEED.value, TLState.EPISTEMIC_HOLD.value
+            ).astype(np.int8),
+            confidences=passed.astype(np.float64),
+            reasonings=_LazyColumn(
+                lambda i: _mandate_reasoning(
+                    mandate.name, self.failed_checks(i)
+                ), n
+            ),
+            metadata=_LazyColumn(self._metadata_at, n),
+            timestamp=timestamp
+        )
+        self.mandate = mandate
+        self.failures = failures
+
+    @property
+    def passed(self) -> np.ndarray:
+        """Bool array, True where every check passed."""
+        return self.failures == 0
+
+    def failed_checks(self, index: int) -> List[str]:
+        """Names of the checks record ``index`` failed."""
+        return self.mandate.decode(self.failures[index])
+
+    def failed_check_names(self) -> List[List[str]]:
+        """Failed check names for every record (decoded once per pattern)."""
+        patterns, inverse = np.unique(self.failures, return_inverse=True)
+        decoded = [self.mandate.decode(bits) for bits in patterns.tolist()]
+        return [list(decoded[k]) for k in inverse.ravel().tolist()]
+
+    def check_failure_counts(self) -> Dict[str, int]:
+        """Number of records failing each check."""
+        return {
+            check.name: int(np.count_nonzero(
+                self.failures & np.uint64(1 << bit)
+            ))
+            for bit, check in enumerate(self.mandate.checks)
+        }
+
+    def force_states(self) -> np.ndarray:
+        """int8 force_states for TLEngine.evaluate_batch: EPISTEMIC_HOLD
+        where the mandate failed, UNFORCED where it passed."""
+        return np.where(
+            self.passed, UNFORCED, TLState.EPISTEMIC_HOLD.value
+        ).astype(np.int8)
+
+    def _metadata_at(self, index: int) -> Dict[str, Any]:
+        failed = self.failed_checks(index)
+        if not failed:
+            return {}
+        return {'failed_checks': failed, 'mandate': self.mandate.name}
+
+
+def verify_mandate_batch(
+    mandate_type: str,
+    records: Any,
+    registry: Optional[MandateRegistry] = None
+) -> MandateBatchResult:
+    """
+    Verify a mandate for many records at once, one column pass per check.
+
+    Args:
+        mandate_type: Mandate name in registry (default: DEFAULT_MANDATES).
+        records: A pandas DataFrame, a 1-D structured array, a mapping of
+                 field name to column, or a list of dicts.
+
+    Returns:
+        MandateBatchResult whose decision i equals
+        verify_mandate(mandate_type, record_i) apart from the shared
+        timestamp.
+
+    Raises:
+        ValueError: If the mandate is unknown or records is malformed.
+    """
+    if registry is None:
+        registry = DEFAULT_MANDATES
+    mandate = registry.get(mandate_type)
+    return MandateBatchResult(
+        mandate, mandate.failure_bits(records), datetime.utcnow()
     )
 
 
 # ---------------------------------------------------------------------------
 # DEMONSTRATION SCAFFOLD
 # Runs only when this file is executed directly: python src/core.py
+# (or python -m ternary_logic.core where the package is installed).
 # Never runs when imported as a module.
 # Threshold values below are for demonstration only.
 # Not framework defaults. Not recommendations.
@@ -531,6 +2014,7 @@ def verify_mandate(mandate_type: str, data: Dict[str, Any]) -> TLValue:
 # See docs/Threshold_Calibration.md.
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     _DEMO_PROCEED = 0.75
     _DEMO_HOLD = 0.35
 
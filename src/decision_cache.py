@@ -0,0 +1,156 @@
+"""
+Result cache for TLDecorator.
+
+A decorated decision function can be called several times with the same
+inputs in quick succession (an order re-priced a few times within
+milliseconds). With caching enabled, TLDecorator keeps the function's
+(confidence, reasoning, metadata) result in a bounded LRU cache with a
+per-entry time-to-live. A cache hit skips the signal computation but is
+still passed to engine.evaluate, so every call produces a fresh, logged
+TLValue and the audit trail is unchanged.
+
+Only use caching for pure decision functions: the result must depend on
+the arguments alone.
+
+Usage:
+    >>> from ternary_logic import TLDecorator
+    >>> @TLDecorator(engine, cache_size=4096, cache_ttl=0.050)
+    ... def price_signal(order):
+    ...     return expensive_confidence(order), "Re-priced order"
+    >>> price_signal.cache.stats()
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class _Uncacheable(Exception):
+    """Raised while building a key for an argument with no canonical form."""
+
+
+def _canonical(value: Any) -> Any:
+    """JSON fallback for argument types with a stable canonical form."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=lambda v: json.dumps(v, default=_canonical))
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return f"{type(value).__name__}.{value.name}"
+    item = getattr(value, 'item', None)
+    if callable(item):  # NumPy scalars
+        return item()
+    raise _Uncacheable(type(value).__name__)
+
+
+def make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[str]:
+    """Canonical SHA-256 key for call arguments, or None if uncacheable.
+
+    Arguments are serialized as sorted-key JSON, so equal dicts produce
+    the same key regardless of insertion order.
+    """
+    try:
+        payload = json.dumps(
+            [args, kwargs], sort_keys=True, separators=(',', ':'),
+            default=_canonical
+        )
+    except (_Uncacheable, TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class DecisionCache:
+    """Thread-safe LRU cache with per-entry TTL and hit/miss counters.
+
+    Args:
+        maxsize: Most entries kept; the least recently used is evicted.
+        ttl: Seconds an entry stays valid. None: no expiry.
+        clock: Monotonic clock in seconds. Default: time.monotonic.
+
+    Raises:
+        ValueError: If maxsize is not positive or ttl is not positive.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if maxsize <= 0:
+            raise ValueError(f"cache_size must be positive, got {maxsize}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"cache_ttl must be positive, got {ttl}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.uncacheable = 0
+
+    def get(self, key: Optional[str]) -> Tuple[bool, Any]:
+        """Return (found, value) and update the counters."""
+        if key is None:
+            with self._lock:
+                self.uncacheable += 1
+            return False, None
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Optional[str], value: Any):
+        """Store a value, evicting the least recently used if full."""
+        if key is None:
+            return
+        expires_at = (
+            self.clock() + self.ttl if self.ttl is not None else float('inf')
+        )
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters and current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'uncacheable': self.uncacheable,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
@@ -0,0 +1,365 @@
+"""
+Columnar decision log storage.
+
+A drop-in replacement for the List[TLValue] decision log kept by TLEngine.
+Decisions are stored column-wise in contiguous, chunk-allocated NumPy
+arrays (state, confidence, timestamp in nanoseconds, threshold epoch).
+Reasoning is stored as UTF-8 and metadata as compact JSON, appended to
+one byte buffer each per chunk, with an int64 end-offset column per
+decision; empty metadata takes no bytes. Once a chunk is full its two
+buffers are zlib-compressed, which shrinks the repetitive text of a long
+run several times over. Threshold profile ids are interned. Reads rebuild
+TLValue objects on demand, so get_statistics and export_audit_trail keep
+working unchanged.
+
+Metadata must be JSON-serializable, as it already is for
+export_audit_trail and the binary codec.
+
+Usage:
+    >>> from ternary_logic import TLEngine, ColumnarDecisionLog
+    >>> engine = TLEngine(
+    ...     proceed_threshold=YOUR_INSTITUTION_PROCEED_THRESHOLD,
+    ...     hold_threshold=YOUR_INSTITUTION_HOLD_THRESHOLD,
+    ...     decision_log=ColumnarDecisionLog()
+    ... )
+"""
+
+import sys
+import zlib
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .codec import _decode_json, _dumps
+from .core import TLBatchResult, TLState, TLValue, _Broadcast
+
+_EPOCH = datetime(1970, 1, 1)
+_STATES_BY_CODE = {state.value: state for state in TLState}
+
+# Column name -> dtype. One array of each per chunk. The *_end columns are
+# end offsets into the chunk's reasoning and metadata bytes; a row's start
+# is the previous row's end (0 for the first row of a chunk).
+_COLUMNS = {
+    'state': np.int8,
+    'confidence': np.float64,
+    'timestamp_ns': np.int64,
+    'reasoning_end': np.int64,
+    'metadata_end': np.int64,
+    'profile_id': np.int32,
+    'threshold_epoch': np.int32,
+}
+
+_NO_PROFILE = -1
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Convert a naive UTC datetime to integer nanoseconds since the epoch."""
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def ns_to_datetime(value: int) -> datetime:
+    """Convert integer nanoseconds since the epoch to a naive UTC datetime."""
+    return _EPOCH + timedelta(microseconds=int(value) // 1000)
+
+
+def _encode_metadata(metadata: Optional[Dict[str, Any]]) -> bytes:
+    return _dumps(metadata) if metadata else b''
+
+
+def _ends(lengths, count: int) -> np.ndarray:
+    """Cumulative end offsets of consecutive byte strings."""
+    ends = np.fromiter(lengths, dtype=np.int64, count=count)
+    return np.cumsum(ends, out=ends)
+
+
+class ColumnarDecisionLog:
+    """Array-backed, list-like store of TL decisions.
+
+    Each decision costs 41 bytes of column storage plus its reasoning and
+    metadata bytes, compressed once its chunk is full, compared with
+    several hundred bytes for a TLValue dataclass instance with its
+    string, dict and datetime.
+
+    Args:
+        chunk_size: Number of decisions per allocated chunk. Storage grows
+                    one chunk at a time; existing chunks are never copied.
+    """
+
+    def __init__(self, chunk_size: int = 65536):
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.chunk_size = chunk_size
+        self._chunks: List[Dict[str, np.ndarray]] = []
+        self._length = 0
+        # Reasoning and metadata bytes of the open (last, not yet full)
+        # chunk, and the compressed pair of every full chunk before it.
+        self._reasoning = bytearray()
+        self._metadata = bytearray()
+        self._sealed: List[Tuple[bytes, bytes]] = []
+        self._text_cache: Optional[Tuple[int, bytes, bytes]] = None
+        self._profiles: List[str] = []
+        self._profile_ids: Dict[str, int] = {}
+
+    # -- writes -----------------------------------------------------------
+
+    def _intern_profile(self, profile: Optional[str]) -> int:
+        if profile is None:
+            return _NO_PROFILE
+        pid = self._profile_ids.get(profile)
+        if pid is None:
+            pid = len(self._profiles)
+            self._profile_ids[profile] = pid
+            self._profiles.append(profile)
+        return pid
+
+    def _slot(self) -> tuple:
+        """Return (chunk, row) for the next decision, allocating if needed."""
+        chunk_index, row = divmod(self._length, self.chunk_size)
+        if chunk_index == len(self._chunks):
+            self._chunks.append({
+                name: np.empty(self.chunk_size, dtype=dtype)
+                for name, dtype in _COLUMNS.items()
+            })
+        return self._chunks[chunk_index], row
+
+    def _seal(self):
+        """Compress the text of the chunk that has just filled up."""
+        self._sealed.append((
+            zlib.compress(self._reasoning), zlib.compress(self._metadata)
+        ))
+        self._reasoning = bytearray()
+        self._metadata = bytearray()
+
+    def append(self, value: TLValue):
+        """Append a single decision."""
+        chunk, row = self._slot()
+        chunk['state'][row] = value.state.value
+        chunk['confidence'][row] = value.confidence
+        timestamp_ns = getattr(value, 'timestamp_ns', None)
+        chunk['timestamp_ns'][row] = (
+            timestamp_ns if timestamp_ns is not None
+            else datetime_to_ns(value.timestamp)
+        )
+        self._reasoning += value.reasoning.encode('utf-8')
+        chunk['reasoning_end'][row] = len(self._reasoning)
+        self._metadata += _encode_metadata(value.metadata)
+        chunk['metadata_end'][row] = len(self._metadata)
+        chunk['profile_id'][row] = self._intern_profile(value.profile)
+        chunk['threshold_epoch'][row] = value.threshold_epoch
+        self._length += 1
+        if row == self.chunk_size - 1:
+            self._seal()
+
+    def extend(self, values):
+        """Append several TLValue decisions."""
+        for value in values:
+            self.append(value)
+
+    def append_batch(self, result: TLBatchResult):
+        """Append a whole evaluate_batch result with array copies."""
+        n = len(result)
+        if isinstance(result.reasonings, _Broadcast):
+            reasoning = result.reasonings.value.encode('utf-8')
+            reasoning_ends = len(reasoning) * np.arange(
+                1, n + 1, dtype=np.int64
+            )
+            reasoning *= n
+        else:
+            encoded = [r.encode('utf-8') for r in result.reasonings]
+            reasoning_ends = _ends(map(len, encoded), n)
+            reasoning = b''.join(encoded)
+        if isinstance(result.metadata, _Broadcast):
+            metadata = _encode_metadata(result.metadata.value)
+            metadata_ends = len(metadata) * np.arange(
+                1, n + 1, dtype=np.int64
+            )
+            metadata *= n
+        else:
+            encoded = [_encode_metadata(m) for m in result.metadata]
+            metadata_ends = _ends(map(len, encoded), n)
+            metadata = b''.join(encoded)
+        if isinstance(result.profiles, _Broadcast):
+            profile_ids = np.full(
+                n, self._intern_profile(result.profiles.value), dtype=np.int32
+            )
+        else:
+            profile_ids = np.fromiter(
+                (self._intern_profile(p) for p in result.profiles),
+                dtype=np.int32, count=n
+            )
+        self._write_columns({
+            'state': result.states,
+            'confidence': result.confidences,
+            'timestamp_ns': np.full(
+                n, datetime_to_ns(result.timestamp), dtype=np.int64
+            ),
+            'reasoning_end': reasoning_ends,
+            'metadata_end': metadata_ends,
+            'profile_id': profile_ids,
+            'threshold_epoch': np.full(
+                n, result.threshold_epoch, dtype=np.int32
+            ),
+        }, n, reasoning, metadata)
+
+    def append_log(self, other: 'ColumnarDecisionLog'):
+        """Append every decision of another columnar log, chunk by chunk.
+
+        Profile ids are remapped into this log's intern table and text
+        offsets are rebased, so no TLValue is materialized.
+        """
+        # Trailing slot maps _NO_PROFILE (-1) to itself.
+        profile_map = np.fromiter(
+            [self._intern_profile(p) for p in other._profiles] + [_NO_PROFILE],
+            dtype=np.int32, count=len(other._profiles) + 1
+        )
+        parts = zip(*(other.iter_chunks(name) for name in _COLUMNS))
+        for chunk_index, (state, confidence, timestamp_ns, reasoning_end,
+                          metadata_end, profile_id,
+                          threshold_epoch) in enumerate(parts):
+            reasoning, metadata = other._texts(chunk_index)
+            self._write_columns({
+                'state': state,
+                'confidence': confidence,
+                'timestamp_ns': timestamp_ns,
+                'reasoning_end': reasoning_end,
+                'metadata_end': metadata_end,
+                'profile_id': profile_map[profile_id],
+                'threshold_epoch': threshold_epoch,
+            }, len(state), reasoning, metadata)
+
+    def _write_columns(
+        self,
+        columns: Dict[str, np.ndarray],
+        n: int,
+        reasoning: bytes,
+        metadata: bytes
+    ):
+        """Copy n rows of column arrays into the chunk store.
+
+        The *_end columns are end offsets into reasoning and metadata,
+        which hold the text of the n rows back to back.
+        """
+        texts = (
+            ('reasoning_end', reasoning, '_reasoning'),
+            ('metadata_end', metadata, '_metadata'),
+        )
+        written = 0
+        while written < n:
+            chunk, row = self._slot()
+            take = min(self.chunk_size - row, n - written)
+            for name, source in columns.items():
+                chunk[name][row:row + take] = source[written:written + take]
+            for name, text, attr in texts:
+                ends = columns[name]
+                start = int(ends[written - 1]) if written else 0
+                stop = int(ends[written + take - 1])
+                buffer = getattr(self, attr)
+                chunk[name][row:row + take] += len(buffer) - start
+                buffer += text[start:stop]
+            written += take
+            self._length += take
+            if row + take == self.chunk_size:
+                self._seal()
+
+    # -- reads ------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def _texts(self, chunk_index: int) -> Tuple[bytes, bytes]:
+        """Reasoning and metadata bytes of one chunk."""
+        if chunk_index == len(self._sealed):
+            return self._reasoning, self._metadata
+        cached = self._text_cache
+        if cached is None or cached[0] != chunk_index:
+            reasoning, metadata = self._sealed[chunk_index]
+            cached = (
+                chunk_index,
+                zlib.decompress(reasoning), zlib.decompress(metadata)
+            )
+            self._text_cache = cached
+        return cached[1], cached[2]
+
+    def _value_at(self, index: int) -> TLValue:
+        chunk_index, row = divmod(index, self.chunk_size)
+        chunk = self._chunks[chunk_index]
+        reasoning, metadata = self._texts(chunk_index)
+        reasoning_end = int(chunk['reasoning_end'][row])
+        metadata_end = int(chunk['metadata_end'][row])
+        if row:
+            reasoning_start = int(chunk['reasoning_end'][row - 1])
+            metadata_start = int(chunk['metadata_end'][row - 1])
+        else:
+            reasoning_start = metadata_start = 0
+        profile_id = int(chunk['profile_id'][row])
+        return TLValue(
+            state=_STATES_BY_CODE[int(chunk['state'][row])],
+            confidence=float(chunk['confidence'][row]),
+            reasoning=reasoning[reasoning_start:reasoning_end].decode('utf-8'),
+            metadata=(
+                _decode_json(
+                    metadata[metadata_start:metadata_end].decode('utf-8')
+                )
+                if metadata_end > metadata_start else {}
+            ),
+            timestamp=ns_to_datetime(chunk['timestamp_ns'][row]),
+            profile=(
+                self._profiles[profile_id]
+                if profile_id != _NO_PROFILE else None
+            ),
+            threshold_epoch=int(chunk['threshold_epoch'][row])
+        )
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[TLValue, List[TLValue]]:
+        if isinstance(index, slice):
+            return [self._value_at(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("decision log index out of range")
+        return self._value_at(index)
+
+    def __iter__(self) -> Iterator[TLValue]:
+        for i in range(self._length):
+            yield self._value_at(i)
+
+    def iter_chunks(self, column: str) -> Iterator[np.ndarray]:
+        """Yield filled views of one column, chunk by chunk, without copying."""
+        if column not in _COLUMNS:
+            raise KeyError(f"Unknown column: {column}")
+        remaining = self._length
+        for chunk in self._chunks:
+            take = min(remaining, self.chunk_size)
+            if take <= 0:
+                break
+            yield chunk[column][:take]
+            remaining -= take
+
+    def column(self, column: str) -> np.ndarray:
+        """Return one column as a single contiguous array (copied)."""
+        parts = list(self.iter_chunks(column))
+        if not parts:
+            return np.empty(0, dtype=_COLUMNS[column])
+        return np.concatenate(parts)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for columns and for reasoning and metadata text,
+        compressed or open (excludes the decompression cache)."""
+        columns = sum(
+            array.nbytes for chunk in self._chunks for array in chunk.values()
+        )
+        text = sum(
+            sys.getsizeof(reasoning) + sys.getsizeof(metadata)
+            for reasoning, metadata in self._sealed
+        )
+        return (
+            columns + text
+            + sys.getsizeof(self._reasoning) + sys.getsizeof(self._metadata)
+        )
@@ -0,0 +1,146 @@
+"""
+Per-decision logging strategies for TLEngine.
+
+Emitting a formatted log line for every decision and every Epistemic Hold
+dominates per-decision cost on hot paths. TLEngine therefore routes its
+per-decision log lines through a strategy selected with ``log_mode``:
+
+    'all'      one line per decision and hold (the historical behaviour)
+    'off'      no per-decision lines; the audit trail is unaffected
+    'sampled'  one line per ``log_sample_rate`` decisions / holds
+    'queued'   every line, handed to a background thread as a structured
+               LogRecord; message formatting and handler I/O happen there
+
+All strategies use lazy %-style formatting and attach structured fields
+(tl_state, tl_confidence, tl_event_id) to the LogRecord.
+
+The library never configures logging handlers itself. Applications call
+logging.basicConfig (or their own configuration) as usual.
+"""
+
+import logging
+import queue
+from logging.handlers import QueueListener
+from typing import List
+
+LOG_MODES = ('all', 'off', 'sampled', 'queued')
+
+_DECISION_MSG = "TL Decision: %s (confidence: %.3f)"
+_HOLD_MSG = "EPISTEMIC HOLD triggered: %s"
+
+
+class DecisionLogger:
+    """Emit one log line per decision and per hold ('all' mode)."""
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+
+    def decision(self, state_name: str, confidence: float):
+        if self.logger.isEnabledFor(logging.INFO):
+            self._emit(
+                logging.INFO, _DECISION_MSG, (state_name, confidence),
+                {'tl_state': state_name, 'tl_confidence': confidence}
+            )
+
+    def hold(self, event_id: str):
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._emit(
+                logging.WARNING, _HOLD_MSG, (event_id,),
+                {'tl_event_id': event_id}
+            )
+
+    def _emit(self, level: int, msg: str, args: tuple, extra: dict):
+        self.logger.log(level, msg, *args, extra=extra)
+
+    def close(self):
+        pass
+
+
+class NullDecisionLogger(DecisionLogger):
+    """Emit nothing per decision ('off' mode)."""
+
+    def decision(self, state_name: str, confidence: float):
+        pass
+
+    def hold(self, event_id: str):
+        pass
+
+
+class SampledDecisionLogger(DecisionLogger):
+    """Emit one line per ``every`` decisions and per ``every`` holds."""
+
+    def __init__(self, logger: logging.Logger, every: int):
+        if every < 1:
+            raise ValueError(f"log_sample_rate must be >= 1, got {every}")
+        super().__init__(logger)
+        self.every = every
+        self._decisions = 0
+        self._holds = 0
+
+    def decision(self, state_name: str, confidence: float):
+        self._decisions += 1
+        if self._decisions % self.every == 0:
+            super().decision(state_name, confidence)
+
+    def hold(self, event_id: str):
+        self._holds += 1
+        if self._holds % self.every == 0:
+            super().hold(event_id)
+
+
+class QueuedDecisionLogger(DecisionLogger):
+    """Hand unformatted LogRecords to a background thread ('queued' mode).
+
+    The handlers the logger would propagate to are captured when the
+    strategy is created and driven by a QueueListener thread. Records are
+    put on the queue with their arguments unformatted.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__(logger)
+        self.queue: "queue.Queue" = queue.Queue()
+        handlers = _effective_handlers(logger) or [logging.lastResort]
+        self.listener = QueueListener(
+            self.queue, *handlers, respect_handler_level=True
+        )
+        self.listener.start()
+
+    def _emit(self, level: int, msg: str, args: tuple, extra: dict):
+        record = self.logger.makeRecord(
+            self.logger.name, level, __file__, 0, msg, args, None, extra=extra
+        )
+        self.queue.put_nowait(record)
+
+    def close(self):
+        """Drain pending records and stop the background thread."""
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+
+def _effective_handlers(logger: logging.Logger) -> List[logging.Handler]:
+    """Handlers a record from logger would reach through propagation."""
+    handlers: List[logging.Handler] = []
+    current = logger
+    while current is not None:
+        handlers.extend(current.handlers)
+        if not current.propagate:
+            break
+        current = current.parent
+    return handlers
+
+
+def make_decision_logger(
+    mode: str,
+    logger: logging.Logger,
+    sample_rate: int = 100
+) -> DecisionLogger:
+    """Build the strategy for a TLEngine log_mode."""
+    if mode == 'all':
+        return DecisionLogger(logger)
+    if mode == 'off':
+        return NullDecisionLogger(logger)
+    if mode == 'sampled':
+        return SampledDecisionLogger(logger, sample_rate)
+    if mode == 'queued':
+        return QueuedDecisionLogger(logger)
+    raise ValueError(f"log_mode must be one of {LOG_MODES}, got {mode!r}")
@@ -0,0 +1,313 @@
+"""
+Durable Epistemic Hold storage.
+
+TLEngine keeps hold records in memory, so open holds are lost when the
+process restarts and reviewers can only scan them linearly. A hold store
+persists every hold and its resolution as the engine records them and
+answers indexed queries:
+
+    - by event_id
+    - by status (unresolved / resolved), trigger reason and time range,
+      in timestamp order, with keyset pagination
+
+SQLiteHoldStore is the stdlib backend. Writes are queued and applied by a
+background thread in batched transactions on a WAL-mode database, so the
+evaluating thread never waits for disk. Reads use their own connection
+per thread and run concurrently with the writer.
+
+Stores work with records as dicts in EpistemicHoldEvent.to_dict() form.
+
+Usage:
+    >>> from ternary_logic import TLEngine, SQLiteHoldStore
+    >>> store = SQLiteHoldStore('audit/holds.sqlite3')
+    >>> engine = TLEngine(
+    ...     proceed_threshold=YOUR_INSTITUTION_PROCEED_THRESHOLD,
+    ...     hold_threshold=YOUR_INSTITUTION_HOLD_THRESHOLD,
+    ...     hold_store=store
+    ... )
+    >>> page = store.page(resolved=False, limit=50)
+    >>> more = store.page(resolved=False, limit=50, after=page.next_cursor)
+"""
+
+import json
+import logging
+import queue
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+_EPOCH = datetime(1970, 1, 1)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS holds (
+        event_id TEXT PRIMARY KEY,
+        ts_us INTEGER NOT NULL,
+        trigger_reason TEXT NOT NULL,
+        resolved INTEGER NOT NULL DEFAULT 0,
+        resolution_action TEXT,
+        resolution_timestamp TEXT,
+        record TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS holds_by_time ON holds (ts_us, event_id)",
+    "CREATE INDEX IF NOT EXISTS holds_by_status "
+    "ON holds (resolved, ts_us, event_id)",
+    "CREATE INDEX IF NOT EXISTS holds_by_reason "
+    "ON holds (trigger_reason, ts_us, event_id)",
+)
+
+_INSERT = (
+    "INSERT OR IGNORE INTO holds (event_id, ts_us, trigger_reason, resolved, "
+    "resolution_action, resolution_timestamp, record) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_RESOLVE = (
+    "UPDATE holds SET resolved = 1, resolution_action = ?, "
+    "resolution_timestamp = ?, record = ? WHERE event_id = ?"
+)
+
+
+def _to_us(value: datetime) -> int:
+    """Naive UTC datetime -> integer microseconds since the epoch."""
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+@dataclass
+class HoldPage:
+    """One page of hold records.
+
+    Attributes:
+        records: Hold records (dicts), oldest first.
+        next_cursor: Pass as ``after`` to fetch the next page; None when
+                     this is the last page.
+    """
+    records: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+
+
+class SQLiteHoldStore:
+    """Hold store backed by a WAL-mode SQLite database.
+
+    Args:
+        path: Database file. Created with its schema if missing.
+        batch_size: Most queued writes applied in one transaction.
+        poll_interval: How long the writer waits for more work.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 1000,
+        poll_interval: float = 0.5
+    ):
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._local = threading.local()
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+        finally:
+            conn.close()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name='tl-hold-store', daemon=True
+        )
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # -- writes (queued) --------------------------------------------------
+
+    def add(self, event: Any):
+        """Queue a new hold event for insertion."""
+        self._queue.put(('add', event))
+
+    def resolve(self, event: Any):
+        """Queue the resolution of a hold event already added."""
+        self._queue.put(('resolve', event))
+
+    def flush(self):
+        """Block until every queued write is committed."""
+        self._queue.join()
+
+    def close(self):
+        """Commit queued writes and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _run(self):
+        conn = self._connect()
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    continue
+                batch = [item]
+                while item is not _STOP and len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    batch.append(item)
+                stop = batch[-1] is _STOP
+                writes = batch[:-1] if stop else batch
+                try:
+                    self._apply(conn, writes)
+                except Exception:
+                    logger.exception("Hold store batch failed")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _apply(conn: sqlite3.Connection, writes: List[Tuple[str, Any]]):
+        inserts = []
+        resolutions = []
+        for op, event in writes:
+            record = event.to_dict()
+            if op == 'add':
+                inserts.append((
+                    record['event_id'],
+                    _to_us(event.timestamp),
+                    record['trigger_reason'],
+                    1 if record['resolution_action'] else 0,
+                    record['resolution_action'],
+                    record['resolution_timestamp'],
+                    json.dumps(record),
+                ))
+            else:
+                resolutions.append((
+                    record['resolution_action'],
+                    record['resolution_timestamp'],
+                    json.dumps(record),
+                    record['event_id'],
+                ))
+        # Every resolution's insert is in this batch or an earlier one.
+        with conn:
+            if inserts:
+                conn.executemany(_INSERT, inserts)
+            if resolutions:
+                conn.executemany(_RESOLVE, resolutions)
+
+    # -- reads ------------------------------------------------------------
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def get(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """Return the committed record for event_id, or None."""
+        row = self._reader().execute(
+            "SELECT record FROM holds WHERE event_id = ?", (event_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count(self, resolved: Optional[bool] = None) -> int:
+        """Number of committed holds, optionally filtered by status."""
+        if resolved is None:
+            sql, args = "SELECT COUNT(*) FROM holds", ()
+        else:
+            sql, args = (
+                "SELECT COUNT(*) FROM holds WHERE resolved = ?",
+                (int(resolved),)
+            )
+        return self._reader().execute(sql, args).fetchone()[0]
+
+    def page(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        resolved: Optional[bool] = None,
+        trigger_reason: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> HoldPage:
+        """Return up to ``limit`` committed holds in timestamp order.
+
+        Pagination is keyset-based (timestamp, event_id), so the cost of a
+        page does not depend on how deep into the result it is.
+
+        Args:
+            limit: Page size.
+            after: next_cursor of the previous page.
+            resolved: Only unresolved (False) or resolved (True) holds.
+            trigger_reason: Only holds with exactly this trigger reason.
+            since / until: Only holds created in [since, until).
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+        clauses: List[str] = []
+        args: List[Any] = []
+        if resolved is not None:
+            clauses.append("resolved = ?")
+            args.append(int(resolved))
+        if trigger_reason is not None:
+            clauses.append("trigger_reason = ?")
+            args.append(trigger_reason)
+        if since is not None:
+            clauses.append("ts_us >= ?")
+            args.append(_to_us(since))
+        if until is not None:
+            clauses.append("ts_us < ?")
+            args.append(_to_us(until))
+        if after is not None:
+            ts_us, event_id = _decode_cursor(after)
+            clauses.append("(ts_us, event_id) > (?, ?)")
+            args.extend((ts_us, event_id))
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        rows = self._reader().execute(
+            f"SELECT ts_us, event_id, record FROM holds {where}"
+            f"ORDER BY ts_us, event_id LIMIT ?",
+            (*args, limit)
+        ).fetchall()
+        next_cursor = (
+            f"{rows[-1][0]}:{rows[-1][1]}" if len(rows) == limit else None
+        )
+        return HoldPage([json.loads(row[2]) for row in rows], next_cursor)
+
+    def iter_unresolved(self, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream every committed unresolved hold, oldest first."""
+        cursor = None
+        while True:
+            page = self.page(limit=page_size, after=cursor, resolved=False)
+            yield from page.records
+            cursor = page.next_cursor
+            if cursor is None:
+                return
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, str]:
+    ts_us, _, event_id = cursor.partition(':')
+    try:
+        return int(ts_us), event_id
+    except ValueError:
+        raise ValueError(f"Invalid hold page cursor: {cursor!r}") from None
@@ -0,0 +1,122 @@
+"""
+Epistemic Hold registry.
+
+Indexes EpistemicHoldEvent records so reviewer tooling never scans the
+full hold history:
+
+    - lookup and resolution by event_id: O(1)
+    - unresolved count and oldest unresolved hold: O(1)
+    - next hold to review (smallest distance_to_proceed): O(log n)
+
+The registry only reads event_id, uncertainty_metrics and
+resolution_action from the events it holds, and resolves them through
+their own resolve() method so the audit trail stays on the event.
+"""
+
+import heapq
+import itertools
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class HoldRegistry:
+    """Index of Epistemic Hold events with an ordered unresolved queue.
+
+    Unresolved holds are kept in arrival order (oldest first) and in a
+    min-heap keyed by distance_to_proceed. Resolved entries are dropped
+    from the heap lazily, when they surface at the top.
+    """
+
+    def __init__(self):
+        self._seq = itertools.count()
+        self._index: Dict[str, Tuple[int, Any]] = {}
+        self._unresolved: "OrderedDict[int, Any]" = OrderedDict()
+        self._by_distance: List[Tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._index
+
+    def add(self, event: Any):
+        """Register a new hold event."""
+        seq = next(self._seq)
+        # First registration wins, matching a front-to-back search.
+        self._index.setdefault(event.event_id, (seq, event))
+        if not event.resolution_action:
+            self._track_unresolved(seq, event)
+
+    def _track_unresolved(self, seq: int, event: Any):
+        self._unresolved[seq] = event
+        distance = event.uncertainty_metrics.get(
+            'distance_to_proceed', float('inf')
+        )
+        heapq.heappush(self._by_distance, (distance, seq))
+
+    def _compact(self):
+        """Drop stale heap entries once they outnumber live ones."""
+        if len(self._by_distance) > 2 * len(self._unresolved) + 64:
+            self._by_distance = [
+                entry for entry in self._by_distance
+                if entry[1] in self._unresolved
+            ]
+            heapq.heapify(self._by_distance)
+
+    def get(self, event_id: str) -> Optional[Any]:
+        """Return the event registered under event_id, or None."""
+        entry = self._index.get(event_id)
+        return entry[1] if entry else None
+
+    def resolve(self, event_id: str, action: str) -> Any:
+        """Resolve a hold with a documented action.
+
+        Raises:
+            KeyError: If no hold is registered under event_id.
+        """
+        seq, event = self._index[event_id]
+        event.resolve(action)
+        if event.resolution_action:
+            self._unresolved.pop(seq, None)
+            self._compact()
+        elif seq not in self._unresolved:
+            self._track_unresolved(seq, event)
+        return event
+
+    def discard(self, event_id: str) -> Optional[Any]:
+        """Remove an event from the registry entirely and return it."""
+        entry = self._index.pop(event_id, None)
+        if entry is None:
+            return None
+        self._unresolved.pop(entry[0], None)
+        return entry[1]
+
+    @property
+    def unresolved_count(self) -> int:
+        """Number of holds awaiting resolution."""
+        return len(self._unresolved)
+
+    def oldest_unresolved(self) -> Optional[Any]:
+        """Return the longest-waiting unresolved hold, or None."""
+        for event in self._unresolved.values():
+            return event
+        return None
+
+    def next_for_review(self) -> Optional[Any]:
+        """Return the unresolved hold closest to PROCEED, or None.
+
+        Holds with the smallest distance_to_proceed are the cheapest to
+        clear with additional evidence, so reviewers see them first.
+        """
+        heap = self._by_distance
+        while heap:
+            seq = heap[0][1]
+            event = self._unresolved.get(seq)
+            if event is not None:
+                return event
+            heapq.heappop(heap)
+        return None
+
+    def iter_unresolved(self) -> Iterator[Any]:
+        """Iterate unresolved holds from oldest to newest."""
+        return iter(list(self._unresolved.values()))
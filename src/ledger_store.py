@@ -0,0 +1,461 @@
+"""
+Durable append-only ledger storage.
+
+The example ImmutableLedger appends governance entries to an in-memory
+list, so a crash loses every entry, including ones whose decisions have
+already been acted on. That breaks write-before-act. DurableLedger keeps
+the entries on disk, and commit() returns only once its entry is durable.
+
+Layout: a directory of segment files, ledger-00000000.tll,
+ledger-00000001.tll, ... Each starts with a 16-byte header:
+
+    magic b'TLLG' | format version (u8) | 3 pad bytes | first sequence (u64)
+
+followed by records:
+
+    payload length (u32) | CRC-32 of payload (u32) | payload
+
+The payload is the entry as compact UTF-8 JSON. When the active segment
+reaches segment_bytes it is fsynced, sealed and never written again.
+Sealed segments are read through mmap.
+
+Group commit: every committer writes its record straight away, then waits
+until a sync covers it. The first waiter becomes the leader. It may sleep
+for group_commit_window seconds so more writers can join. It then runs one
+fdatasync for everything written so far and wakes every committer it
+covered. Committers that arrive during a sync queue behind it and are
+covered by the next one, so under concurrency one fsync serves many
+commits even with a zero window.
+
+On open, a torn tail in the last segment (a partial record or a CRC
+mismatch after a crash mid-write) is truncated, since no commit returned
+for it. A bad record in a sealed segment is corruption and raises
+ValueError when read.
+
+One process writes a ledger directory at a time. A DurableLedger is
+safe to share between threads.
+
+Usage:
+    >>> from ternary_logic import DurableLedger
+    >>> store = DurableLedger('audit/ledger', group_commit_window=0.002)
+    >>> seq = store.commit(entry)      # returns once entry is on disk
+    >>> for entry in store.iter_entries():
+    ...     ...
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import (
+    Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+)
+
+MAGIC = b'TLLG'
+VERSION = 1
+SUFFIX = '.tll'
+
+_SEGMENT_HEADER = struct.Struct('<4sB3xQ')
+_RECORD_HEADER = struct.Struct('<II')
+
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+_write = os.write
+
+_encode_json = json.JSONEncoder(
+    separators=(',', ':'), ensure_ascii=False
+).encode
+_decode_json = json.JSONDecoder().decode
+
+
+def _fsync_directory(path: Path):
+    """Make a newly created file's directory entry durable."""
+    if os.name == 'nt':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _scan(data, start: int, verify: bool = True) -> Tuple[int, int, int]:
+    """(record count, end of the last valid record, offset of the last
+    record's payload or -1) for the records in data from start. Stops at
+    the first partial record, or CRC mismatch when verify is set."""
+    count, last = 0, -1
+    pos, end = start, len(data)
+    header = _RECORD_HEADER.size
+    while pos + header <= end:
+        length, crc = _RECORD_HEADER.unpack_from(data, pos)
+        body = pos + header
+        if body + length > end or (
+            verify and zlib.crc32(data[body:body + length]) != crc
+        ):
+            break
+        count += 1
+        last = pos
+        pos = body + length
+    return count, pos, last
+
+
+class _Segment:
+    __slots__ = ('path', 'first_seq', 'count', 'size')
+
+    def __init__(self, path: Path, first_seq: int, count: int, size: int):
+        self.path = path
+        self.first_seq = first_seq
+        self.count = count
+        self.size = size
+
+
+class SegmentSpan(NamedTuple):
+    """The readable part of one segment file.
+
+    Attributes:
+        path: Segment file.
+        first_seq: Sequence number of its first record.
+        count: Records to read.
+        size: Bytes written when the span was taken.
+        sealed: True when the file is no longer written (read via mmap).
+    """
+    path: str
+    first_seq: int
+    count: int
+    size: int
+    sealed: bool
+
+
+def read_payloads(
+    spans: Sequence[SegmentSpan], start: int = 0, stop: Optional[int] = None
+) -> Iterator[bytes]:
+    """Stream raw payloads for sequences [start, stop) from segment spans.
+
+    Sealed segments are mapped with mmap; an active one is read up to the
+    span's size. Records before start are skipped by length without
+    checking their CRC.
+
+    Raises:
+        ValueError: If a record read has a bad length or CRC.
+    """
+    for span in spans:
+        end = span.first_seq + span.count
+        if stop is not None:
+            end = min(end, stop)
+        if span.count <= 0 or end <= start:
+            continue
+        skip = max(start - span.first_seq, 0)
+        with open(span.path, 'rb') as f:
+            if span.sealed:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    yield from _payloads(
+                        view, span.path, skip, end - span.first_seq
+                    )
+            else:
+                yield from _payloads(
+                    f.read(span.size), span.path, skip, end - span.first_seq
+                )
+        if stop is not None and end >= stop:
+            return
+
+
+def _payloads(data, path: str, skip: int, count: int) -> Iterator[bytes]:
+    """Payloads of records skip..count-1 of one segment's data."""
+    pos = _SEGMENT_HEADER.size
+    header = _RECORD_HEADER.size
+    for _ in range(skip):
+        pos += header + _RECORD_HEADER.unpack_from(data, pos)[0]
+    for _ in range(skip, count):
+        if pos + header > len(data):
+            raise ValueError(f"Truncated record in ledger segment {path}")
+        length, crc = _RECORD_HEADER.unpack_from(data, pos)
+        body = pos + header
+        payload = data[body:body + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            raise ValueError(
+                f"Corrupt record in ledger segment {path} at byte {pos}"
+            )
+        pos = body + length
+        yield payload
+
+
+class DurableLedger:
+    """File-backed append-only ledger with group-commit fsync.
+
+    Args:
+        directory: Segment directory. Created if missing; existing
+                   segments are recovered and appended to.
+        segment_bytes: Seal the active segment once it reaches this size.
+        group_commit_window: Seconds a sync leader waits for more
+                             committers before syncing. 0 syncs at once;
+                             concurrent commits still share syncs.
+
+    Attributes:
+        sync_count: Number of data syncs issued (for monitoring group
+                    commit efficiency: commits / sync_count).
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 * 1024 * 1024,
+        group_commit_window: float = 0.0
+    ):
+        if segment_bytes <= _SEGMENT_HEADER.size:
+            raise ValueError(
+                f"segment_bytes must exceed {_SEGMENT_HEADER.size}, "
+                f"got {segment_bytes}"
+            )
+        if group_commit_window < 0:
+            raise ValueError(
+                f"group_commit_window must be non-negative, "
+                f"got {group_commit_window}"
+            )
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.group_commit_window = group_commit_window
+        self.sync_count = 0
+
+        self._cond = threading.Condition()
+        self._segments: List[_Segment] = []
+        self._fd: Optional[int] = None
+        self._written = 0     # sequences below this are written
+        self._durable = 0     # sequences below this are synced
+        self._syncing = False
+        self._last: Optional[bytes] = None
+        self._failed: Optional[OSError] = None
+        self._recover()
+
+    # -- opening ------------------------------------------------------------
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"ledger-{number:08d}{SUFFIX}"
+
+    def _recover(self):
+        """Rebuild state from segments on disk. Sealed segments are walked
+        by record length only; the last one is CRC-checked and any torn
+        tail truncated."""
+        paths = sorted(self.directory.glob(f"ledger-*{SUFFIX}"))
+        for i, path in enumerate(paths):
+            tail = i == len(paths) - 1
+            size = path.stat().st_size
+            if tail and size < _SEGMENT_HEADER.size:
+                path.unlink()  # crashed while creating it; nothing committed
+                break
+            with open(path, 'r+b' if tail else 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    first_seq = self._read_header(view, path)
+                    count, end, last = _scan(
+                        view, _SEGMENT_HEADER.size, verify=tail
+                    )
+                    if last >= 0:
+                        length = _RECORD_HEADER.unpack_from(view, last)[0]
+                        body = last + _RECORD_HEADER.size
+                        self._last = view[body:body + length]
+                if end != size:
+                    if not tail:
+                        raise ValueError(
+                            f"Corrupt record in sealed ledger segment {path} "
+                            f"at byte {end}"
+                        )
+                    f.truncate(end)
+                    os.fsync(f.fileno())
+            if first_seq != self._written:
+                raise ValueError(
+                    f"Ledger segment {path} starts at sequence {first_seq}, "
+                    f"expected {self._written}"
+                )
+            self._segments.append(_Segment(path, first_seq, count, end))
+            self._written += count
+        self._durable = self._written
+        if self._segments and self._segments[-1].size < self.segment_bytes:
+            self._fd = os.open(
+                self._segments[-1].path, os.O_WRONLY | os.O_APPEND
+            )
+
+    @staticmethod
+    def _read_header(data, path: Path) -> int:
+        if len(data) < _SEGMENT_HEADER.size:
+            raise ValueError(f"Truncated ledger segment header in {path}")
+        magic, version, first_seq = _SEGMENT_HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"Not a TL ledger segment: {path}")
+        if version != VERSION:
+            raise ValueError(
+                f"Unsupported TL ledger format version {version} in {path} "
+                f"(this build reads version {VERSION})"
+            )
+        return first_seq
+
+    def _open_segment(self):
+        """Start a new active segment. Caller holds the lock, with no sync
+        in flight."""
+        if self._fd is not None:
+            _fdatasync(self._fd)
+            self.sync_count += 1
+            os.close(self._fd)
+            self._durable = self._written
+            self._cond.notify_all()
+        number = (
+            int(self._segments[-1].path.stem.rsplit('-', 1)[1]) + 1
+            if self._segments else 0
+        )
+        path = self._segment_path(number)
+        fd = os.open(
+            path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_EXCL, 0o644
+        )
+        os.write(fd, _SEGMENT_HEADER.pack(MAGIC, VERSION, self._written))
+        os.fsync(fd)
+        _fsync_directory(self.directory)
+        self._fd = fd
+        self._segments.append(
+            _Segment(path, self._written, 0, _SEGMENT_HEADER.size)
+        )
+
+    # -- writes -------------------------------------------------------------
+
+    def commit(self, entry: Dict[str, Any]) -> int:
+        """Append an entry and wait until it is durable.
+
+        Returns:
+            The entry's sequence number (0-based, dense).
+        """
+        payload = _encode_json(entry).encode('utf-8')
+        record = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._cond:
+            while self._fd is None or (
+                self._segments[-1].size + len(record) > self.segment_bytes
+                and self._segments[-1].count
+            ):
+                if self._syncing:
+                    self._cond.wait()
+                else:
+                    self._open_segment()
+            segment = self._segments[-1]
+            self._append(segment, record)
+            segment.size += len(record)
+            segment.count += 1
+            seq = self._written
+            self._written += 1
+            self._last = payload
+            self._wait_durable(seq)
+        return seq
+
+    def _append(self, segment: "_Segment", record: bytes):
+        """Write a whole record at the end of the active segment. Caller
+        holds the lock.
+
+        A failed or short write is cut back to the segment's last complete
+        record, so no later commit lands behind partial bytes that
+        recovery would truncate it with. If that fails too, the ledger
+        refuses further commits.
+        """
+        if self._failed is not None:
+            raise OSError(
+                f"Ledger {self.directory} failed an earlier write and "
+                f"accepts no further commits"
+            ) from self._failed
+        view = memoryview(record)
+        try:
+            while view:
+                view = view[_write(self._fd, view):]
+        except OSError as exc:
+            try:
+                os.ftruncate(self._fd, segment.size)
+            except OSError as truncate_error:
+                self._failed = truncate_error
+            raise
+
+    def _wait_durable(self, seq: int):
+        """Block until seq is synced, leading a sync if none is running.
+        Caller holds the lock."""
+        cond = self._cond
+        while self._durable <= seq:
+            if self._syncing:
+                cond.wait()
+                continue
+            self._syncing = True
+            try:
+                if self.group_commit_window:
+                    deadline = time.monotonic() + self.group_commit_window
+                    remaining = self.group_commit_window
+                    while remaining > 0:
+                        cond.wait(remaining)
+                        remaining = deadline - time.monotonic()
+                target, fd = self._written, self._fd
+                cond.release()
+                try:
+                    _fdatasync(fd)
+                finally:
+                    cond.acquire()
+                self.sync_count += 1
+                self._durable = max(self._durable, target)
+            finally:
+                self._syncing = False
+                cond.notify_all()
+
+    def close(self):
+        """Sync and close the active segment."""
+        with self._cond:
+            while self._syncing:
+                self._cond.wait()
+            if self._fd is not None:
+                _fdatasync(self._fd)
+                os.close(self._fd)
+                self._fd = None
+                self._durable = self._written
+
+    # -- reads --------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._written
+
+    @property
+    def last_entry(self) -> Optional[Dict[str, Any]]:
+        """The most recently committed entry, or None when empty."""
+        last = self._last
+        return _decode_json(last.decode('utf-8')) if last is not None else None
+
+    @property
+    def segments(self) -> List[Path]:
+        """Segment files, oldest first."""
+        with self._cond:
+            return [s.path for s in self._segments]
+
+    def segment_spans(self) -> List['SegmentSpan']:
+        """Durable contents of each segment, oldest first.
+
+        The spans are plain data: read_payloads() can read them in another
+        process without opening (and recovering) the ledger there.
+        """
+        with self._cond:
+            durable = self._durable
+            active = self._segments[-1] if self._fd is not None else None
+            return [
+                SegmentSpan(
+                    str(s.path), s.first_seq,
+                    max(min(s.count, durable - s.first_seq), 0), s.size,
+                    s is not active
+                )
+                for s in self._segments
+            ]
+
+    def iter_payloads(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Stream raw entry payloads for sequences [start, stop).
+
+        Only entries durable when iteration starts are returned.
+        """
+        return read_payloads(self.segment_spans(), start, stop)
+
+    def iter_entries(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream committed entries (dicts) for sequences [start, stop)."""
+        for payload in self.iter_payloads(start, stop):
+            yield _decode_json(payload.decode('utf-8'))
@@ -0,0 +1,185 @@
+"""
+Incremental governance ledger summaries.
+
+The example ImmutableLedger.get_summary() recounted PROCEED /
+EPISTEMIC_HOLD / REFUSE by scanning every entry three times, so a
+dashboard polling it slowed down as the ledger grew. LedgerSummary is
+updated once per commit and answers from running state:
+
+    - per-state counters and the total
+    - the latest merkleRoot
+    - the earliest and latest committedAt timestamps
+    - per-state counts in fixed time buckets (one minute by default)
+
+Recording an entry and reading the summary are O(1). A bucket range
+query costs O(log B + k) for B buckets and k returned. Entries usually
+arrive in time order, so new buckets are appended; a late entry for an
+earlier bucket is inserted in place.
+
+Usage:
+    >>> from ternary_logic import LedgerSummary
+    >>> summary = LedgerSummary(genesis_hash=genesis, bucket_seconds=60)
+    >>> summary.add(entry)                       # on every commit
+    >>> summary.to_dict()['states']['EPISTEMIC_HOLD']
+    >>> summary.bucket_counts(since=datetime.now(timezone.utc) - hour)
+"""
+
+import bisect
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+_STATE_LABELS = ('PROCEED', 'EPISTEMIC_HOLD', 'REFUSE')
+
+TimeLike = Union[datetime, str]
+
+
+def _epoch_seconds(value: TimeLike) -> float:
+    """Seconds since the epoch of an ISO string or datetime; naive values
+    are taken as UTC."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class LedgerSummary:
+    """Running summary of committed ledger entries.
+
+    Args:
+        genesis_hash: Reported as latestMerkleRoot before any entry.
+        bucket_seconds: Width of the time buckets.
+        max_buckets: Keep at most this many of the most recent buckets
+                     (None keeps all). Totals are unaffected.
+
+    Raises:
+        ValueError: If bucket_seconds or max_buckets is not positive.
+    """
+
+    def __init__(
+        self,
+        genesis_hash: Optional[str] = None,
+        bucket_seconds: int = 60,
+        max_buckets: Optional[int] = None
+    ):
+        if bucket_seconds <= 0:
+            raise ValueError(
+                f"bucket_seconds must be positive, got {bucket_seconds}"
+            )
+        if max_buckets is not None and max_buckets <= 0:
+            raise ValueError(
+                f"max_buckets must be positive, got {max_buckets}"
+            )
+        self.bucket_seconds = bucket_seconds
+        self.max_buckets = max_buckets
+        self._lock = threading.Lock()
+        self._counts = [0, 0, 0]
+        self._latest_root = genesis_hash
+        # (epoch seconds, committedAt string) of the earliest and latest
+        self._first: Optional[Tuple[float, str]] = None
+        self._last: Optional[Tuple[float, str]] = None
+        self._bucket_starts: List[int] = []
+        self._buckets: Dict[int, List[int]] = {}
+
+    def add(self, entry: Dict[str, Any]):
+        """Count one committed entry (currentState, merkleRoot,
+        committedAt).
+
+        Raises:
+            ValueError: If currentState is not +1, 0 or -1.
+        """
+        state = entry["currentState"]
+        if state not in (1, 0, -1):
+            raise ValueError(f"Unknown ledger entry state: {state!r}")
+        slot = 1 - state
+        committed_at = entry["committedAt"]
+        seconds = _epoch_seconds(committed_at)
+        width = self.bucket_seconds
+        start = int(seconds // width) * width
+        with self._lock:
+            self._counts[slot] += 1
+            self._latest_root = entry["merkleRoot"]
+            if self._first is None or seconds < self._first[0]:
+                self._first = (seconds, committed_at)
+            if self._last is None or seconds >= self._last[0]:
+                self._last = (seconds, committed_at)
+            bucket = self._buckets.get(start)
+            if bucket is None:
+                bucket = self._new_bucket(start)
+                if bucket is None:
+                    return
+            bucket[slot] += 1
+
+    def _new_bucket(self, start: int) -> Optional[List[int]]:
+        """Create a bucket, evicting the oldest beyond max_buckets. None
+        when the bucket would itself be evicted at once."""
+        starts = self._bucket_starts
+        if (self.max_buckets is not None and len(starts) >= self.max_buckets
+                and start < starts[0]):
+            return None
+        if not starts or start > starts[-1]:
+            starts.append(start)
+        else:
+            bisect.insort(starts, start)
+        bucket = self._buckets[start] = [0, 0, 0]
+        if self.max_buckets is not None and len(starts) > self.max_buckets:
+            del self._buckets[starts.pop(0)]
+        return bucket
+
+    @property
+    def total(self) -> int:
+        return sum(self._counts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary in the example ledgers' get_summary() format, plus
+        firstCommittedAt / lastCommittedAt (None when empty)."""
+        with self._lock:
+            counts = list(self._counts)
+            root = self._latest_root
+            first, last = self._first, self._last
+        return {
+            "totalEntries": sum(counts),
+            "latestMerkleRoot": root,
+            "states": dict(zip(_STATE_LABELS, counts)),
+            "firstCommittedAt": first[1] if first else None,
+            "lastCommittedAt": last[1] if last else None,
+        }
+
+    def bucket_counts(
+        self,
+        since: Optional[TimeLike] = None,
+        until: Optional[TimeLike] = None
+    ) -> List[Dict[str, Any]]:
+        """Per-state counts for each non-empty bucket, oldest first.
+
+        Args:
+            since: Only buckets containing or after this time.
+            until: Only buckets starting before this time.
+
+        Returns:
+            Dicts with bucketStart (ISO UTC), totalEntries and one count
+            per state label.
+        """
+        width = self.bucket_seconds
+        with self._lock:
+            starts = self._bucket_starts
+            lo = 0 if since is None else bisect.bisect_left(
+                starts, int(_epoch_seconds(since) // width) * width
+            )
+            hi = len(starts) if until is None else bisect.bisect_left(
+                starts, _epoch_seconds(until)
+            )
+            selected = [
+                (start, list(self._buckets[start])) for start in starts[lo:hi]
+            ]
+        return [
+            {
+                "bucketStart": datetime.fromtimestamp(
+                    start, timezone.utc
+                ).isoformat(),
+                "totalEntries": sum(counts),
+                **dict(zip(_STATE_LABELS, counts)),
+            }
+            for start, counts in selected
+        ]
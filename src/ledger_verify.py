@@ -0,0 +1,499 @@
+"""
+Checkpointed, parallel verification of governance ledger hash chains.
+
+Every ledger entry written by commit_log_entry carries:
+
+    logHash      sha256 of the RFC 8785 canonical decision payload
+    previousHash merkleRoot of the entry before it (the genesis hash for
+                 the first entry)
+    merkleRoot   sha256(previousHash + logHash)
+
+The chain is serial to build but not to check. Each entry stores its
+predecessor's root, so one span of entries can be checked on its own:
+recompute logHash from the canonical payload, recompute merkleRoot, and
+match previousHash against the previous entry in the span. Spans are then
+stitched together by comparing each span's first previousHash with the
+last merkleRoot of the span before it.
+
+Stitching proves the spans agree with each other, not that they are the
+ledger that was committed. A rewritten ledger can be re-chained end to
+end. CheckpointLog closes that gap. At commit time it signs
+(sequence, merkleRoot) every N entries with HMAC-SHA256, under a key the
+ledger writer holds (in production, an HSM). ChainVerifier checks those
+signatures and checks that the entry at each checkpoint still has the
+signed root. It also reports a ledger that ends before its last
+checkpoint (truncation) and checkpoints missing from the every-N
+sequence.
+
+ChainVerifier splits the ledger at checkpoints, and further into spans
+of at most span_size entries. It checks the spans across a process pool,
+so a full audit is bound by cores rather than one thread. Workers read
+DurableLedger segments themselves, so entries are not shipped between
+processes.
+
+Usage:
+    >>> from ternary_logic import CheckpointLog, ChainVerifier
+    >>> checkpoints = CheckpointLog(key, interval=10_000,
+    ...                             path='audit/checkpoints.ndjson')
+    >>> # at commit time, after appending entry number seq:
+    >>> checkpoints.record(seq, entry)
+    >>> report = ChainVerifier(genesis_hash, checkpoints).verify(store)
+    >>> report.ok, report.first_break
+"""
+
+import hashlib
+import hmac
+import json
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+)
+
+from .canonical_json import canonical_digest, canonicalize
+from .ledger_store import DurableLedger, SegmentSpan, read_payloads
+
+_decode_json = json.JSONDecoder().decode
+
+
+def _log_payload(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "logId": entry["logId"],
+        "state": entry["stateLabel"],
+        "stateValue": entry["currentState"],
+        "confidence": entry["confidence"],
+        "reasoning": entry["reasoning"],
+        "committedAt": entry["committedAt"]
+    }
+
+
+def canonical_log_payload(entry: Dict[str, Any]) -> str:
+    """The RFC 8785 canonical decision payload whose sha256 is the
+    entry's logHash."""
+    return canonicalize(_log_payload(entry))
+
+
+def entry_log_hash(entry: Dict[str, Any]) -> str:
+    """Recompute an entry's logHash from its canonical payload."""
+    return canonical_digest(_log_payload(entry)).hexdigest()
+
+
+def chain_root(previous_hash: str, log_hash: str) -> str:
+    """merkleRoot of an entry given its predecessor's root."""
+    return hashlib.sha256(
+        (previous_hash + log_hash).encode("utf-8")
+    ).hexdigest()
+
+
+# -- checkpoints ------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ChainCheckpoint:
+    """A signed (sequence, merkleRoot) pair.
+
+    Attributes:
+        sequence: Position of the entry in the ledger (0-based).
+        root: That entry's merkleRoot.
+        signature: Hex HMAC-SHA256 of "sequence:root".
+    """
+    sequence: int
+    root: str
+    signature: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'sequence': self.sequence,
+            'root': self.root,
+            'signature': self.signature,
+        }
+
+
+def _sign(key: bytes, sequence: int, root: str) -> str:
+    return hmac.new(
+        key, f"{sequence}:{root}".encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+
+class CheckpointLog:
+    """Signed checkpoint roots, recorded every interval entries.
+
+    Args:
+        key: HMAC key. Verifiers need the same key.
+        interval: Checkpoint after every interval entries.
+        path: Optional NDJSON file. Existing checkpoints are loaded from
+              it and new ones appended and fsynced.
+
+    Raises:
+        ValueError: If interval is not positive.
+    """
+
+    def __init__(self, key: bytes, interval: int = 10_000,
+                 path: Optional[str] = None):
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        self.key = key
+        self.interval = interval
+        self.path = path
+        self.checkpoints: List[ChainCheckpoint] = []
+        if path is not None and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.checkpoints = [
+                    ChainCheckpoint(**json.loads(line)) for line in f
+                    if line.strip()
+                ]
+
+    def record(self, sequence: int, entry: Dict[str, Any]
+               ) -> Optional[ChainCheckpoint]:
+        """Call after committing entry at position sequence. Signs a
+        checkpoint when it completes an interval and returns it."""
+        if (sequence + 1) % self.interval:
+            return None
+        root = entry["merkleRoot"]
+        checkpoint = ChainCheckpoint(
+            sequence, root, _sign(self.key, sequence, root)
+        )
+        if self.path is not None:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(checkpoint.to_dict()) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        self.checkpoints.append(checkpoint)
+        return checkpoint
+
+    def is_valid(self, checkpoint: ChainCheckpoint) -> bool:
+        """True when the checkpoint's signature matches under this key."""
+        return hmac.compare_digest(
+            checkpoint.signature,
+            _sign(self.key, checkpoint.sequence, checkpoint.root)
+        )
+
+
+# -- reports ----------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ChainIssue:
+    """One verification failure.
+
+    Attributes:
+        sequence: Ledger position it was found at.
+        kind: 'log_hash' (payload does not hash to logHash), 'root'
+              (merkleRoot != sha256(previousHash + logHash)), 'link'
+              (previousHash != the previous merkleRoot: an entry was
+              removed, inserted or reordered), 'malformed' (entry missing
+              fields or not canonicalizable), 'checkpoint' (root differs
+              from the signed one), 'signature' (checkpoint signature
+              invalid), 'checkpoint_gap' (checkpoints missing or out of
+              order) or 'truncated' (the ledger ends before a checkpoint).
+        detail: Human-readable description.
+    """
+    sequence: int
+    kind: str
+    detail: str
+
+
+@dataclass
+class ChainReport:
+    """Outcome of a chain verification.
+
+    Attributes:
+        entries_checked: Entries read.
+        checkpoints_checked: Checkpoints whose signature and root were
+                             checked.
+        issues: Failures in ledger order. At most max_issues per span are
+                kept; issue_count counts them all.
+        issue_count: Total failures found.
+    """
+    entries_checked: int = 0
+    checkpoints_checked: int = 0
+    issues: List[ChainIssue] = field(default_factory=list)
+    issue_count: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.issue_count == 0
+
+    @property
+    def first_break(self) -> Optional[ChainIssue]:
+        """The earliest failure, or None when the chain verified."""
+        return self.issues[0] if self.issues else None
+
+
+# -- span checks (worker side) ----------------------------------------------
+
+@dataclass
+class _Span:
+    """One slice of the ledger, as shipped to a worker."""
+    start: int
+    stop: int
+    checkpoints: Dict[int, str]
+    entries: Optional[List[Dict[str, Any]]] = None
+    segments: Optional[List[SegmentSpan]] = None
+
+
+def _span_entries(span: _Span) -> Iterator[Dict[str, Any]]:
+    if span.entries is not None:
+        return iter(span.entries)
+    return (
+        _decode_json(p.decode('utf-8'))
+        for p in read_payloads(span.segments, span.start, span.stop)
+    )
+
+
+def _verify_span(
+    span: _Span,
+    log_hash: Callable[[Dict[str, Any]], str],
+    max_issues: int
+) -> Dict[str, Any]:
+    """Check one span in a worker process."""
+    issues: List[ChainIssue] = []
+    issue_count = 0
+
+    def report(sequence, kind, detail):
+        nonlocal issue_count
+        issue_count += 1
+        if len(issues) < max_issues:
+            issues.append(ChainIssue(sequence, kind, detail))
+
+    sha256 = hashlib.sha256
+    first_previous = last_root = None
+    previous_root = None
+    sequence = span.start
+    for entry in _span_entries(span):
+        try:
+            stored_log_hash = entry["logHash"]
+            previous = entry["previousHash"]
+            root = entry["merkleRoot"]
+            computed = log_hash(entry)
+        except (KeyError, TypeError, ValueError) as exc:
+            report(sequence, 'malformed', (
+                f"Entry missing field {exc}" if isinstance(exc, KeyError)
+                else f"Entry payload cannot be canonicalized: {exc}"
+            ))
+            previous_root = None
+            sequence += 1
+            continue
+        if sequence == span.start:
+            first_previous = previous
+        elif previous_root is not None and previous != previous_root:
+            report(
+                sequence, 'link',
+                f"previousHash {previous[:16]}... does not match the "
+                f"preceding merkleRoot {previous_root[:16]}..."
+            )
+        if computed != stored_log_hash:
+            report(
+                sequence, 'log_hash',
+                f"logHash {stored_log_hash[:16]}... but payload hashes to "
+                f"{computed[:16]}..."
+            )
+        linked = sha256((previous + stored_log_hash).encode("utf-8"))
+        if linked.hexdigest() != root:
+            report(
+                sequence, 'root',
+                "merkleRoot is not sha256(previousHash + logHash)"
+            )
+        signed = span.checkpoints.get(sequence)
+        if signed is not None and signed != root:
+            report(
+                sequence, 'checkpoint',
+                f"merkleRoot {root[:16]}... differs from signed checkpoint "
+                f"root {signed[:16]}..."
+            )
+        previous_root = last_root = root
+        sequence += 1
+    return {
+        'start': span.start,
+        'count': sequence - span.start,
+        'first_previous': first_previous,
+        'last_root': last_root,
+        'issues': issues,
+        'issue_count': issue_count,
+    }
+
+
+# -- verifier ---------------------------------------------------------------
+
+LedgerSource = Union[DurableLedger, Sequence[Dict[str, Any]]]
+
+
+class ChainVerifier:
+    """Verify a ledger hash chain in parallel spans.
+
+    Args:
+        genesis_hash: previousHash expected on the first entry.
+        checkpoints: Signed checkpoints to check the chain against. Without
+                     them only internal consistency is verified.
+        span_size: Most entries per worker task.
+        max_workers: Worker processes. Default: os.cpu_count(). With 1, or
+                     when the ledger fits in one span, spans are checked
+                     in this process.
+        executor: Optional executor to use instead of a private
+                  ProcessPoolExecutor.
+        log_hash: Function recomputing an entry's logHash. Must be
+                  picklable (a module-level function) to run in workers.
+        max_issues: Most issues kept per span.
+
+    Raises:
+        ValueError: If span_size is not positive.
+    """
+
+    def __init__(
+        self,
+        genesis_hash: str,
+        checkpoints: Optional[CheckpointLog] = None,
+        span_size: int = 250_000,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        log_hash: Callable[[Dict[str, Any]], str] = entry_log_hash,
+        max_issues: int = 100
+    ):
+        if span_size <= 0:
+            raise ValueError(f"span_size must be positive, got {span_size}")
+        self.genesis_hash = genesis_hash
+        self.checkpoints = checkpoints
+        self.span_size = span_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = executor
+        self.log_hash = log_hash
+        self.max_issues = max_issues
+
+    def verify(self, source: LedgerSource) -> ChainReport:
+        """Verify a DurableLedger or an in-memory sequence of entries."""
+        n = len(source)
+        report = ChainReport()
+        signed = self._check_checkpoints(n, report)
+        spans = self._spans(source, n, signed)
+
+        previous_root = self.genesis_hash
+        if self.executor is not None:
+            parts = self._map(self.executor, spans)
+            previous_root = self._merge_all(parts, previous_root, report)
+        elif self.max_workers == 1 or n <= self.span_size:
+            parts = (
+                _verify_span(s, self.log_hash, self.max_issues) for s in spans
+            )
+            previous_root = self._merge_all(parts, previous_root, report)
+        else:
+            with ProcessPoolExecutor(self.max_workers) as pool:
+                previous_root = self._merge_all(
+                    self._map(pool, spans), previous_root, report
+                )
+        report.issues.sort(key=lambda issue: issue.sequence)
+        return report
+
+    def _check_checkpoints(
+        self, n: int, report: ChainReport
+    ) -> Dict[int, str]:
+        """Validate checkpoint signatures and sequence; return the signed
+        roots to check against entries."""
+        signed: Dict[int, str] = {}
+        if self.checkpoints is None:
+            return signed
+        interval = self.checkpoints.interval
+        expected = interval - 1
+        for checkpoint in self.checkpoints.checkpoints:
+            sequence = checkpoint.sequence
+            if not self.checkpoints.is_valid(checkpoint):
+                self._add(report, ChainIssue(
+                    sequence, 'signature',
+                    f"Checkpoint at {sequence} has an invalid signature"
+                ))
+                continue
+            if sequence != expected:
+                self._add(report, ChainIssue(
+                    min(sequence, expected), 'checkpoint_gap',
+                    f"Expected a checkpoint at {expected}, found {sequence}"
+                ))
+            expected = max(expected, sequence) + interval
+            if sequence >= n:
+                last_signed = max(
+                    c.sequence for c in self.checkpoints.checkpoints
+                )
+                self._add(report, ChainIssue(
+                    n, 'truncated',
+                    f"Ledger has {n} entries but a checkpoint was signed "
+                    f"at entry {last_signed}"
+                ))
+                break
+            signed[sequence] = checkpoint.root
+            report.checkpoints_checked += 1
+        return signed
+
+    def _spans(
+        self, source: LedgerSource, n: int, signed: Dict[int, str]
+    ) -> Iterator[_Span]:
+        """Cut [0, n) after every checkpoint and every span_size entries."""
+        cuts = sorted(
+            {s + 1 for s in signed}
+            | set(range(self.span_size, n, self.span_size))
+            | {n}
+        )
+        segments = (
+            source.segment_spans() if isinstance(source, DurableLedger)
+            else None
+        )
+        start = 0
+        for stop in cuts:
+            if stop <= start:
+                continue
+            yield _Span(
+                start=start, stop=stop,
+                checkpoints={
+                    s: root for s, root in signed.items()
+                    if start <= s < stop
+                },
+                entries=(
+                    list(source[start:stop]) if segments is None else None
+                ),
+                segments=segments,
+            )
+            start = stop
+
+    def _map(
+        self, executor: Executor, spans: Iterable[_Span]
+    ) -> Iterator[Dict[str, Any]]:
+        """Submit spans with bounded look-ahead; yield results in order."""
+        pending: deque = deque()
+        for span in spans:
+            pending.append(executor.submit(
+                _verify_span, span, self.log_hash, self.max_issues
+            ))
+            if len(pending) >= 2 * self.max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def _merge_all(
+        self,
+        parts: Iterable[Dict[str, Any]],
+        previous_root: Optional[str],
+        report: ChainReport
+    ) -> Optional[str]:
+        """Stitch span results in order: each span's first previousHash
+        must be the previous span's last merkleRoot."""
+        for part in parts:
+            if part['count']:
+                first = part['first_previous']
+                if (first is not None and previous_root is not None
+                        and first != previous_root):
+                    expected = (
+                        "the genesis hash" if part['start'] == 0
+                        else f"the preceding merkleRoot {previous_root[:16]}..."
+                    )
+                    self._add(report, ChainIssue(
+                        part['start'], 'link',
+                        f"previousHash {first[:16]}... does not match "
+                        f"{expected}"
+                    ))
+                previous_root = part['last_root']
+            report.entries_checked += part['count']
+            report.issues.extend(part['issues'])
+            report.issue_count += part['issue_count']
+        return previous_root
+
+    @staticmethod
+    def _add(report: ChainReport, issue: ChainIssue):
+        report.issues.append(issue)
+        report.issue_count += 1
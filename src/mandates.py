@@ -0,0 +1,388 @@
+"""
+Mandate registry.
+
+verify_mandate checks a record against a mandate: a named list of binary
+checks, every one of which must pass. A failure forces an Epistemic Hold
+regardless of confidence. Mandates are declared as data and registered
+under a name, so jurisdiction-specific variants
+('sustainable_capital.eu', 'economic_rights.uk', ...) are added without
+touching the engine.
+
+Each check is compiled twice when the mandate is declared:
+
+    - into a Python predicate over one record (a dict), used by
+      verify_mandate;
+    - into a NumPy predicate over a column, used by verify_mandate_batch
+      to check millions of records (a DataFrame, a structured array or a
+      mapping of columns) in one pass per check.
+
+Both give the same answer for the same values. A record passes a check
+when:
+
+    op='truthy'           bool(value) is True (the default)
+    op='==', '!=', '<', '<=', '>', '>='
+                          value <op> check.value is True
+    op='in', 'not in'     value is / is not in check.value
+
+A missing field or missing value (None, NaN, pandas NA), or a value that
+cannot be compared, fails the check.
+Batch results keep one bit per check per record (bit i set when check i
+failed), so a mandate holds at most 64 checks.
+
+Usage:
+    >>> from ternary_logic import (
+    ...     DEFAULT_MANDATES, Mandate, MandateCheck, verify_mandate_batch
+    ... )
+    >>> DEFAULT_MANDATES.register(Mandate('sustainable_capital.eu', (
+    ...     'esg_verified',
+    ...     'emissions_anchored',
+    ...     MandateCheck('taxonomy_aligned', op='>=', value=0.5),
+    ... )))
+    >>> result = verify_mandate_batch('sustainable_capital.eu', frame)
+    >>> result.passed.sum(), result.failed_checks(0)
+"""
+
+import operator
+from dataclasses import dataclass, field
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional,
+    Sequence, Tuple, Union
+)
+
+import numpy as np
+
+MAX_CHECKS = 64
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+_OPS = ('truthy', 'in', 'not in') + tuple(_COMPARISONS)
+
+
+def _is_missing(value: Any) -> bool:
+    """True for None, NaN / NaT and pandas NA."""
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError:   # pandas NA: its truth value is ambiguous
+        return True
+
+
+def _present(column: np.ndarray) -> Optional[np.ndarray]:
+    """Mask of non-NaN entries of a float column; None for other kinds."""
+    if column.dtype.kind in 'fc':
+        return ~np.isnan(column)
+    return None
+
+
+@dataclass(frozen=True)
+class MandateCheck:
+    """One binary check of a mandate.
+
+    Attributes:
+        name: Check name reported in failed_checks.
+        field: Record field to test. Default: the check name.
+        op: 'truthy', a comparison ('==', '!=', '<', '<=', '>', '>=') or
+            membership ('in', 'not in').
+        value: Right-hand side for comparisons; a collection for
+               membership.
+
+    Raises:
+        ValueError: If op is unknown, or value is missing for an op that
+                    needs one.
+    """
+    name: str
+    field: Optional[str] = None
+    op: str = 'truthy'
+    value: Any = None
+
+    def __post_init__(self):
+        if self.op not in _OPS:
+            raise ValueError(
+                f"Unknown mandate check op {self.op!r}; expected one of {_OPS}"
+            )
+        if self.op != 'truthy' and self.value is None:
+            raise ValueError(f"Mandate check {self.name!r} needs a value")
+        if self.field is None:
+            object.__setattr__(self, 'field', self.name)
+        if self.op in ('in', 'not in'):
+            object.__setattr__(self, 'value', frozenset(self.value))
+
+    def compile(self) -> Callable[[Mapping[str, Any]], bool]:
+        """Predicate over one record: True when the check passes."""
+        name, op, target = self.field, self.op, self.value
+        if op == 'truthy':
+            def truthy(record):
+                value = record.get(name)
+                return not _is_missing(value) and bool(value)
+            return truthy
+        if op in ('in', 'not in'):
+            expect = op == 'in'
+
+            def member(record):
+                value = record.get(name)
+                if _is_missing(value):
+                    return False
+                try:
+                    return (value in target) is expect
+                except TypeError:
+                    return False
+            return member
+        compare = _COMPARISONS[op]
+
+        def comparison(record):
+            value = record.get(name)
+            if _is_missing(value):
+                return False
+            try:
+                return bool(compare(value, target))
+            except TypeError:
+                return False
+        return comparison
+
+    def compile_columns(self) -> Callable[[np.ndarray], np.ndarray]:
+        """Predicate over a column: a bool array, True where it passes."""
+        scalar = self.compile()
+        name, op, target = self.field, self.op, self.value
+        elementwise = np.frompyfunc(lambda v: scalar({name: v}), 1, 1)
+
+        def fallback(column):
+            return elementwise(column).astype(bool)
+
+        if op == 'truthy':
+            def truthy(column):
+                if column.dtype.kind == 'b':
+                    return column
+                if column.dtype.kind in 'iu':
+                    return column != 0
+                if column.dtype.kind in 'fc':
+                    return (column != 0) & _present(column)
+                if column.dtype.kind == 'U':
+                    return column != ''
+                return fallback(column)
+            return truthy
+        if op in ('in', 'not in'):
+            members = list(target)
+
+            def member(column):
+                if column.dtype.kind in 'biuf' and all(
+                    isinstance(m, (bool, int, float)) for m in members
+                ):
+                    hit = np.isin(column, members)
+                    if op == 'in':
+                        return hit
+                    present = _present(column)
+                    return ~hit if present is None else ~hit & present
+                return fallback(column)
+            return member
+        compare = _COMPARISONS[op]
+        numeric = isinstance(target, (bool, int, float)) and not isinstance(
+            target, np.generic
+        )
+
+        def comparison(column):
+            if numeric and column.dtype.kind in 'biuf':
+                with np.errstate(invalid='ignore'):
+                    passes = compare(column, target)
+                present = _present(column)
+                return passes if present is None else passes & present
+            return fallback(column)
+        return comparison
+
+
+CheckSpec = Union[str, MandateCheck]
+
+
+@dataclass(frozen=True)
+class Mandate:
+    """A named set of checks that must all pass.
+
+    Attributes:
+        name: Registry key, e.g. 'economic_rights' or
+              'sustainable_capital.eu'.
+        checks: MandateCheck objects, or field names for truthy checks.
+
+    Raises:
+        ValueError: If the mandate has no checks, more than 64, or two
+                    with the same name.
+    """
+    name: str
+    checks: Tuple[MandateCheck, ...]
+    _predicates: Tuple[Callable, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _column_predicates: Tuple[Callable, ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        checks = tuple(
+            c if isinstance(c, MandateCheck) else MandateCheck(c)
+            for c in self.checks
+        )
+        if not checks:
+            raise ValueError(f"Mandate {self.name!r} has no checks")
+        if len(checks) > MAX_CHECKS:
+            raise ValueError(
+                f"Mandate {self.name!r} has {len(checks)} checks; "
+                f"at most {MAX_CHECKS} are supported"
+            )
+        names = [c.name for c in checks]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Mandate {self.name!r} repeats a check name")
+        object.__setattr__(self, 'checks', checks)
+        object.__setattr__(
+            self, '_predicates', tuple(c.compile() for c in checks)
+        )
+        object.__setattr__(
+            self, '_column_predicates',
+            tuple(c.compile_columns() for c in checks)
+        )
+
+    @property
+    def check_names(self) -> List[str]:
+        return [c.name for c in self.checks]
+
+    def failed_checks(self, record: Mapping[str, Any]) -> List[str]:
+        """Names of the checks one record fails, in declaration order."""
+        return [
+            check.name
+            for check, passes in zip(self.checks, self._predicates)
+            if not passes(record)
+        ]
+
+    def failure_bits(self, records: Any) -> np.ndarray:
+        """uint64 bitmask per record; bit i is set when check i failed.
+
+        Args:
+            records: A pandas DataFrame, a 1-D structured array, a mapping
+                     of field name to column, or a sequence of dicts.
+        """
+        if isinstance(records, (list, tuple)):
+            return self._failure_bits_by_record(records)
+        columns, n = _column_source(records)
+        failures = np.zeros(n, dtype=np.uint64)
+        for bit, (check, passes) in enumerate(
+            zip(self.checks, self._column_predicates)
+        ):
+            if check.field not in columns:
+                failures |= np.uint64(1 << bit)
+                continue
+            column = np.asarray(records[check.field])
+            if column.shape != (n,):
+                raise ValueError(
+                    f"Column {check.field!r} has shape {column.shape}, "
+                    f"expected ({n},)"
+                )
+            failures[~np.asarray(passes(column), dtype=bool)] |= np.uint64(
+                1 << bit
+            )
+        return failures
+
+    def _failure_bits_by_record(
+        self, records: Sequence[Mapping[str, Any]]
+    ) -> np.ndarray:
+        failures = np.zeros(len(records), dtype=np.uint64)
+        for bit, passes in enumerate(self._predicates):
+            failed = [i for i, r in enumerate(records) if not passes(r)]
+            failures[failed] |= np.uint64(1 << bit)
+        return failures
+
+    def decode(self, bits: int) -> List[str]:
+        """Check names for one failure bitmask."""
+        return [
+            check.name for i, check in enumerate(self.checks)
+            if int(bits) >> i & 1
+        ]
+
+
+def _column_source(records: Any) -> Tuple[Any, int]:
+    """(collection supporting `in` for field names, record count)."""
+    names = getattr(getattr(records, 'dtype', None), 'names', None)
+    if names is not None:
+        return names, len(records)
+    columns = getattr(records, 'columns', None)
+    if columns is not None:  # pandas DataFrame
+        return set(columns), len(records)
+    if isinstance(records, Mapping):
+        lengths = {len(column) for column in records.values()}
+        if len(lengths) > 1:
+            raise ValueError("Mandate record columns differ in length")
+        return records, lengths.pop() if lengths else 0
+    raise ValueError(
+        f"Cannot check mandates over {type(records).__name__}; expected a "
+        f"DataFrame, structured array, mapping of columns or list of dicts"
+    )
+
+
+class MandateRegistry:
+    """Mandates keyed by name.
+
+    Args:
+        mandates: Mandates to register initially.
+    """
+
+    def __init__(self, mandates: Iterable[Mandate] = ()):
+        self._mandates: Dict[str, Mandate] = {}
+        for mandate in mandates:
+            self.register(mandate)
+
+    def register(self, mandate: Mandate, replace: bool = False) -> Mandate:
+        """Add a mandate.
+
+        Raises:
+            ValueError: If the name is taken and replace is False.
+        """
+        if mandate.name in self._mandates and not replace:
+            raise ValueError(
+                f"Mandate {mandate.name!r} is already registered; "
+                f"pass replace=True to redefine it"
+            )
+        self._mandates[mandate.name] = mandate
+        return mandate
+
+    def get(self, name: str) -> Mandate:
+        """Return a mandate.
+
+        Raises:
+            ValueError: If no mandate has this name.
+        """
+        mandate = self._mandates.get(name)
+        if mandate is None:
+            raise ValueError(f"Unknown mandate type: {name}")
+        return mandate
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._mandates)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._mandates
+
+    def __iter__(self) -> Iterator[Mandate]:
+        return iter(list(self._mandates.values()))
+
+    def __len__(self) -> int:
+        return len(self._mandates)
+
+
+DEFAULT_MANDATES = MandateRegistry([
+    Mandate('economic_rights', (
+        'ownership_verified',
+        'consent_obtained',
+        'provenance_signed',
+        'regulatory_access',
+    )),
+    Mandate('sustainable_capital', (
+        'esg_verified',
+        'emissions_anchored',
+        'use_of_proceeds_tracked',
+    )),
+])
@@ -0,0 +1,359 @@
+"""
+Merkle ledger.
+
+The example ledgers chain every entry to its predecessor
+(merkleRoot = sha256(previous_hash + logHash)), so proving that one entry
+is included means replaying the chain up to it. MerkleLedger keeps the
+entries as the leaves of a binary Merkle tree instead:
+
+    - appends are amortised O(1) hashes; extend() hashes a whole batch
+      level by level;
+    - the root of the first n leaves, for the current size or any earlier
+      one, costs O(log n);
+    - an inclusion proof is O(log n) sibling hashes.
+
+Interior nodes hash their two children in sorted order,
+digest(min(a, b) + max(a, b)), which is what
+TL_Ledger_Core.verifyMerkleInclusion / TL_Evidence_Vault.verifyMerkleInclusion
+recompute on-chain. A proof is therefore just the sibling list, with no
+left/right flags, and proof_hex() gives the list of 0x-prefixed hex
+strings TLContractClient.register_permission_token takes as merkle_proof.
+An unpaired last node is promoted to the next level unchanged (never
+duplicated), so no two sizes share a root by padding.
+
+Leaves are digests, typically the entry's logHash. The contracts use
+keccak256; pass digest=keccak256 to build a tree whose roots and proofs
+verify on-chain. The default is SHA-256, as used for logHash. anchor()
+returns a root together with a proof against that same root, which is the
+pair a PermissionToken's merkleRoot and merkle_proof must be.
+
+Usage:
+    >>> from ternary_logic import MerkleLedger, verify_merkle_proof
+    >>> tree = MerkleLedger()
+    >>> index = tree.append_leaf(entry["logHash"])
+    >>> proof = tree.proof_hex(index)
+    >>> verify_merkle_proof(entry["logHash"], proof, tree.root)
+    True
+    >>> chain_tree = MerkleLedger(digest=keccak256)
+    >>> index = chain_tree.append_leaf(entry["logHash"])
+    >>> root, proof = chain_tree.anchor(index)      # token merkleRoot, proof
+    >>> verify_merkle_proof(entry["logHash"], proof, root, digest=keccak256)
+    True
+"""
+
+import hashlib
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+Digest = Callable[[bytes], bytes]
+HashLike = Union[bytes, bytearray, str]
+
+
+def _sha256(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+# Keccak-f[1600] round constants and rho rotations, indexed x + 5 * y.
+_KECCAK_ROUND_CONSTANTS = (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A,
+    0x8000000080008000, 0x000000000000808B, 0x0000000080000001,
+    0x8000000080008081, 0x8000000000008009, 0x000000000000008A,
+    0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089,
+    0x8000000000008003, 0x8000000000008002, 0x8000000000000080,
+    0x000000000000800A, 0x800000008000000A, 0x8000000080008081,
+    0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+)
+_KECCAK_ROTATIONS = (
+    0, 1, 62, 28, 27,
+    36, 44, 6, 55, 20,
+    3, 10, 43, 25, 39,
+    41, 45, 15, 21, 8,
+    18, 2, 61, 56, 14,
+)
+_KECCAK_RATE = 136
+_MASK_64 = (1 << 64) - 1
+
+
+def _keccak_f(state: List[int]):
+    for constant in _KECCAK_ROUND_CONSTANTS:
+        c = [
+            state[x] ^ state[x + 5] ^ state[x + 10] ^ state[x + 15]
+            ^ state[x + 20]
+            for x in range(5)
+        ]
+        for x in range(5):
+            d = c[x - 1] ^ (
+                ((c[(x + 1) % 5] << 1) | (c[(x + 1) % 5] >> 63)) & _MASK_64
+            )
+            for y in range(0, 25, 5):
+                state[x + y] ^= d
+        b = [0] * 25
+        for x in range(5):
+            for y in range(5):
+                lane = state[x + 5 * y]
+                r = _KECCAK_ROTATIONS[x + 5 * y]
+                b[y + 5 * ((2 * x + 3 * y) % 5)] = (
+                    ((lane << r) | (lane >> (64 - r))) & _MASK_64 if r else lane
+                )
+        for y in range(0, 25, 5):
+            row = b[y:y + 5]
+            for x in range(5):
+                state[x + y] = row[x] ^ (~row[(x + 1) % 5] & row[(x + 2) % 5])
+        state[0] ^= constant
+
+
+def _keccak256_python(data: bytes) -> bytes:
+    padded = bytearray(data)
+    padded.append(0x01)                  # Keccak padding, not SHA-3's 0x06
+    padded.extend(b'\x00' * (-len(padded) % _KECCAK_RATE))
+    padded[-1] |= 0x80
+    state = [0] * 25
+    for offset in range(0, len(padded), _KECCAK_RATE):
+        block = padded[offset:offset + _KECCAK_RATE]
+        for i in range(_KECCAK_RATE // 8):
+            state[i] ^= int.from_bytes(block[8 * i:8 * i + 8], 'little')
+        _keccak_f(state)
+    return b''.join(lane.to_bytes(8, 'little') for lane in state[:4])
+
+
+try:
+    hashlib.new('keccak-256')
+    _HASHLIB_KECCAK = True
+except ValueError:
+    _HASHLIB_KECCAK = False
+
+
+def keccak256(data: bytes) -> bytes:
+    """Ethereum keccak256 (the original Keccak padding, not SHA3-256).
+
+    Uses OpenSSL's keccak-256 where hashlib provides it and a pure Python
+    Keccak-f[1600] otherwise, so on-chain roots can be built without web3.
+    """
+    if _HASHLIB_KECCAK:
+        return hashlib.new('keccak-256', bytes(data)).digest()
+    return _keccak256_python(bytes(data))
+
+
+def _as_bytes(value: HashLike) -> bytes:
+    """Bytes of a digest given as bytes or hex, with or without 0x."""
+    if isinstance(value, str):
+        if value[:2] in ('0x', '0X'):
+            value = value[2:]
+        return bytes.fromhex(value)
+    return bytes(value)
+
+
+def _to_hex(value: bytes) -> str:
+    return '0x' + value.hex()
+
+
+def _pair_hasher(digest: Digest) -> Callable[[bytes, bytes], bytes]:
+    def combine(a: bytes, b: bytes) -> bytes:
+        return digest(a + b if a <= b else b + a)
+    return combine
+
+
+class MerkleLedger:
+    """Append-only Merkle tree over digest leaves.
+
+    Args:
+        digest: Hash function for interior nodes and for append()/extend()
+                records. Default: SHA-256. Pass keccak256 for proofs checked
+                by the TL contracts.
+
+    Attributes:
+        digest: The hash function in use.
+    """
+
+    def __init__(self, digest: Optional[Digest] = None):
+        self.digest = digest or _sha256
+        self._combine = _pair_hasher(self.digest)
+        # _levels[k] holds the level-k nodes of every complete pair below;
+        # an unpaired tail is folded in by _frontier(), never stored.
+        self._levels: List[List[bytes]] = [[]]
+
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    # -- appending ----------------------------------------------------------
+
+    def append(self, record: bytes) -> int:
+        """Hash a record into a new leaf. Returns the leaf index."""
+        return self.append_leaf(self.digest(record))
+
+    def append_leaf(self, leaf: HashLike) -> int:
+        """Add an already-computed leaf digest (bytes or hex). Returns its
+        index."""
+        levels, combine = self._levels, self._combine
+        node = _as_bytes(leaf)
+        k = 0
+        while True:
+            level = levels[k]
+            level.append(node)
+            if len(level) % 2:
+                break
+            node = combine(level[-2], node)
+            k += 1
+            if k == len(levels):
+                levels.append([])
+        return len(levels[0]) - 1
+
+    def extend(self, records: Iterable[bytes]) -> range:
+        """Hash a batch of records into leaves. Returns their indices."""
+        digest = self.digest
+        return self.extend_leaves([digest(r) for r in records])
+
+    def extend_leaves(self, leaves: Iterable[HashLike]) -> range:
+        """Add a batch of leaf digests. Returns their indices.
+
+        Each level is extended in one pass, so a batch of m leaves costs
+        about m interior hashes however it lines up with existing pairs.
+        """
+        levels, combine = self._levels, self._combine
+        start = len(levels[0])
+        levels[0].extend(map(_as_bytes, leaves))
+        k = 0
+        while len(levels[k]) >= 2:
+            if k + 1 == len(levels):
+                levels.append([])
+            below, above = levels[k], levels[k + 1]
+            done = 2 * len(above)
+            if done + 1 >= len(below):
+                break
+            above.extend([
+                combine(below[i], below[i + 1])
+                for i in range(done, len(below) - 1, 2)
+            ])
+            k += 1
+        return range(start, len(levels[0]))
+
+    # -- reading ------------------------------------------------------------
+
+    def leaf(self, index: int) -> bytes:
+        return self._levels[0][index]
+
+    def _check_size(self, size: Optional[int]) -> int:
+        if size is None:
+            return len(self)
+        if not 0 <= size <= len(self):
+            raise ValueError(
+                f"Tree size {size} out of range for a ledger of {len(self)} "
+                f"leaves"
+            )
+        return size
+
+    def _frontier(self, size: int) -> List[Tuple[int, Optional[bytes]]]:
+        """(stored nodes, carried node) per level of the tree over the
+        first size leaves, from the leaves up to the root level.
+
+        Level k of that tree is _levels[k][:count] followed by the carried
+        node, if any: the unpaired tail of the level below, promoted or
+        hashed with that level's own carry.
+        """
+        levels, combine = self._levels, self._combine
+        frontier = []
+        count, carry = size, None
+        k = 0
+        while True:
+            frontier.append((count, carry))
+            if count + (carry is not None) <= 1:
+                return frontier
+            if count % 2:
+                tail = levels[k][count - 1]
+                carry = tail if carry is None else combine(tail, carry)
+            count //= 2
+            k += 1
+
+    def root_at(self, size: int) -> Optional[bytes]:
+        """Root of the tree over the first size leaves (None when empty).
+
+        Earlier roots stay reproducible, so an entry appended later can
+        still be proven against a root anchored at an earlier size.
+        """
+        size = self._check_size(size)
+        if not size:
+            return None
+        frontier = self._frontier(size)
+        count, carry = frontier[-1]
+        return self._levels[len(frontier) - 1][0] if count else carry
+
+    @property
+    def root(self) -> Optional[bytes]:
+        """Current root (None when empty)."""
+        return self.root_at(len(self))
+
+    @property
+    def root_hex(self) -> Optional[str]:
+        root = self.root
+        return _to_hex(root) if root is not None else None
+
+    def proof(self, index: int, size: Optional[int] = None) -> List[bytes]:
+        """Sibling hashes from leaf index up to the root of the tree over
+        the first size leaves (default: all).
+
+        Raises:
+            IndexError: If index is not a leaf of that tree.
+            ValueError: If size exceeds the ledger.
+        """
+        size = self._check_size(size)
+        if not 0 <= index < size:
+            raise IndexError(f"Leaf index {index} out of range for {size} leaves")
+        levels = self._levels
+        path = []
+        position = index
+        for k, (count, carry) in enumerate(self._frontier(size)[:-1]):
+            sibling = position ^ 1
+            if sibling < count:
+                path.append(levels[k][sibling])
+            elif sibling == count and carry is not None:
+                path.append(carry)
+            position >>= 1
+        return path
+
+    def proof_hex(self, index: int, size: Optional[int] = None) -> List[str]:
+        """proof() as 0x-prefixed hex strings, the merkle_proof format of
+        TLContractClient.register_permission_token."""
+        return [_to_hex(node) for node in self.proof(index, size)]
+
+    def anchor(
+        self,
+        index: int,
+        size: Optional[int] = None
+    ) -> Tuple[str, List[str]]:
+        """Root of the tree over the first size leaves (default: all) and
+        the proof of leaf index against that root, both as 0x hex.
+
+        With digest=keccak256 this is the (merkleRoot, merkle_proof) pair
+        TLContractClient.register_permission_token needs: the proof only
+        verifies against the root it was built for.
+
+        Raises:
+            IndexError: If index is not a leaf of that tree.
+            ValueError: If size exceeds the ledger.
+        """
+        size = self._check_size(size)
+        proof = self.proof_hex(index, size)
+        return _to_hex(self.root_at(size)), proof
+
+
+def verify_merkle_proof(
+    leaf: HashLike,
+    proof: Sequence[HashLike],
+    root: HashLike,
+    digest: Optional[Digest] = None
+) -> bool:
+    """Check an inclusion proof the way TL_Ledger_Core.verifyMerkleInclusion
+    does: fold the siblings into the leaf with sorted-pair hashing and
+    compare with the root.
+
+    Args:
+        leaf: Leaf digest (bytes or hex).
+        proof: Sibling digests from MerkleLedger.proof()/proof_hex().
+        root: Expected root.
+        digest: The ledger's hash function. Default: SHA-256.
+    """
+    combine = _pair_hasher(digest or _sha256)
+    node = _as_bytes(leaf)
+    for sibling in proof:
+        node = combine(node, _as_bytes(sibling))
+    return node == _as_bytes(root)
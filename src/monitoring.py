@@ -0,0 +1,200 @@
+"""
+Windowed Epistemic Hold rate monitoring.
+
+TLEngine.epistemic_hold_rate is a lifetime average, so a burst of holds
+after a long quiet period barely moves it. HoldRateMonitor keeps rolling
+PROCEED / EPISTEMIC_HOLD / REFUSE rates over fixed time windows (1 minute,
+5 minutes and 1 hour by default) plus an exponentially weighted moving
+average, for alerting on regime changes as they happen.
+
+Each window is a ring of time buckets with a running total, so memory is
+constant, recording a decision is O(1) and reading a rate is O(1); the
+decision log is never scanned.
+
+Usage:
+    >>> from ternary_logic import TLEngine, HoldRateMonitor
+    >>> engine = TLEngine(
+    ...     proceed_threshold=YOUR_INSTITUTION_PROCEED_THRESHOLD,
+    ...     hold_threshold=YOUR_INSTITUTION_HOLD_THRESHOLD,
+    ...     monitor=HoldRateMonitor()
+    ... )
+    >>> engine.get_windowed_statistics()['5m']['epistemic_hold_rate']
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Slot per state value: PROCEED (+1) -> 0, EPISTEMIC_HOLD (0) -> 1,
+# REFUSE (-1) -> 2.
+_RATE_KEYS = ('proceed_rate', 'epistemic_hold_rate', 'refuse_rate')
+
+DEFAULT_WINDOWS: Tuple[Tuple[str, float], ...] = (
+    ('1m', 60.0),
+    ('5m', 300.0),
+    ('1h', 3600.0),
+)
+
+
+class _Window:
+    """Ring of time buckets covering the last ``seconds`` seconds."""
+
+    __slots__ = ('width', 'buckets', 'counts', 'totals', 'current')
+
+    def __init__(self, seconds: float, buckets: int):
+        self.width = seconds / buckets
+        self.buckets = buckets
+        self.counts: List[List[int]] = [[0, 0, 0] for _ in range(buckets)]
+        self.totals = [0, 0, 0]
+        self.current: Optional[int] = None
+
+    def advance(self, now: float):
+        """Expire buckets that have left the window; O(buckets) at most."""
+        bucket = int(now // self.width)
+        if self.current is None:
+            self.current = bucket
+            return
+        steps = min(bucket - self.current, self.buckets)
+        for k in range(1, steps + 1):
+            expired = self.counts[(self.current + k) % self.buckets]
+            self.totals[0] -= expired[0]
+            self.totals[1] -= expired[1]
+            self.totals[2] -= expired[2]
+            expired[0] = expired[1] = expired[2] = 0
+        if bucket > self.current:
+            self.current = bucket
+
+    def add(self, slot: int, count: int):
+        self.counts[self.current % self.buckets][slot] += count
+        self.totals[slot] += count
+
+
+class HoldRateMonitor:
+    """Rolling and exponentially weighted PROCEED/HOLD/REFUSE rates.
+
+    Args:
+        windows: (label, seconds) pairs. Default: 1m, 5m and 1h.
+        buckets: Buckets per window. A window's rate covers between
+                 (buckets - 1) / buckets and all of its length.
+        ewma_alpha: Weight of each new decision in the moving averages.
+        clock: Monotonic clock in seconds. Default: time.monotonic.
+
+    Raises:
+        ValueError: If no windows are given, a window length or bucket
+                    count is not positive, or ewma_alpha is not in (0, 1].
+    """
+
+    def __init__(
+        self,
+        windows: Tuple[Tuple[str, float], ...] = DEFAULT_WINDOWS,
+        buckets: int = 60,
+        ewma_alpha: float = 0.01,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if not windows:
+            raise ValueError("HoldRateMonitor requires at least one window")
+        if buckets <= 0:
+            raise ValueError(f"buckets must be positive, got {buckets}")
+        if not 0.0 < ewma_alpha <= 1.0:
+            raise ValueError(f"ewma_alpha must be in (0, 1], got {ewma_alpha}")
+        for label, seconds in windows:
+            if seconds <= 0:
+                raise ValueError(
+                    f"Window {label!r} must be positive, got {seconds}"
+                )
+        self._windows: Dict[str, _Window] = {
+            label: _Window(seconds, buckets) for label, seconds in windows
+        }
+        self.window_seconds = dict(windows)
+        self.ewma_alpha = ewma_alpha
+        self.clock = clock
+        self._ewma: Optional[List[float]] = None
+        self._lock = threading.Lock()
+
+    def record(self, state_value: int):
+        """Count one decision by its state value (+1/0/-1)."""
+        slot = 1 - state_value
+        now = self.clock()
+        with self._lock:
+            for window in self._windows.values():
+                window.advance(now)
+                window.add(slot, 1)
+            ewma = self._ewma
+            if ewma is None:
+                self._ewma = [0.0, 0.0, 0.0]
+                self._ewma[slot] = 1.0
+            else:
+                alpha = self.ewma_alpha
+                for i in range(3):
+                    ewma[i] += alpha * ((i == slot) - ewma[i])
+
+    def record_counts(self, proceed: int, hold: int, refuse: int):
+        """Count a batch of decisions.
+
+        The moving averages treat the batch as evenly mixed: each is
+        decayed by (1 - alpha) ** n toward the batch's own rates.
+        """
+        n = proceed + hold + refuse
+        if n == 0:
+            return
+        counts = (proceed, hold, refuse)
+        now = self.clock()
+        with self._lock:
+            for window in self._windows.values():
+                window.advance(now)
+                for slot in range(3):
+                    if counts[slot]:
+                        window.add(slot, counts[slot])
+            batch_rates = [c / n for c in counts]
+            if self._ewma is None:
+                self._ewma = batch_rates
+            else:
+                keep = (1.0 - self.ewma_alpha) ** n
+                self._ewma = [
+                    keep * old + (1.0 - keep) * new
+                    for old, new in zip(self._ewma, batch_rates)
+                ]
+
+    def window(self, label: str) -> Dict[str, Any]:
+        """Counts and rates for one window.
+
+        Raises:
+            ValueError: If no window has this label.
+        """
+        window = self._windows.get(label)
+        if window is None:
+            raise ValueError(f"Unknown monitor window: {label!r}")
+        now = self.clock()
+        with self._lock:
+            window.advance(now)
+            proceed, hold, refuse = window.totals
+        total = proceed + hold + refuse
+        return {
+            'window_seconds': self.window_seconds[label],
+            'decisions': total,
+            'proceed_count': proceed,
+            'hold_count': hold,
+            'refuse_count': refuse,
+            'proceed_rate': proceed / total if total else 0.0,
+            'epistemic_hold_rate': hold / total if total else 0.0,
+            'refuse_rate': refuse / total if total else 0.0,
+        }
+
+    def ewma(self) -> Dict[str, float]:
+        """Exponentially weighted rates (all 0.0 before any decision)."""
+        with self._lock:
+            values = list(self._ewma) if self._ewma is not None else [0.0] * 3
+        return dict(zip(_RATE_KEYS, values))
+
+    @property
+    def ewma_hold_rate(self) -> float:
+        """Exponentially weighted Epistemic Hold rate."""
+        return self.ewma()['epistemic_hold_rate']
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Every window keyed by label, plus 'ewma'."""
+        report: Dict[str, Any] = {
+            label: self.window(label) for label in self._windows
+        }
+        report['ewma'] = self.ewma()
+        return report
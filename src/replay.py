@@ -0,0 +1,327 @@
+"""
+Parallel replay of historical decision inputs.
+
+Re-evaluating a long archive of decision inputs (regulatory look-backs,
+threshold-recalibration studies) with a single engine is bound to one
+core. ParallelReplay splits the input stream into chunks and evaluates
+each chunk with evaluate_batch in a separate process, on a worker engine
+built with the same thresholds. Worker results are merged back in input
+order into one TLEngine, so its decision log, Epistemic Hold records and
+statistics are those of a single sequential replay.
+
+Inputs are either arrays (confidences, with optional per-decision
+reasonings and forced states) or an NDJSON file with one object per line:
+
+    {"confidence": 0.82, "reasoning": "...", "metadata": {...},
+     "force_state": "EPISTEMIC_HOLD"}
+
+Only "confidence" is required. Lines carrying a "record_type" other than
+"decision" (as written by NDJSONAuditExporter) are skipped, so an exported
+audit stream can be replayed directly.
+
+Usage:
+    >>> from ternary_logic import ParallelReplay
+    >>> replay = ParallelReplay(
+    ...     proceed_threshold=CANDIDATE_PROCEED_THRESHOLD,
+    ...     hold_threshold=CANDIDATE_HOLD_THRESHOLD,
+    ...     chunk_size=500_000
+    ... )
+    >>> result = replay.run_ndjson('archive/2025-decisions.ndjson')
+    >>> result.statistics['epistemic_hold_rate']
+"""
+
+import itertools
+import json
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from .core import (
+    UNFORCED,
+    EpistemicHoldEvent,
+    TLEngine,
+    TLState,
+    _coerce_force_states,
+)
+from .decision_log import ColumnarDecisionLog
+
+
+@dataclass
+class _Chunk:
+    """One slice of the input stream, as shipped to a worker."""
+    start: int
+    confidences: np.ndarray
+    reasonings: Optional[Sequence[str]] = None
+    metadata: Optional[Sequence[Dict[str, Any]]] = None
+    force_states: Optional[np.ndarray] = None
+
+
+class _ReplayEngine(TLEngine):
+    """Worker engine whose batch offsets continue from the chunk start.
+
+    Hold event ids are salted with the decision offset, so offsetting
+    them by the chunk's position keeps ids unique across workers.
+    """
+
+    def __init__(self, base_offset: int, **kwargs):
+        super().__init__(**kwargs)
+        self.base_offset = base_offset
+
+    def _append_batch(self, result):
+        return super()._append_batch(result) + self.base_offset
+
+
+def _replay_chunk(
+    chunk: _Chunk, engine_kwargs: Dict[str, Any], record: bool
+) -> Dict[str, Any]:
+    """Evaluate one chunk in a worker process."""
+    engine = _ReplayEngine(
+        chunk.start,
+        decision_log=ColumnarDecisionLog(),
+        log_mode='off',
+        **engine_kwargs
+    )
+    result = engine.evaluate_batch(
+        chunk.confidences,
+        reasonings=chunk.reasonings,
+        metadata=chunk.metadata,
+        force_states=chunk.force_states,
+        record=record,
+        return_view=True
+    )
+    return {
+        'states': result.states,
+        'counts': result.counts(),
+        'confidence_sum': float(result.confidences.sum()),
+        'decision_log': engine.decision_log if record else None,
+        'epistemic_holds': engine.epistemic_holds,
+    }
+
+
+@dataclass
+class ReplayResult:
+    """Merged outcome of a parallel replay.
+
+    Attributes:
+        states: int8 array of state values (+1/0/-1) in input order.
+        engine: TLEngine holding the merged decision log, Epistemic Hold
+                records and running statistics. Its decision log is empty
+                when the replay ran with record=False.
+    """
+    states: np.ndarray
+    engine: TLEngine
+
+    @property
+    def decision_log(self) -> ColumnarDecisionLog:
+        return self.engine.decision_log
+
+    @property
+    def epistemic_holds(self) -> List[EpistemicHoldEvent]:
+        return self.engine.epistemic_holds
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        return self.engine.get_statistics()
+
+
+class ParallelReplay:
+    """Re-evaluate historical decision inputs across a process pool.
+
+    Args:
+        proceed_threshold: As for TLEngine. REQUIRED.
+        hold_threshold:    As for TLEngine. REQUIRED.
+        epistemic_hold_rate_target: As for TLEngine.
+        chunk_size:  Decisions per worker task.
+        max_workers: Worker processes. Default: os.cpu_count().
+        record:      Keep the merged decision log and create Epistemic Hold
+                     records. Pass False when only states and statistics
+                     are needed; workers then return states and counts only.
+        executor:    Optional executor to use instead of a private
+                     ProcessPoolExecutor (e.g. one shared across studies).
+
+    Raises:
+        ValueError: If thresholds are missing or invalid, or chunk_size
+                    is not positive.
+    """
+
+    def __init__(
+        self,
+        proceed_threshold: Optional[float] = None,
+        hold_threshold: Optional[float] = None,
+        epistemic_hold_rate_target: float = 0.20,
+        chunk_size: int = 250_000,
+        max_workers: Optional[int] = None,
+        record: bool = True,
+        executor: Optional[Executor] = None
+    ):
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.engine_kwargs = {
+            'proceed_threshold': proceed_threshold,
+            'hold_threshold': hold_threshold,
+            'epistemic_hold_rate_target': epistemic_hold_rate_target,
+        }
+        # Validate thresholds here rather than in every worker.
+        self._new_engine()
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.record = record
+        self.executor = executor
+
+    def _new_engine(self) -> TLEngine:
+        return TLEngine(
+            decision_log=ColumnarDecisionLog(), log_mode='off',
+            **self.engine_kwargs
+        )
+
+    # -- inputs -----------------------------------------------------------
+
+    def run_arrays(
+        self,
+        confidences: Sequence[float],
+        reasonings: Optional[Sequence[str]] = None,
+        force_states: Optional[Sequence[Any]] = None
+    ) -> ReplayResult:
+        """Replay in-memory arrays.
+
+        Args:
+            confidences: Confidence scores in [0.0, 1.0].
+            reasonings:  One reasoning string for all decisions, or one
+                         per decision. Defaults to "Batch evaluation".
+            force_states: Per-decision forced states, as accepted by
+                         TLEngine.evaluate_batch.
+        """
+        confidences = np.asarray(confidences, dtype=np.float64)
+        n = len(confidences)
+        if reasonings is not None and not isinstance(reasonings, str):
+            if len(reasonings) != n:
+                raise ValueError(
+                    f"reasonings must have one entry per confidence ({n}), "
+                    f"got {len(reasonings)}"
+                )
+        if force_states is not None:
+            force_states = _coerce_force_states(force_states, n)
+
+        def chunks() -> Iterator[_Chunk]:
+            for start in range(0, n, self.chunk_size):
+                stop = start + self.chunk_size
+                yield _Chunk(
+                    start=start,
+                    confidences=confidences[start:stop],
+                    reasonings=(
+                        reasonings[start:stop]
+                        if reasonings is not None
+                        and not isinstance(reasonings, str)
+                        else reasonings
+                    ),
+                    force_states=(
+                        force_states[start:stop]
+                        if force_states is not None else None
+                    ),
+                )
+
+        return self.run(chunks())
+
+    def run_ndjson(self, path: str) -> ReplayResult:
+        """Replay an NDJSON file, reading it one chunk at a time."""
+        return self.run(self._ndjson_chunks(path))
+
+    def _ndjson_chunks(self, path: str) -> Iterator[_Chunk]:
+        with open(path, 'r', encoding='utf-8') as f:
+            records = (
+                json.loads(line) for line in f if line.strip()
+            )
+            decisions = (
+                r for r in records
+                if r.get('record_type', 'decision') == 'decision'
+            )
+            start = 0
+            while True:
+                batch = list(itertools.islice(decisions, self.chunk_size))
+                if not batch:
+                    return
+                yield _chunk_from_records(start, batch)
+                start += len(batch)
+
+    # -- execution --------------------------------------------------------
+
+    def run(self, chunks: Iterable[_Chunk]) -> ReplayResult:
+        """Evaluate chunks in parallel and merge the results in order.
+
+        At most two chunks per worker are in flight, so a stream larger
+        than memory can be replayed as long as the merged result fits.
+        """
+        merged = self._new_engine()
+        states: List[np.ndarray] = []
+        if self.executor is not None:
+            for part in self._map(self.executor, chunks):
+                self._merge(merged, part, states)
+        else:
+            with ProcessPoolExecutor(self.max_workers) as pool:
+                for part in self._map(pool, chunks):
+                    self._merge(merged, part, states)
+        return ReplayResult(
+            states=(
+                np.concatenate(states) if states
+                else np.empty(0, dtype=np.int8)
+            ),
+            engine=merged
+        )
+
+    def _map(
+        self, executor: Executor, chunks: Iterable[_Chunk]
+    ) -> Iterator[Dict[str, Any]]:
+        """Submit chunks with bounded look-ahead; yield results in order."""
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(
+                _replay_chunk, chunk, self.engine_kwargs, self.record
+            ))
+            if len(pending) >= 2 * self.max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    @staticmethod
+    def _merge(merged: TLEngine, part: Dict[str, Any], states: List):
+        states.append(part['states'])
+        if part['decision_log'] is not None:
+            merged.decision_log.append_log(part['decision_log'])
+        counts = part['counts']
+        merged._state_counts[TLState.PROCEED] += counts['proceed_count']
+        merged._state_counts[TLState.EPISTEMIC_HOLD] += counts['hold_count']
+        merged._state_counts[TLState.REFUSE] += counts['refuse_count']
+        merged._confidence_sum += part['confidence_sum']
+        for event in part['epistemic_holds']:
+            merged._record_hold(event)
+
+
+def _chunk_from_records(start: int, records: List[Dict[str, Any]]) -> _Chunk:
+    """Columnize one chunk of NDJSON input records."""
+    try:
+        confidences = np.fromiter(
+            (r['confidence'] for r in records),
+            dtype=np.float64, count=len(records)
+        )
+    except KeyError:
+        raise ValueError(
+            f"Replay record in chunk starting at {start} has no 'confidence'"
+        ) from None
+    forced = [r.get('force_state') for r in records]
+    return _Chunk(
+        start=start,
+        confidences=confidences,
+        reasonings=[r.get('reasoning', "Batch evaluation") for r in records],
+        metadata=[r.get('metadata') or {} for r in records],
+        force_states=(
+            np.fromiter(
+                (UNFORCED if f is None else TLState[f].value for f in forced),
+                dtype=np.int8, count=len(forced)
+            )
+            if any(f is not None for f in forced) else None
+        ),
+    )
@@ -0,0 +1,246 @@
+"""
+Bounded in-memory retention with spill-to-disk segments.
+
+A long-running TLEngine keeps every decision and Epistemic Hold record it
+has ever produced. With a RetentionPolicy, the engine keeps only a recent
+window in memory (the last N records and/or the last T seconds) and seals
+older records into append-only segment files: NDJSON, or the compact
+binary records of codec.py with segment_format='binary'. Engine
+statistics are served from running counters, so they stay exact across
+the whole history, and export_audit_trail streams the sealed segments
+back from disk.
+
+Usage:
+    >>> from ternary_logic import TLEngine, RetentionPolicy
+    >>> engine = TLEngine(
+    ...     proceed_threshold=YOUR_INSTITUTION_PROCEED_THRESHOLD,
+    ...     hold_threshold=YOUR_INSTITUTION_HOLD_THRESHOLD,
+    ...     retention=RetentionPolicy('audit/segments', max_entries=100_000)
+    ... )
+"""
+
+import json
+import os
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from .codec import iter_frames
+
+_SEGMENT_SUFFIXES = {'ndjson': '.ndjson', 'binary': '.tlb'}
+
+
+@dataclass
+class RetentionPolicy:
+    """How much history a TLEngine keeps in memory.
+
+    Attributes:
+        directory: Where sealed segment files are written.
+        max_entries: Keep at most this many records of each kind in memory.
+        max_age_seconds: Spill records older than this many seconds.
+        segment_size: Records per segment file before it is sealed.
+        segment_format: 'ndjson' (one to_dict() JSON object per line) or
+                        'binary' (to_bytes() records, smaller and faster
+                        to write and read back).
+    """
+    directory: str
+    max_entries: Optional[int] = None
+    max_age_seconds: Optional[float] = None
+    segment_size: int = 100_000
+    segment_format: str = 'ndjson'
+
+    def __post_init__(self):
+        if self.max_entries is None and self.max_age_seconds is None:
+            raise ValueError(
+                "RetentionPolicy requires max_entries, max_age_seconds, or both"
+            )
+        if self.max_entries is not None and self.max_entries < 0:
+            raise ValueError(
+                f"max_entries must be non-negative, got {self.max_entries}"
+            )
+        if self.segment_size <= 0:
+            raise ValueError(
+                f"segment_size must be positive, got {self.segment_size}"
+            )
+        if self.segment_format not in _SEGMENT_SUFFIXES:
+            raise ValueError(
+                f"segment_format must be 'ndjson' or 'binary', "
+                f"got {self.segment_format!r}"
+            )
+
+
+class SegmentedLog:
+    """Ring buffer of recent records backed by append-only segment files.
+
+    Records must provide ``timestamp`` (naive UTC datetime) and
+    ``to_dict()``, plus ``to_bytes()`` for binary segments. The list-like
+    API (len, indexing, iteration) covers the in-memory window;
+    iter_records() streams the complete history.
+
+    Args:
+        policy: Retention bounds and segment directory.
+        prefix: Segment file name prefix, e.g. "decisions" or "holds".
+        retain: Optional predicate. Evicted records for which it returns
+                True are held aside instead of written, until release()
+                is called for them (used for unresolved holds).
+        on_spill: Optional callback invoked with each record written to disk.
+        decode: For binary segments, callable turning a (kind, body) frame
+                back into a record; required to read them back.
+    """
+
+    def __init__(
+        self,
+        policy: RetentionPolicy,
+        prefix: str,
+        retain: Optional[Callable[[Any], bool]] = None,
+        on_spill: Optional[Callable[[Any], None]] = None,
+        decode: Optional[Callable[[int, bytes], Any]] = None
+    ):
+        self.policy = policy
+        self.prefix = prefix
+        self.retain = retain
+        self.on_spill = on_spill
+        self.decode = decode
+        self.binary = policy.segment_format == 'binary'
+        self.suffix = _SEGMENT_SUFFIXES[policy.segment_format]
+        self.directory = Path(policy.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._window: Deque[Any] = deque()
+        self._held: Dict[int, Any] = {}
+        self._segments: List[Path] = []
+        self._active = None
+        self._active_count = 0
+        self._next_segment = self._first_free_segment()
+        self.spilled_count = 0
+
+    def _first_free_segment(self) -> int:
+        """Continue numbering after any segments already on disk."""
+        existing = [
+            int(p.stem.rsplit('-', 1)[1])
+            for p in self.directory.glob(f"{self.prefix}-*{self.suffix}")
+            if p.stem.rsplit('-', 1)[1].isdigit()
+        ]
+        return max(existing, default=-1) + 1
+
+    # -- writes -----------------------------------------------------------
+
+    def append(self, record: Any):
+        """Add a record to the in-memory window, spilling old ones."""
+        self._window.append(record)
+        self._enforce()
+
+    def extend(self, records):
+        """Add several records."""
+        for record in records:
+            self._window.append(record)
+        self._enforce()
+
+    def _enforce(self):
+        window = self._window
+        max_entries = self.policy.max_entries
+        if max_entries is not None:
+            while len(window) > max_entries:
+                self._evict(window.popleft())
+        if self.policy.max_age_seconds is not None:
+            cutoff = datetime.utcnow() - timedelta(
+                seconds=self.policy.max_age_seconds
+            )
+            while window and window[0].timestamp < cutoff:
+                self._evict(window.popleft())
+
+    def _evict(self, record: Any):
+        if self.retain is not None and self.retain(record):
+            self._held[id(record)] = record
+        else:
+            self._write(record)
+
+    def release(self, record: Any) -> bool:
+        """Write a held-aside record to disk. Returns True if it was held."""
+        if self._held.pop(id(record), None) is None:
+            return False
+        self._write(record)
+        return True
+
+    def _write(self, record: Any):
+        if self._active is None:
+            path = self.directory / (
+                f"{self.prefix}-{self._next_segment:08d}{self.suffix}"
+            )
+            self._next_segment += 1
+            self._active = (
+                open(path, 'ab') if self.binary
+                else open(path, 'a', encoding='utf-8')
+            )
+            self._segments.append(path)
+        if self.binary:
+            self._active.write(record.to_bytes())
+        else:
+            self._active.write(json.dumps(record.to_dict()))
+            self._active.write('\n')
+        self._active_count += 1
+        self.spilled_count += 1
+        if self._active_count >= self.policy.segment_size:
+            self._seal()
+        if self.on_spill is not None:
+            self.on_spill(record)
+
+    def _seal(self):
+        """Close the active segment; it is never written again."""
+        if self._active is not None:
+            self._active.flush()
+            os.fsync(self._active.fileno())
+            self._active.close()
+            self._active = None
+            self._active_count = 0
+
+    def flush(self):
+        """Flush the active segment so its records are readable."""
+        if self._active is not None:
+            self._active.flush()
+
+    def close(self):
+        """Seal the active segment."""
+        self._seal()
+
+    # -- reads ------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    def __bool__(self) -> bool:
+        return bool(self._window)
+
+    def __getitem__(self, index: int) -> Any:
+        return self._window[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._window)
+
+    @property
+    def segments(self) -> List[Path]:
+        """Segment files written by this log, oldest first."""
+        return list(self._segments)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream the full history as dicts: segments, held, then window."""
+        self.flush()
+        for path in self._segments:
+            if self.binary:
+                if self.decode is None:
+                    raise ValueError(
+                        "Reading binary segments requires a decode callable"
+                    )
+                with open(path, 'rb') as f:
+                    for kind, body in iter_frames(f):
+                        yield self.decode(kind, body).to_dict()
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    yield json.loads(line)
+        for record in list(self._held.values()):
+            yield record.to_dict()
+        for record in list(self._window):
+            yield record.to_dict()
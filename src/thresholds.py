@@ -1,15 +1,388 @@
-"""Dynamic threshold management."""
+"""
+Threshold management.
+
+Holds threshold validation shared by TLEngine and the per-profile
+threshold table. A ThresholdProfileTable maps profile ids (desks,
+instruments, mandates) to their own institutionally calibrated
+proceed/hold pair, so one engine can route decisions to many threshold
+profiles while keeping a single decision log and hold registry.
+
+Profile ids are mapped to dense integer codes and the thresholds are kept
+in NumPy arrays indexed by code, so a batch of confidences with a batch of
+profile ids is classified with one gather and two array comparisons.
+
+A ThresholdVersion is one immutable, numbered set of engine thresholds
+(the engine's own pair plus a snapshot of its profile table). TLEngine
+publishes a new version whenever thresholds are recalibrated, and every
+decision records the epoch of the version that produced it.
+
+Usage:
+    >>> from ternary_logic import TLEngine, ThresholdProfileTable
+    >>> profiles = ThresholdProfileTable({
+    ...     'rates-desk': (RATES_PROCEED_THRESHOLD, RATES_HOLD_THRESHOLD),
+    ...     'fx-desk': (FX_PROCEED_THRESHOLD, FX_HOLD_THRESHOLD),
+    ... })
+    >>> engine = TLEngine(
+    ...     proceed_threshold=YOUR_INSTITUTION_PROCEED_THRESHOLD,
+    ...     hold_threshold=YOUR_INSTITUTION_HOLD_THRESHOLD,
+    ...     profiles=profiles
+    ... )
+    >>> engine.evaluate(0.81, "Basis trade", profile='rates-desk')
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import (
+    Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+)
+
+import numpy as np
+
+
+def validate_thresholds(
+    proceed_threshold: Optional[float],
+    hold_threshold: Optional[float]
+):
+    """Check that a proceed/hold pair is present and correctly ordered.
+
+    Raises:
+        ValueError: If either threshold is None, or they do not satisfy
+                    0.0 < hold_threshold < proceed_threshold < 1.0.
+    """
+    if proceed_threshold is None:
+        raise ValueError(
+            "proceed_threshold is required and has no default value. "
+            "This threshold must be calibrated by your institution through "
+            "historical backtesting, regulatory requirements, and "
+            "board-approved risk appetite. "
+            "No universal value is appropriate for all systems. "
+            "See docs/Threshold_Calibration.md for calibration methodology."
+        )
+    if hold_threshold is None:
+        raise ValueError(
+            "hold_threshold is required and has no default value. "
+            "This threshold must be calibrated by your institution through "
+            "historical backtesting, regulatory requirements, and "
+            "board-approved risk appetite. "
+            "No universal value is appropriate for all systems. "
+            "See docs/Threshold_Calibration.md for calibration methodology."
+        )
+    if not 0.0 < hold_threshold < proceed_threshold < 1.0:
+        raise ValueError(
+            f"Thresholds must satisfy: 0.0 < hold_threshold < "
+            f"proceed_threshold < 1.0. "
+            f"Got hold_threshold={hold_threshold}, "
+            f"proceed_threshold={proceed_threshold}."
+        )
+
+
+@dataclass(frozen=True)
+class ThresholdProfile:
+    """One named, validated proceed/hold threshold pair."""
+    profile_id: str
+    proceed_threshold: float
+    hold_threshold: float
+
+    def __post_init__(self):
+        validate_thresholds(self.proceed_threshold, self.hold_threshold)
+
+
+class ThresholdProfileTable:
+    """Threshold profiles keyed by profile id.
+
+    Profiles can be added or recalibrated at any time. Each change
+    publishes a new (index, proceed array, hold array) triple in a single
+    assignment, so a batch that has taken a snapshot keeps classifying
+    against consistent arrays.
+
+    Args:
+        profiles: Optional mapping of profile id to
+                  (proceed_threshold, hold_threshold).
+    """
+
+    def __init__(
+        self,
+        profiles: Optional[Mapping[str, Tuple[float, float]]] = None
+    ):
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, ThresholdProfile] = {}
+        self._snapshot: Tuple[Dict[str, int], np.ndarray, np.ndarray] = (
+            {}, np.empty(0), np.empty(0)
+        )
+        for profile_id, (proceed, hold) in (profiles or {}).items():
+            self.set(profile_id, proceed, hold)
+
+    def set(
+        self,
+        profile_id: str,
+        proceed_threshold: float,
+        hold_threshold: float
+    ) -> ThresholdProfile:
+        """Add a profile or recalibrate an existing one."""
+        return self.update({
+            profile_id: (proceed_threshold, hold_threshold)
+        })[0]
+
+    def update(
+        self, profiles: Mapping[str, Tuple[float, float]]
+    ) -> List[ThresholdProfile]:
+        """Add or recalibrate several profiles in one snapshot.
+
+        Every pair is validated before any is applied, so either all
+        changes become visible together or none do.
+        """
+        validated = [
+            ThresholdProfile(profile_id, proceed, hold)
+            for profile_id, (proceed, hold) in profiles.items()
+        ]
+        with self._lock:
+            index, proceed, hold = self._snapshot
+            new = [p for p in validated if p.profile_id not in index]
+            if new:
+                index = {**index}
+                for profile in new:
+                    index[profile.profile_id] = len(index)
+            proceed = np.resize(proceed, len(index))
+            hold = np.resize(hold, len(index))
+            for profile in validated:
+                code = index[profile.profile_id]
+                proceed[code] = profile.proceed_threshold
+                hold[code] = profile.hold_threshold
+                self._profiles[profile.profile_id] = profile
+            self._snapshot = (index, proceed, hold)
+        return validated
+
+    def get(self, profile_id: str) -> ThresholdProfile:
+        """Return a profile by id.
+
+        Raises:
+            ValueError: If no profile has this id.
+        """
+        try:
+            return self._profiles[profile_id]
+        except KeyError:
+            raise ValueError(
+                f"Unknown threshold profile: {profile_id!r}"
+            ) from None
+
+    def __contains__(self, profile_id: str) -> bool:
+        return profile_id in self._profiles
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._profiles))
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Profile id -> {'proceed_threshold', 'hold_threshold'}."""
+        return {
+            profile_id: {
+                'proceed_threshold': profile.proceed_threshold,
+                'hold_threshold': profile.hold_threshold,
+            }
+            for profile_id, profile in list(self._profiles.items())
+        }
+
+    @property
+    def profile_ids(self) -> List[str]:
+        """Profile ids in code order."""
+        return list(self._snapshot[0])
+
+    # -- vectorized lookup ------------------------------------------------
+
+    def snapshot(self) -> Tuple[Dict[str, int], np.ndarray, np.ndarray]:
+        """Return (id -> code, proceed by code, hold by code).
+
+        The returned objects are never modified by later set() calls.
+        """
+        return self._snapshot
+
+    def codes(
+        self,
+        profile_ids: Union[str, Sequence[str], np.ndarray],
+        snapshot: Optional[Tuple[Dict[str, int], np.ndarray, np.ndarray]] = None
+    ) -> np.ndarray:
+        """Map profile ids to int32 profile codes.
+
+        Each distinct id is looked up once; the rest is array indexing.
+
+        Raises:
+            ValueError: If any id is not in the table.
+        """
+        index = (snapshot or self._snapshot)[0]
+        ids = np.asarray(profile_ids)
+        unique, inverse = np.unique(ids, return_inverse=True)
+        lookup = np.empty(len(unique), dtype=np.int32)
+        for i, profile_id in enumerate(unique.tolist()):
+            code = index.get(profile_id)
+            if code is None:
+                raise ValueError(f"Unknown threshold profile: {profile_id!r}")
+            lookup[i] = code
+        return lookup[inverse].reshape(ids.shape)
+
+    def classify(
+        self,
+        confidences: Union[np.ndarray, Sequence[float]],
+        profile_ids: Union[str, Sequence[str], np.ndarray]
+    ) -> np.ndarray:
+        """Return int8 states (+1/0/-1) for confidences under their profiles.
+
+        Uses the same rule as TLEngine.evaluate: PROCEED at or above the
+        profile's proceed_threshold, REFUSE below its hold_threshold,
+        EPISTEMIC_HOLD in between.
+        """
+        snapshot = self._snapshot
+        codes = self.codes(profile_ids, snapshot)
+        return classify_codes(
+            np.asarray(confidences, dtype=np.float64), codes, snapshot
+        )
+
+
+def classify_codes(
+    confidences: np.ndarray,
+    codes: np.ndarray,
+    snapshot: Tuple[Dict[str, int], np.ndarray, np.ndarray]
+) -> np.ndarray:
+    """Classify confidences against per-decision profile codes."""
+    _, proceed, hold = snapshot
+    states = np.zeros(len(confidences), dtype=np.int8)
+    states[confidences >= proceed[codes]] = 1
+    states[confidences < hold[codes]] = -1
+    return states
+
+
+@dataclass(frozen=True, eq=False)
+class ThresholdVersion:
+    """One published, immutable set of engine thresholds.
+
+    Attributes:
+        epoch: Version number, starting at 0 and increasing by one per
+               recalibration.
+        proceed_threshold: The engine's own proceed threshold.
+        hold_threshold: The engine's own hold threshold.
+        profiles: Snapshot of the engine's ThresholdProfileTable, if any.
+        activated_at: When this version was published.
+    """
+    epoch: int
+    proceed_threshold: float
+    hold_threshold: float
+    profiles: Optional[Tuple[Dict[str, int], np.ndarray, np.ndarray]] = None
+    activated_at: datetime = field(default_factory=datetime.utcnow)
+
+    def __post_init__(self):
+        validate_thresholds(self.proceed_threshold, self.hold_threshold)
+
+    def profile_thresholds(self, profile_id: str) -> Tuple[float, float]:
+        """Return (proceed, hold) for a profile in this version.
+
+        Raises:
+            ValueError: If the version has no such profile.
+        """
+        code = self.profiles[0].get(profile_id) if self.profiles else None
+        if code is None:
+            raise ValueError(f"Unknown threshold profile: {profile_id!r}")
+        return float(self.profiles[1][code]), float(self.profiles[2][code])
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'epoch': self.epoch,
+            'proceed_threshold': self.proceed_threshold,
+            'hold_threshold': self.hold_threshold,
+            'activated_at': self.activated_at.isoformat(),
+        }
+        if self.profiles is not None:
+            index, proceed, hold = self.profiles
+            data['profiles'] = {
+                profile_id: {
+                    'proceed_threshold': float(proceed[code]),
+                    'hold_threshold': float(hold[code]),
+                }
+                for profile_id, code in index.items()
+            }
+        return data
+
+
+class ProfileStatistics:
+    """Running per-profile decision counts and confidence sums.
+
+    Updated in O(1) per decision and with bincount per batch, so
+    per-profile statistics never rescan the decision log.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # profile id -> [proceed, hold, refuse, confidence_sum]
+        self._totals: Dict[str, List[float]] = {}
+
+    def record(self, profile_id: str, state_value: int, confidence: float):
+        with self._lock:
+            totals = self._totals.get(profile_id)
+            if totals is None:
+                totals = self._totals[profile_id] = [0, 0, 0, 0.0]
+            totals[1 - state_value] += 1
+            totals[3] += confidence
+
+    def record_batch(
+        self,
+        profile_ids: Sequence[str],
+        codes: np.ndarray,
+        states: np.ndarray,
+        confidences: np.ndarray
+    ):
+        """Add a batch; codes index into profile_ids."""
+        n_profiles = len(profile_ids)
+        # Slot 0/1/2 per profile = PROCEED/EPISTEMIC_HOLD/REFUSE.
+        counts = np.bincount(
+            codes * 3 + (1 - states.astype(np.int64)),
+            minlength=3 * n_profiles
+        ).reshape(n_profiles, 3)
+        sums = np.bincount(codes, weights=confidences, minlength=n_profiles)
+        with self._lock:
+            for code in np.flatnonzero(counts.sum(axis=1)).tolist():
+                totals = self._totals.get(profile_ids[code])
+                if totals is None:
+                    totals = self._totals[profile_ids[code]] = [0, 0, 0, 0.0]
+                proceed, held, refuse = counts[code].tolist()
+                totals[0] += proceed
+                totals[1] += held
+                totals[2] += refuse
+                totals[3] += float(sums[code])
+
+    def summary(self, profile_id: str) -> Dict[str, Any]:
+        """Counts and rates for one profile (zeros if it has no decisions)."""
+        with self._lock:
+            proceed, held, refuse, confidence_sum = self._totals.get(
+                profile_id, (0, 0, 0, 0.0)
+            )
+        total = proceed + held + refuse
+        return {
+            'total_decisions': total,
+            'proceed_count': proceed,
+            'hold_count': held,
+            'refuse_count': refuse,
+            'proceed_rate': proceed / total if total else 0.0,
+            'epistemic_hold_rate': held / total if total else 0.0,
+            'refuse_rate': refuse / total if total else 0.0,
+            'average_confidence': confidence_sum / total if total else 0.0,
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._totals))
+
 
 class ThresholdManager:
     """Manages decision thresholds."""
-    
+
     def __init__(self):
         self.thresholds = {
             'confidence': 0.7,
             'risk': 0.3,
             'uncertainty': 0.5
         }
-    
+
     def get_threshold(self, key):
         """Get threshold value."""
         return self.thresholds.get(key, 0.5)
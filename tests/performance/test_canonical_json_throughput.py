@@ -0,0 +1,69 @@
+"""
+Throughput benchmark for RFC 8785 canonicalization of log payloads.
+
+Compares hashing the commit_log_entry decision payload through
+canonical_digest() with the json.dumps(sort_keys=True) path it replaced.
+Canonicalization runs on every commit, so the spec-compliant path should
+cost no more than the one it replaced.
+"""
+import hashlib
+import json
+import time
+
+import pytest
+from ternary_logic import canonical_digest
+
+N = 50_000
+
+
+def _best_time(func, repeats=5):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _payloads():
+    return [
+        {
+            "logId": f"3f1c2a9e-8d7b-4c6a-9e21-{i:012x}",
+            "state": "EPISTEMIC_HOLD",
+            "stateValue": 0,
+            "confidence": 0.52,
+            "reasoning": "Confidence 0.52 in uncertainty band",
+            "committedAt": "2026-01-01T00:00:00.123456+00:00",
+        }
+        for i in range(N)
+    ]
+
+
+class TestCanonicalJSONThroughput:
+    """Benchmark canonical payload hashing against json.dumps."""
+
+    @pytest.mark.performance
+    def test_log_payload_hashing(self):
+        payloads = _payloads()
+
+        def json_path():
+            return [
+                hashlib.sha256(
+                    json.dumps(p, sort_keys=True).encode("utf-8")
+                ).hexdigest()
+                for p in payloads
+            ]
+
+        def canonical_path():
+            return [canonical_digest(p).hexdigest() for p in payloads]
+
+        json_time = _best_time(json_path)
+        canonical_time = _best_time(canonical_path)
+        print(
+            f"\nlog payload hashing: json.dumps {N / json_time / 1e3:.0f}k/s, "
+            f"canonical {N / canonical_time / 1e3:.0f}k/s"
+        )
+
+        assert len(set(canonical_path())) == N
+        # Allow for timing noise.
+        assert canonical_time < json_time * 1.1
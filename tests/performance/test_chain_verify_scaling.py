@@ -0,0 +1,69 @@
+"""
+Scaling benchmark for ChainVerifier.
+
+Verifies the same checkpointed chain with one worker and with every
+available core. With four or more cores the parallel run should be
+clearly faster; on smaller machines the benchmark only checks that both
+runs report the same result.
+"""
+import hashlib
+import os
+import time
+
+import pytest
+from ternary_logic import ChainVerifier, CheckpointLog
+from ternary_logic.ledger_verify import chain_root, entry_log_hash
+
+ENTRIES = 200_000
+GENESIS = hashlib.sha256(b"TL_GENESIS").hexdigest()
+
+
+def _chain(checkpoints):
+    entries, previous = [], GENESIS
+    for i in range(ENTRIES):
+        entry = {
+            "logId": f"log-{i:08d}",
+            "currentState": 0,
+            "stateLabel": "EPISTEMIC_HOLD",
+            "confidence": 0.52,
+            "reasoning": "Confidence in uncertainty band",
+            "committedAt": "2026-01-01T00:00:00+00:00",
+        }
+        entry["logHash"] = entry_log_hash(entry)
+        entry["previousHash"] = previous
+        entry["merkleRoot"] = previous = chain_root(previous, entry["logHash"])
+        entries.append(entry)
+        checkpoints.record(i, entry)
+    return entries
+
+
+def _run(workers, entries, checkpoints):
+    verifier = ChainVerifier(
+        GENESIS, checkpoints, span_size=25_000, max_workers=workers
+    )
+    start = time.perf_counter()
+    report = verifier.verify(entries)
+    return report, time.perf_counter() - start
+
+
+class TestChainVerifyScaling:
+    """Benchmark chain verification across worker processes."""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_chain_verify_scaling(self):
+        checkpoints = CheckpointLog(b"benchmark-key", interval=10_000)
+        entries = _chain(checkpoints)
+        cores = os.cpu_count() or 1
+
+        serial, serial_time = _run(1, entries, checkpoints)
+        parallel, parallel_time = _run(cores, entries, checkpoints)
+
+        print(f"\n1 worker: {ENTRIES / serial_time:,.0f} entries/s")
+        print(f"{cores} workers: {ENTRIES / parallel_time:,.0f} entries/s")
+
+        assert serial.ok and parallel.ok
+        assert serial.entries_checked == parallel.entries_checked == ENTRIES
+        assert parallel.checkpoints_checked == ENTRIES // 10_000
+        if cores >= 4:
+            assert parallel_time < serial_time / 2
@@ -0,0 +1,139 @@
+"""
+Throughput benchmark for the binary record codec.
+
+Compares encoding and decoding TLValue and EpistemicHoldEvent records
+through to_bytes()/decode_record with the JSON path used for persistence
+today (to_dict() + json.dumps, json.loads + from_dict), and the size of
+the encoded records.
+"""
+import json
+import time
+from datetime import datetime
+
+import pytest
+from ternary_logic import (
+    EpistemicHoldEvent,
+    TLState,
+    TLValue,
+    decode_record,
+    iter_decode_records,
+)
+
+N = 20_000
+
+
+def _best_time(func, repeats=5):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _values():
+    return [
+        TLValue(
+            TLState.EPISTEMIC_HOLD, 0.52,
+            "Confidence in uncertainty band; awaiting second feed",
+            metadata={'desk': 'rates', 'instrument': f"UST-{i % 40}"},
+            profile='rates-desk', threshold_epoch=3
+        )
+        for i in range(N)
+    ]
+
+
+def _holds():
+    return [
+        EpistemicHoldEvent(
+            event_id=f"{i:016x}", trigger_reason="Conflicting signals",
+            data_inputs={'confidence': 0.52, 'reasoning': "benchmark"},
+            model_outputs={}, signal_conflicts=['feed-a vs feed-b'],
+            uncertainty_metrics={'confidence': 0.52},
+            timestamp=datetime(2026, 1, 1)
+        )
+        for i in range(N)
+    ]
+
+
+def _value_from_dict(data):
+    return TLValue(
+        state=TLState[data['state']], confidence=data['confidence'],
+        reasoning=data['reasoning'], metadata=data['metadata'],
+        timestamp=datetime.fromisoformat(data['timestamp']),
+        profile=data.get('profile'), threshold_epoch=data['threshold_epoch']
+    )
+
+
+def _report(label, records, json_blobs, binary_blobs, times):
+    json_size = sum(len(b) for b in json_blobs) / len(records)
+    binary_size = sum(len(b) for b in binary_blobs) / len(records)
+    rates = {k: len(records) / t / 1e3 for k, t in times.items()}
+    print(
+        f"\n{label}: JSON {json_size:.0f} B, binary {binary_size:.0f} B; "
+        f"encode {rates['json_encode']:.0f}k/s vs {rates['binary_encode']:.0f}k/s, "
+        f"decode {rates['json_decode']:.0f}k/s vs {rates['binary_decode']:.0f}k/s"
+    )
+    return json_size, binary_size
+
+
+class TestCodecThroughput:
+    """Benchmark the binary codec against JSON."""
+
+    @pytest.mark.performance
+    def test_tl_value_codec_beats_json(self):
+        values = _values()
+        json_blobs = [json.dumps(v.to_dict()).encode() for v in values]
+        binary_blobs = [v.to_bytes() for v in values]
+        stream = b''.join(binary_blobs)
+
+        times = {
+            'json_encode': _best_time(
+                lambda: [json.dumps(v.to_dict()).encode() for v in values]
+            ),
+            'binary_encode': _best_time(lambda: [v.to_bytes() for v in values]),
+            'json_decode': _best_time(
+                lambda: [_value_from_dict(json.loads(b)) for b in json_blobs]
+            ),
+            'binary_decode': _best_time(
+                lambda: list(iter_decode_records(stream))
+            ),
+        }
+        json_size, binary_size = _report(
+            "TLValue", values, json_blobs, binary_blobs, times
+        )
+
+        assert list(iter_decode_records(stream)) == values
+        assert binary_size < json_size / 2
+        assert times['binary_encode'] < times['json_encode']
+        # Decoding runs the same constructors as the JSON path; allow for
+        # timing noise.
+        assert times['binary_decode'] < times['json_decode'] * 1.1
+
+    @pytest.mark.performance
+    def test_hold_event_codec_beats_json(self):
+        holds = _holds()
+        json_blobs = [json.dumps(h.to_dict()).encode() for h in holds]
+        binary_blobs = [h.to_bytes() for h in holds]
+
+        times = {
+            'json_encode': _best_time(
+                lambda: [json.dumps(h.to_dict()).encode() for h in holds]
+            ),
+            'binary_encode': _best_time(lambda: [h.to_bytes() for h in holds]),
+            'json_decode': _best_time(lambda: [
+                EpistemicHoldEvent.from_dict(json.loads(b)) for b in json_blobs
+            ]),
+            'binary_decode': _best_time(
+                lambda: [decode_record(b) for b in binary_blobs]
+            ),
+        }
+        json_size, binary_size = _report(
+            "EpistemicHoldEvent", holds, json_blobs, binary_blobs, times
+        )
+
+        assert [decode_record(b) for b in binary_blobs] == holds
+        assert binary_size < json_size * 0.6
+        # Both paths JSON-encode the nested hold inputs; allow for noise.
+        assert times['binary_encode'] < times['json_encode'] * 1.1
+        assert times['binary_decode'] < times['json_decode'] * 1.1
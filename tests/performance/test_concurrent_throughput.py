@@ -0,0 +1,62 @@
+"""
+Stress benchmark for ConcurrentTLEngine.
+
+Measures decisions per second as threads are added. On free-threaded
+CPython builds throughput should scale close to linearly; on GIL builds
+the benchmark only asserts that no decision is lost.
+"""
+import pytest
+import sys
+import threading
+import time
+from ternary_logic import ConcurrentTLEngine
+
+PER_THREAD = 20_000
+
+
+def _free_threaded() -> bool:
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _run(threads: int):
+    engine = ConcurrentTLEngine(
+        proceed_threshold=0.75, hold_threshold=0.35, log_mode='off'
+    )
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for i in range(PER_THREAD):
+            engine.evaluate(0.9 if i % 2 else 0.1, "stress")
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return engine, threads * PER_THREAD / elapsed
+
+
+class TestConcurrentThroughput:
+    """Benchmark throughput and decision accounting across threads."""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_throughput_scaling(self):
+        """Throughput grows with threads (free-threaded) and nothing is lost."""
+        rates = {}
+        for threads in (1, 2, 4):
+            engine, rate = _run(threads)
+            rates[threads] = rate
+            assert engine.get_statistics()['total_decisions'] == (
+                threads * PER_THREAD
+            )
+            assert len(engine.decision_log) == threads * PER_THREAD
+            print(f"{threads} thread(s): {rate:,.0f} decisions/second")
+
+        if _free_threaded():
+            assert rates[4] > rates[1] * 2.5
@@ -0,0 +1,51 @@
+"""
+Paging benchmark for SQLiteHoldStore.
+
+Loads one million hold records and checks that fetching a page of
+unresolved holds stays in the millisecond range, both at the start of the
+result and deep into it.
+"""
+import time
+import pytest
+from datetime import datetime, timedelta
+from ternary_logic import EpistemicHoldEvent, SQLiteHoldStore
+
+HOLDS = 1_000_000
+
+
+class TestHoldStorePaging:
+    """Benchmark keyset paging over a large hold store."""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_page_latency(self, tmp_path):
+        store = SQLiteHoldStore(str(tmp_path / 'holds.sqlite3'), batch_size=10_000)
+        start = datetime(2026, 1, 1)
+        for i in range(HOLDS):
+            event = EpistemicHoldEvent(
+                event_id=f"{i:016x}", trigger_reason="Conflicting signals",
+                data_inputs={}, model_outputs={}, signal_conflicts=[],
+                uncertainty_metrics={'confidence': 0.5},
+                timestamp=start + timedelta(milliseconds=i)
+            )
+            if i % 2:
+                event.resolve("Reviewed")
+            store.add(event)
+        store.flush()
+
+        first = store.page(limit=100, resolved=False)
+        deep = store.page(
+            limit=1, resolved=False, since=start + timedelta(seconds=900)
+        )
+        deep_cursor = deep.next_cursor
+
+        timings = []
+        for cursor in (first.next_cursor, deep_cursor):
+            t0 = time.perf_counter()
+            page = store.page(limit=100, resolved=False, after=cursor)
+            timings.append(time.perf_counter() - t0)
+            assert len(page.records) == 100
+        store.close()
+
+        print(f"\nPage latency: {[f'{t * 1000:.2f} ms' for t in timings]}")
+        assert max(timings) < 0.05
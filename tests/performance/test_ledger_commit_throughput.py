@@ -0,0 +1,69 @@
+"""
+Throughput benchmark for durable ledger commits.
+
+Every DurableLedger.commit returns only after its entry is synced to
+disk. Run serially, that costs one fdatasync per commit. With concurrent
+committers, group commit folds many commits into each sync. This
+benchmark measures both on the disk holding the pytest temp directory
+and reports commits per second and commits per sync.
+"""
+import threading
+import time
+
+import pytest
+from ternary_logic import DurableLedger
+
+THREADS = 16
+PER_THREAD = 250
+
+
+def _entry(k, i):
+    return {
+        'logId': f"{k:04d}-{i:06d}",
+        'currentState': 0,
+        'stateLabel': 'EPISTEMIC_HOLD',
+        'logHash': f"{k * PER_THREAD + i:064x}",
+        'merkleRoot': f"{i:064x}",
+    }
+
+
+def _run(store, threads, per_thread):
+    def committer(k):
+        for i in range(per_thread):
+            store.commit(_entry(k, i))
+
+    workers = [
+        threading.Thread(target=committer, args=(k,)) for k in range(threads)
+    ]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - start
+
+
+class TestLedgerCommitThroughput:
+    """Benchmark durable commits with and without concurrency."""
+
+    @pytest.mark.performance
+    def test_group_commit_batches_syncs(self, tmp_path):
+        serial = DurableLedger(tmp_path / "serial")
+        serial_time = _run(serial, 1, PER_THREAD)
+
+        grouped = DurableLedger(tmp_path / "grouped", group_commit_window=0.001)
+        grouped_time = _run(grouped, THREADS, PER_THREAD)
+        total = THREADS * PER_THREAD
+
+        print(
+            f"\nDurable commits: serial {PER_THREAD / serial_time:,.0f}/s "
+            f"({PER_THREAD / serial.sync_count:.1f} per sync); "
+            f"{THREADS} committers {total / grouped_time:,.0f}/s "
+            f"({total / grouped.sync_count:.1f} per sync)"
+        )
+
+        assert len(grouped) == total
+        assert sum(1 for _ in grouped.iter_entries()) == total
+        assert serial.sync_count == PER_THREAD
+        # Group commit must share syncs between committers.
+        assert grouped.sync_count < total / 4
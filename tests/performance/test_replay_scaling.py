@@ -0,0 +1,46 @@
+"""
+Scaling benchmark for ParallelReplay.
+
+Replays the same record=True workload with one worker and with every
+available core. With four or more cores the parallel run should be
+clearly faster; on smaller machines the benchmark only checks that the
+merged results agree.
+"""
+import os
+import time
+import pytest
+import numpy as np
+from ternary_logic import ParallelReplay
+
+DECISIONS = 500_000
+
+
+def _run(workers: int, confidences):
+    replay = ParallelReplay(
+        proceed_threshold=0.75, hold_threshold=0.35,
+        chunk_size=100_000, max_workers=workers
+    )
+    start = time.perf_counter()
+    result = replay.run_arrays(confidences, reasonings="scaling")
+    return result, time.perf_counter() - start
+
+
+class TestReplayScaling:
+    """Benchmark replay throughput across worker processes."""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_replay_scaling(self):
+        confidences = np.random.default_rng(0).random(DECISIONS)
+        cores = os.cpu_count() or 1
+
+        serial, serial_time = _run(1, confidences)
+        parallel, parallel_time = _run(cores, confidences)
+
+        print(f"\n1 worker: {DECISIONS / serial_time:,.0f} decisions/s")
+        print(f"{cores} workers: {DECISIONS / parallel_time:,.0f} decisions/s")
+
+        np.testing.assert_array_equal(serial.states, parallel.states)
+        assert serial.statistics['hold_count'] == parallel.statistics['hold_count']
+        if cores >= 4:
+            assert parallel_time < serial_time / 2
@@ -0,0 +1,60 @@
+"""
+Performance tests for statistics latency.
+
+get_statistics and epistemic_hold_rate are polled by monitoring loops,
+so their latency must not grow with the number of logged decisions.
+"""
+import pytest
+import time
+import numpy as np
+from ternary_logic import TLEngine, ColumnarDecisionLog
+
+
+def _median_latency(func, repeats=200):
+    """Median wall-clock latency of func() in microseconds."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples)) * 1e6
+
+
+class TestStatisticsLatency:
+    """Benchmark statistics queries against decision log size."""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_constant_latency_at_10m_decisions(self):
+        """Statistics latency at 10M decisions stays close to latency at 1K."""
+        engine = TLEngine(
+            proceed_threshold=0.75,
+            hold_threshold=0.35,
+            decision_log=ColumnarDecisionLog(chunk_size=1 << 20)
+        )
+        rng = np.random.default_rng(0)
+
+        def log_decisions(n):
+            # Draw outside the hold band so the benchmark measures the
+            # decision log, not millions of EpistemicHoldEvent objects.
+            conf = rng.random(n)
+            conf = np.where(conf < 0.5, conf * 0.7, 0.75 + (conf - 0.5) * 0.5)
+            engine.evaluate_batch(conf, reasonings="benchmark")
+
+        log_decisions(1_000)
+        small_stats = _median_latency(engine.get_statistics)
+        small_rate = _median_latency(lambda: engine.epistemic_hold_rate)
+
+        for _ in range(10):
+            log_decisions(1_000_000)
+        assert engine.get_statistics()['total_decisions'] == 10_001_000
+
+        large_stats = _median_latency(engine.get_statistics)
+        large_rate = _median_latency(lambda: engine.epistemic_hold_rate)
+
+        print(f"get_statistics: {small_stats:.2f}us @1K, "
+              f"{large_stats:.2f}us @10M")
+        print(f"epistemic_hold_rate: {small_rate:.2f}us @1K, "
+              f"{large_rate:.2f}us @10M")
+        assert large_stats < small_stats * 5 + 50
+        assert large_rate < small_rate * 5 + 50
@@ -0,0 +1,73 @@
+"""
+Performance tests for TL value construction.
+
+Compares the TLValue dataclass with the slotted CompactTLValue on the
+evaluate() hot path: allocated bytes per decision and construction time.
+"""
+import pytest
+import time
+import tracemalloc
+from ternary_logic import TLEngine, TLState, TLValue, CompactTLValue
+
+N = 20_000
+
+
+def _allocated_bytes(func):
+    """Bytes still allocated after func() returns."""
+    tracemalloc.start()
+    try:
+        func()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current
+
+
+def _best_time(func, repeats=5):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class TestValueConstruction:
+    """Benchmark TLValue against CompactTLValue."""
+
+    @pytest.mark.performance
+    def test_compact_values_allocate_less_in_evaluate(self):
+        """Logged CompactTLValues hold fewer bytes than TLValues."""
+        def run(value_class):
+            engine = TLEngine(
+                proceed_threshold=0.75, hold_threshold=0.35,
+                log_mode='off', value_class=value_class
+            )
+
+            def evaluate_all():
+                for _ in range(N):
+                    engine.evaluate(0.9, "benchmark")
+            return _allocated_bytes(evaluate_all), engine
+
+        dataclass_bytes, _ = run(TLValue)
+        compact_bytes, _ = run(CompactTLValue)
+        print(f"evaluate: {dataclass_bytes / N:.0f} B/decision (TLValue), "
+              f"{compact_bytes / N:.0f} B/decision (CompactTLValue)")
+        assert compact_bytes < dataclass_bytes
+
+    @pytest.mark.performance
+    def test_compact_construction_is_faster(self):
+        """Constructing CompactTLValue beats the TLValue dataclass."""
+        def build(factory):
+            return lambda: [factory() for _ in range(N)]
+
+        dataclass_time = _best_time(build(
+            lambda: TLValue(state=TLState.PROCEED, confidence=0.9,
+                            reasoning="benchmark")
+        ))
+        compact_time = _best_time(build(
+            lambda: CompactTLValue(TLState.PROCEED, 0.9, "benchmark")
+        ))
+        print(f"construction: {dataclass_time / N * 1e9:.0f} ns (TLValue), "
+              f"{compact_time / N * 1e9:.0f} ns (CompactTLValue)")
+        assert compact_time < dataclass_time
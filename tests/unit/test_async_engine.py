@@ -0,0 +1,132 @@
+"""
+Unit tests for the asyncio engine front end.
+
+Test philosophy:
+    AsyncTLEngine must produce the same decisions as TLEngine while
+    keeping blocking persistence off the event loop.
+"""
+import asyncio
+import json
+import threading
+import time
+import pytest
+from ternary_logic import (
+    AsyncTLEngine, TLDecorator, TLState, ThresholdProfileTable
+)
+
+
+def make_engine(**kwargs):
+    """Async engine with sample thresholds."""
+    return AsyncTLEngine(proceed_threshold=0.75, hold_threshold=0.35, **kwargs)
+
+
+class TestAsyncTLEngine:
+    """Test AsyncTLEngine and async-aware TLDecorator."""
+
+    def test_evaluate_matches_sync_semantics(self):
+        """States follow the configured thresholds."""
+        async def scenario():
+            engine = make_engine()
+            states = [
+                (await engine.evaluate(c, "async")).state
+                for c in (0.9, 0.5, 0.1)
+            ]
+            await engine.aclose()
+            return states, engine.get_statistics()
+
+        states, stats = asyncio.run(scenario())
+        assert states == [TLState.PROCEED, TLState.EPISTEMIC_HOLD, TLState.REFUSE]
+        assert stats['hold_count'] == 1
+
+    def test_evaluate_routes_profiles(self):
+        """profile selects that profile's thresholds, as in TLEngine."""
+        async def scenario():
+            engine = make_engine(
+                profiles=ThresholdProfileTable({'credit': (0.90, 0.60)})
+            )
+            decision = await engine.evaluate(0.8, "async", profile='credit')
+            await engine.aclose()
+            return decision
+
+        decision = asyncio.run(scenario())
+        assert decision.state == TLState.EPISTEMIC_HOLD
+        assert decision.profile == 'credit'
+
+    def test_audit_sink_runs_off_the_loop(self):
+        """A slow sink does not block evaluation on the loop."""
+        sink_threads = []
+        received = []
+
+        def slow_sink(batch):
+            sink_threads.append(threading.get_ident())
+            time.sleep(0.2)
+            received.extend(kind for kind, _ in batch)
+
+        async def scenario():
+            engine = make_engine(audit_sink=slow_sink)
+            start = time.perf_counter()
+            for _ in range(20):
+                await engine.evaluate(0.5, "tick")
+            elapsed = time.perf_counter() - start
+            await engine.aclose()
+            return elapsed
+
+        elapsed = asyncio.run(scenario())
+        assert elapsed < 0.2
+        assert threading.get_ident() not in sink_threads
+        assert received.count('decision') == 20
+        assert received.count('epistemic_hold') == 20
+
+    def test_failing_sink_keeps_records(self):
+        """A sink error reaches flush() and loses no records."""
+        received = []
+        failures = [RuntimeError("store unavailable")]
+
+        def flaky_sink(batch):
+            if failures:
+                raise failures.pop()
+            received.extend(kind for kind, _ in batch)
+
+        async def scenario():
+            engine = make_engine(audit_sink=flaky_sink)
+            for c in (0.9, 0.5):
+                await engine.evaluate(c, "tick")
+            with pytest.raises(RuntimeError, match="store unavailable"):
+                await engine.flush()
+            await engine.evaluate(0.1, "tick")
+            await engine.aclose()
+
+        asyncio.run(scenario())
+        assert received == [
+            'decision', 'decision', 'epistemic_hold', 'decision'
+        ]
+
+    def test_export_runs_on_executor(self, tmp_path):
+        """export_audit_trail writes a complete trail asynchronously."""
+        async def scenario():
+            engine = make_engine()
+            await engine.evaluate_batch([0.9, 0.5, 0.1])
+            await engine.export_audit_trail(str(tmp_path / "audit.json"))
+            await engine.aclose()
+
+        asyncio.run(scenario())
+        audit = json.loads((tmp_path / "audit.json").read_text())
+        assert len(audit['decision_log']) == 3
+
+    def test_decorator_wraps_async_functions(self):
+        """TLDecorator awaits async signal functions and async engines."""
+        async def scenario():
+            engine = make_engine()
+
+            @TLDecorator(engine)
+            async def signal(confidence):
+                await asyncio.sleep(0)
+                return confidence, "async signal", {'source': 'test'}
+
+            value = await signal(0.8)
+            await engine.aclose()
+            return value
+
+        value = asyncio.run(scenario())
+        assert value.state == TLState.PROCEED
+        assert value.metadata == {'source': 'test'}
@@ -0,0 +1,121 @@
+"""
+Unit tests for the streaming NDJSON audit exporter.
+
+Test philosophy:
+    The stream must carry every audit record exactly once, in order,
+    across file rotation and exporter restarts.
+"""
+import gzip
+import json
+import pytest
+from ternary_logic import TLEngine, NDJSONAuditExporter
+
+
+@pytest.fixture
+def engine():
+    """Engine with sample thresholds for export tests."""
+    return TLEngine(proceed_threshold=0.75, hold_threshold=0.35)
+
+
+def read_stream(directory):
+    """All records from every export file, in file order."""
+    records = []
+    for path in sorted(directory.glob("audit-*.ndjson*")):
+        opener = gzip.open if path.suffix == '.gz' else open
+        with opener(path, 'rt') as f:
+            records.extend(json.loads(line) for line in f)
+    return records
+
+
+class TestNDJSONAuditExporter:
+    """Test incremental export, rotation, compression and resume."""
+
+    def test_streams_decisions_holds_and_resolutions(self, engine, tmp_path):
+        """Each audit record becomes one typed NDJSON line."""
+        exporter = NDJSONAuditExporter(str(tmp_path))
+        exporter.attach(engine)
+        engine.evaluate(0.9, "proceed")
+        engine.evaluate(0.5, "hold")
+        engine.resolve_hold(engine.epistemic_holds[0].event_id, "approved")
+        exporter.close()
+
+        kinds = [r['record_type'] for r in read_stream(tmp_path)]
+        assert kinds == [
+            'decision', 'decision', 'epistemic_hold', 'hold_resolution'
+        ]
+        assert exporter.offsets['decisions'] == 2
+
+    def test_rotates_by_size(self, engine, tmp_path):
+        """Files rotate once they reach max_bytes."""
+        exporter = NDJSONAuditExporter(str(tmp_path), max_bytes=400)
+        exporter.attach(engine)
+        for i in range(20):
+            engine.evaluate(0.9, f"decision {i}")
+        exporter.close()
+        assert len(list(tmp_path.glob("audit-*.ndjson"))) > 1
+        reasonings = [r['reasoning'] for r in read_stream(tmp_path)]
+        assert reasonings == [f"decision {i}" for i in range(20)]
+
+    def test_gzip_output(self, engine, tmp_path):
+        """compress=True writes readable gzip files."""
+        exporter = NDJSONAuditExporter(str(tmp_path), compress=True)
+        exporter.attach(engine)
+        engine.evaluate_batch([0.9, 0.1, 0.95])
+        exporter.close()
+        assert len(read_stream(tmp_path)) == 3
+
+    def test_resume_from_offset(self, engine, tmp_path):
+        """A new exporter backfills only records after the checkpoint."""
+        first = NDJSONAuditExporter(str(tmp_path))
+        first.attach(engine)
+        engine.evaluate(0.9, "before restart")
+        first.close()
+
+        engine.evaluate(0.1, "while detached")
+        second = NDJSONAuditExporter(str(tmp_path))
+        second.attach(engine)
+        engine.evaluate(0.95, "after restart")
+        second.close()
+
+        reasonings = [r['reasoning'] for r in read_stream(tmp_path)]
+        assert reasonings == [
+            "before restart", "while detached", "after restart"
+        ]
+
+    def test_refuses_to_resume_against_another_engine(self, engine, tmp_path):
+        """Checkpoint offsets are never applied to a different engine."""
+        first = NDJSONAuditExporter(str(tmp_path))
+        first.attach(engine)
+        engine.evaluate(0.9, "original 1")
+        engine.evaluate(0.5, "original 2")
+        first.close()
+
+        restarted = TLEngine(proceed_threshold=0.75, hold_threshold=0.35)
+        for i in range(3):
+            restarted.evaluate(0.9, f"restarted {i}")
+        second = NDJSONAuditExporter(str(tmp_path))
+        with pytest.raises(ValueError, match="does not match this engine"):
+            second.attach(restarted)
+
+        second.attach(restarted, backfill=False)
+        restarted.evaluate(0.9, "new")
+        second.close()
+        reasonings = [
+            r['reasoning'] for r in read_stream(tmp_path)
+            if r['record_type'] == 'decision'
+        ]
+        assert reasonings == ["original 1", "original 2", "new"]
+
+    def test_hold_is_exported_as_it_was_queued(self, engine, tmp_path):
+        """A later resolution does not leak into the hold's line."""
+        exporter = NDJSONAuditExporter(str(tmp_path))
+        engine.evaluate(0.5, "hold")
+        event = engine.epistemic_holds[0]
+        exporter('epistemic_hold', event)
+        engine.resolve_hold(event.event_id, "approved")
+        exporter.attach(engine, backfill=False)
+        exporter.close()
+
+        [hold] = read_stream(tmp_path)
+        assert hold['record_type'] == 'epistemic_hold'
+        assert hold['resolution_action'] is None
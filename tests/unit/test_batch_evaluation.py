@@ -0,0 +1,94 @@
+"""
+Unit tests for vectorized batch evaluation.
+
+Test philosophy:
+    The batch path is an optimization, not a second decision procedure.
+    Every test checks that evaluate_batch produces exactly the states
+    that evaluate() would produce for the same inputs, expressed
+    relative to the engine's configured thresholds.
+"""
+import pytest
+import numpy as np
+from ternary_logic import TLEngine, TLState, TLBatchResult, UNFORCED
+
+
+@pytest.fixture
+def engine():
+    """Engine with sample thresholds for batch tests."""
+    return TLEngine(proceed_threshold=0.75, hold_threshold=0.35)
+
+
+class TestBatchEvaluation:
+    """Test TLEngine.evaluate_batch against the scalar evaluate path."""
+
+    def test_batch_matches_scalar_states(self, engine):
+        """Batch states equal scalar states, including both boundaries."""
+        confidences = np.concatenate([
+            np.random.default_rng(7).random(500),
+            [engine.proceed_threshold, engine.hold_threshold, 0.0, 1.0]
+        ])
+        reference = TLEngine(
+            proceed_threshold=engine.proceed_threshold,
+            hold_threshold=engine.hold_threshold
+        )
+        expected = [
+            reference.evaluate(float(c), "scalar").state.value
+            for c in confidences
+        ]
+        states = engine.evaluate_batch(confidences)
+        assert states.dtype == np.int8
+        assert states.tolist() == expected
+
+    def test_forced_states_take_priority(self, engine):
+        """Forced states override confidence, as force_state does."""
+        confidences = [1.0, 0.0, 0.5]
+        force = [TLState.EPISTEMIC_HOLD, None, TLState.REFUSE]
+        states = engine.evaluate_batch(confidences, force_states=force)
+        assert states.tolist() == [0, -1, -1]
+
+        codes = np.array([0, UNFORCED, -1], dtype=np.int8)
+        assert engine.evaluate_batch(
+            confidences, force_states=codes
+        ).tolist() == [0, -1, -1]
+
+    def test_batch_is_recorded(self, engine):
+        """Recorded batches populate the decision log and hold records."""
+        midpoint = (engine.proceed_threshold + engine.hold_threshold) / 2
+        engine.evaluate_batch(
+            [midpoint, midpoint, engine.proceed_threshold],
+            reasonings=["a", "b", "c"]
+        )
+        assert len(engine.decision_log) == 3
+        assert len(engine.epistemic_holds) == 2
+        assert len({e.event_id for e in engine.epistemic_holds}) == 2
+        assert engine.decision_log[2].reasoning == "c"
+
+    def test_unrecorded_batch_leaves_log_untouched(self, engine):
+        """record=False classifies without touching the audit trail."""
+        engine.evaluate_batch([0.1, 0.5, 0.9], record=False)
+        assert len(engine.decision_log) == 0
+        assert len(engine.epistemic_holds) == 0
+
+    def test_result_view(self, engine):
+        """The result view builds TLValues lazily from the arrays."""
+        result = engine.evaluate_batch(
+            [0.9, 0.1], metadata={'desk': 'fx'}, return_view=True
+        )
+        assert isinstance(result, TLBatchResult)
+        assert len(result) == 2
+        assert result.state_at(0) == TLState.PROCEED
+        assert result[1].state == TLState.REFUSE
+        assert result[1].metadata == {'desk': 'fx'}
+        assert result.counts()['refuse_count'] == 1
+
+    def test_rejects_out_of_range_confidence(self, engine):
+        """Out-of-range or NaN confidence raises like TLValue does."""
+        with pytest.raises(ValueError):
+            engine.evaluate_batch([0.5, 1.2])
+        with pytest.raises(ValueError):
+            engine.evaluate_batch([np.nan])
+
+    def test_rejects_mismatched_lengths(self, engine):
+        """Per-decision inputs must match the batch length."""
+        with pytest.raises(ValueError):
+            engine.evaluate_batch([0.5, 0.6], reasonings=["only one"])
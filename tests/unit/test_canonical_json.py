@@ -0,0 +1,143 @@
+"""
+Unit tests for RFC 8785 canonical JSON.
+
+Test philosophy:
+    Canonical output is compared byte for byte with the RFC's own
+    examples and number samples: a canonicalizer that is merely close
+    produces different hashes. The fast path, the streaming modes and
+    the general path must agree on every input.
+"""
+import hashlib
+import json
+import struct
+from enum import IntEnum
+
+import pytest
+from ternary_logic import canonical_digest, canonicalize, canonicalize_into
+from ternary_logic.canonical_json import format_number
+
+
+def _double(bits):
+    return struct.unpack('>d', bytes.fromhex(bits))[0]
+
+
+class TestNumbers:
+    """Test ES6 number serialization (RFC 8785 Appendix B)."""
+
+    @pytest.mark.parametrize("bits, expected", [
+        ("0000000000000000", "0"),
+        ("8000000000000000", "0"),
+        ("0000000000000001", "5e-324"),
+        ("8000000000000001", "-5e-324"),
+        ("7fefffffffffffff", "1.7976931348623157e+308"),
+        ("ffefffffffffffff", "-1.7976931348623157e+308"),
+        ("4340000000000000", "9007199254740992"),
+        ("c340000000000000", "-9007199254740992"),
+        ("4430000000000000", "295147905179352830000"),
+        ("44b52d02c7e14af5", "9.999999999999997e+22"),
+        ("44b52d02c7e14af6", "1e+23"),
+        ("44b52d02c7e14af7", "1.0000000000000001e+23"),
+        ("444b1ae4d6e2ef4e", "999999999999999700000"),
+        ("444b1ae4d6e2ef4f", "999999999999999900000"),
+        ("444b1ae4d6e2ef50", "1e+21"),
+        ("3eb0c6f7a0b5ed8c", "9.999999999999997e-7"),
+        ("3eb0c6f7a0b5ed8d", "0.000001"),
+        ("41b3de4355555553", "333333333.3333332"),
+        ("41b3de4355555554", "333333333.33333325"),
+        ("41b3de4355555555", "333333333.3333333"),
+        ("41b3de4355555556", "333333333.3333334"),
+        ("41b3de4355555557", "333333333.33333343"),
+        ("becbf647612f3696", "-0.0000033333333333333333"),
+        ("43143ff3c1cb0959", "1424953923781206.2"),
+    ])
+    def test_rfc_number_samples(self, bits, expected):
+        assert format_number(_double(bits)) == expected
+
+    def test_integers(self):
+        assert canonicalize([1, -0, 2 ** 53, 1.0, 100.0, 10 ** 21]) == (
+            '[1,0,9007199254740992,1,100,1e+21]'
+        )
+
+    @pytest.mark.parametrize("value", [
+        float('nan'), float('inf'), float('-inf'), 2 ** 53 + 1
+    ])
+    def test_rejects_unrepresentable_numbers(self, value):
+        with pytest.raises(ValueError):
+            canonicalize({"n": value})
+
+
+class TestStructure:
+    """Test strings, key ordering and nesting."""
+
+    def test_rfc_example(self):
+        source = (
+            '{"numbers":[333333333.33333329,1E30,4.50,2e-3,'
+            '0.000000000000000000000000001],'
+            '"string":"\\u20ac$\\u000F\\u000aA\'\\u0042\\u0022\\u005c\\\\'
+            '\\"\\/","literals":[null,true,false]}'
+        )
+
+        assert canonicalize(json.loads(source)) == (
+            '{"literals":[null,true,false],'
+            '"numbers":[333333333.3333333,1e+30,4.5,0.002,1e-27],'
+            '"string":"€$\\u000f\\nA\'B\\"\\\\\\\\\\"/"}'
+        )
+
+    def test_keys_sort_by_utf16_code_units(self):
+        value = {
+            "€": "Euro Sign",
+            "\r": "Carriage Return",
+            "דּ": "Hebrew Letter Dalet With Dagesh",
+            "1": "One",
+            "\U0001f600": "Emoji: Grinning Face",
+            "\u0080": "Control",
+            "ö": "Latin Small Letter O With Diaeresis",
+        }
+
+        assert list(json.loads(canonicalize(value)).values()) == [
+            "Carriage Return", "One", "Control",
+            "Latin Small Letter O With Diaeresis", "Euro Sign",
+            "Emoji: Grinning Face", "Hebrew Letter Dalet With Dagesh",
+        ]
+
+    def test_key_order_ignores_insertion_order(self):
+        assert canonicalize({"b": 1, "a": {"d": [], "c": {}}}) == (
+            canonicalize({"a": {"c": {}, "d": []}, "b": 1})
+        ) == '{"a":{"c":{},"d":[]},"b":1}'
+
+    def test_subclasses_and_tuples(self):
+        class Level(IntEnum):
+            HIGH = 2
+
+        assert canonicalize({"level": Level.HIGH, "pair": (1, "x")}) == (
+            '{"level":2,"pair":[1,"x"]}'
+        )
+
+    def test_rejects_unsupported_types(self):
+        with pytest.raises(TypeError, match="keys must be str"):
+            canonicalize({1: "one"})
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            canonicalize({"when": object()})
+
+
+class TestStreaming:
+    """Test that digest and buffer modes match canonicalize()."""
+
+    @pytest.mark.parametrize("value", [
+        {"logId": "log-1", "confidence": 0.52, "stateValue": 0},
+        {"a": [{"x": i, "y": [str(i)] * 3} for i in range(3000)]},
+        [],
+        "text",
+    ])
+    def test_modes_agree(self, value):
+        expected = canonicalize(value).encode("utf-8")
+
+        assert canonical_digest(value).hexdigest() == (
+            hashlib.sha256(expected).hexdigest()
+        )
+        assert canonical_digest(value, hashlib.sha3_256()).digest() == (
+            hashlib.sha3_256(expected).digest()
+        )
+        buffer = bytearray(b"prefix|")
+        assert canonicalize_into(value, buffer) is buffer
+        assert bytes(buffer) == b"prefix|" + expected
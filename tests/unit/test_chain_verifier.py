@@ -0,0 +1,191 @@
+"""
+Unit tests for checkpointed ledger chain verification.
+
+Test philosophy:
+    An intact chain must verify however it is split into spans and
+    whichever process checks each span. Every kind of damage (an edited
+    payload, a removed entry, a re-chained rewrite, a truncated tail, a
+    forged checkpoint) must be reported at the entry where it happened.
+"""
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from ternary_logic import (
+    ChainVerifier,
+    CheckpointLog,
+    DurableLedger,
+)
+from ternary_logic.ledger_verify import chain_root, entry_log_hash
+
+GENESIS = hashlib.sha256(b"TL_GENESIS").hexdigest()
+KEY = b"test-checkpoint-key"
+LABELS = {1: "PROCEED", 0: "EPISTEMIC_HOLD", -1: "REFUSE"}
+
+
+def _entry(i, previous_hash, reasoning=None):
+    """An entry as commit_log_entry builds it."""
+    state = i % 3 - 1
+    entry = {
+        "logId": f"log-{i:06d}",
+        "currentState": state,
+        "stateLabel": LABELS[state],
+        "confidence": round(0.1 + (i % 9) / 10, 2),
+        "reasoning": reasoning or f"Decision {i}",
+        "committedAt": f"2026-01-01T00:00:{i % 60:02d}+00:00",
+    }
+    entry["logHash"] = entry_log_hash(entry)
+    entry["previousHash"] = previous_hash
+    entry["merkleRoot"] = chain_root(previous_hash, entry["logHash"])
+    return entry
+
+
+def _chain(n, checkpoints=None, start_hash=GENESIS, tag=""):
+    entries, previous = [], start_hash
+    for i in range(n):
+        entry = _entry(i, previous, reasoning=f"Decision {i}{tag}")
+        entries.append(entry)
+        previous = entry["merkleRoot"]
+        if checkpoints is not None:
+            checkpoints.record(i, entry)
+    return entries
+
+
+def _kinds(report):
+    return [(issue.sequence, issue.kind) for issue in report.issues]
+
+
+class TestIntactChains:
+    """Test that intact chains verify across span layouts."""
+
+    @pytest.mark.parametrize("span_size", [1, 7, 10, 1000])
+    def test_intact_chain_verifies(self, span_size):
+        checkpoints = CheckpointLog(KEY, interval=10)
+        entries = _chain(95, checkpoints)
+
+        report = ChainVerifier(
+            GENESIS, checkpoints, span_size=span_size, max_workers=1
+        ).verify(entries)
+
+        assert report.ok and report.first_break is None
+        assert report.entries_checked == 95
+        assert report.checkpoints_checked == 9
+
+    def test_durable_ledger_in_executor(self, tmp_path):
+        store = DurableLedger(tmp_path, segment_bytes=4096)
+        checkpoints = CheckpointLog(KEY, interval=16)
+        for i, entry in enumerate(_chain(200, checkpoints)):
+            store.commit(entry)
+
+        with ThreadPoolExecutor(2) as pool:
+            report = ChainVerifier(
+                GENESIS, checkpoints, span_size=25, executor=pool,
+                max_workers=2
+            ).verify(store)
+
+        assert report.ok
+        assert report.entries_checked == 200
+        assert report.checkpoints_checked == 12
+
+    @pytest.mark.slow
+    def test_process_pool_matches_inline(self, tmp_path):
+        store = DurableLedger(tmp_path, segment_bytes=4096)
+        entries = _chain(300)
+        entries[150]["reasoning"] = "edited"
+        for entry in entries:
+            store.commit(entry)
+
+        inline = ChainVerifier(GENESIS, span_size=40, max_workers=1)
+        pooled = ChainVerifier(GENESIS, span_size=40, max_workers=2)
+
+        assert _kinds(pooled.verify(store)) == _kinds(inline.verify(store))
+        assert _kinds(inline.verify(store)) == [(150, 'log_hash')]
+
+    def test_checkpoints_persist(self, tmp_path):
+        path = str(tmp_path / "checkpoints.ndjson")
+        writer = CheckpointLog(KEY, interval=5, path=path)
+        entries = _chain(23, writer)
+
+        auditor = CheckpointLog(KEY, interval=5, path=path)
+
+        assert auditor.checkpoints == writer.checkpoints
+        assert ChainVerifier(GENESIS, auditor, max_workers=1).verify(entries).ok
+
+
+class TestDamage:
+    """Test that damage is reported where it happened."""
+
+    def test_edited_payload(self):
+        entries = _chain(30)
+        entries[12]["confidence"] = 0.99
+
+        report = ChainVerifier(GENESIS, span_size=10, max_workers=1).verify(
+            entries
+        )
+
+        assert _kinds(report) == [(12, 'log_hash')]
+        assert report.first_break.sequence == 12
+
+    @pytest.mark.parametrize("removed", [0, 9, 10, 17])
+    def test_removed_entry_breaks_link(self, removed):
+        entries = _chain(30)
+        del entries[removed]
+
+        report = ChainVerifier(GENESIS, span_size=10, max_workers=1).verify(
+            entries
+        )
+
+        assert _kinds(report) == [(removed, 'link')]
+
+    def test_rechained_rewrite_needs_checkpoints(self):
+        checkpoints = CheckpointLog(KEY, interval=10)
+        _chain(40, checkpoints)
+        rewritten = _chain(40, tag=" (rewritten)")
+
+        unanchored = ChainVerifier(GENESIS, max_workers=1).verify(rewritten)
+        anchored = ChainVerifier(GENESIS, checkpoints, max_workers=1).verify(
+            rewritten
+        )
+
+        assert unanchored.ok
+        assert _kinds(anchored) == [
+            (9, 'checkpoint'), (19, 'checkpoint'),
+            (29, 'checkpoint'), (39, 'checkpoint'),
+        ]
+
+    def test_truncation_and_checkpoint_gaps(self):
+        checkpoints = CheckpointLog(KEY, interval=10)
+        entries = _chain(50, checkpoints)
+        del checkpoints.checkpoints[1]          # the one at entry 19
+
+        report = ChainVerifier(GENESIS, checkpoints, max_workers=1).verify(
+            entries[:35]
+        )
+
+        assert _kinds(report) == [(19, 'checkpoint_gap'), (35, 'truncated')]
+        assert report.checkpoints_checked == 2
+
+    def test_forged_checkpoint_signature(self):
+        checkpoints = CheckpointLog(KEY, interval=10)
+        entries = _chain(20, checkpoints)
+        forger = CheckpointLog(b"wrong-key", interval=10)
+        forger.checkpoints = list(checkpoints.checkpoints)
+
+        report = ChainVerifier(GENESIS, forger, max_workers=1).verify(entries)
+
+        assert [kind for _, kind in _kinds(report)] == ['signature'] * 2
+
+    def test_malformed_entry_and_issue_cap(self):
+        entries = _chain(20)
+        del entries[5]["logHash"]
+        for entry in entries[10:]:
+            entry["reasoning"] = json.dumps(entry)
+
+        report = ChainVerifier(
+            GENESIS, max_workers=1, span_size=100, max_issues=3
+        ).verify(entries)
+
+        assert _kinds(report) == [(5, 'malformed'), (10, 'log_hash'),
+                                  (11, 'log_hash')]
+        assert report.issue_count == 11
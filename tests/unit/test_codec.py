@@ -0,0 +1,133 @@
+"""
+Unit tests for the binary record codec.
+
+Test philosophy:
+    A binary record must decode to a value equal to the one encoded:
+    every field, including optional ones, timestamps to the last
+    microsecond (nanosecond for compact values) and nested metadata.
+    Malformed or future-version input must be rejected, never guessed at.
+"""
+import io
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from ternary_logic import (
+    CompactTLValue,
+    EpistemicHoldEvent,
+    FrozenTLValue,
+    TLState,
+    TLValue,
+    decode_record,
+    iter_decode_records,
+)
+from ternary_logic.codec import HEADER_SIZE, VERSION
+
+
+def _hold_event(**overrides):
+    fields = dict(
+        event_id="",
+        trigger_reason="Confidence 0.52 in uncertainty band",
+        data_inputs={'confidence': 0.52, 'sources': ['feed-a', 'feed-b']},
+        model_outputs={'var_model': {'p99': 1.25e6}},
+        signal_conflicts=['feed-a vs feed-b'],
+        uncertainty_metrics={'variance': 0.04},
+        timestamp=datetime(2026, 3, 14, 9, 26, 53, 589793),
+    )
+    fields.update(overrides)
+    return EpistemicHoldEvent(**fields)
+
+
+class TestRoundTrip:
+    """Test that every record type decodes to an equal value."""
+
+    @pytest.mark.parametrize("value", [
+        TLValue(TLState.PROCEED, 0.91, "Clear signal"),
+        TLValue(
+            TLState.EPISTEMIC_HOLD, 0.5, "Conflicting feeds — ünïcode",
+            metadata={'sources': [1, 2.5, None, True], 'nested': {'a': 'b'}},
+            timestamp=datetime(2026, 1, 2, 3, 4, 5, 678901),
+            profile='rates-desk', threshold_epoch=7
+        ),
+        TLValue(TLState.REFUSE, 0.0, "", profile=''),
+        TLValue(
+            TLState.PROCEED, 1.0, "Aware timestamp",
+            timestamp=datetime(
+                2026, 5, 1, 12, 0, tzinfo=timezone(timedelta(hours=-5))
+            )
+        ),
+    ])
+    def test_tl_value(self, value):
+        blob = value.to_bytes()
+        decoded = decode_record(blob)
+        assert type(decoded) is TLValue
+        assert decoded == value
+        assert decoded.timestamp.utcoffset() == value.timestamp.utcoffset()
+        assert TLValue.from_bytes(blob) == value
+
+    def test_compact_and_frozen_keep_nanoseconds(self):
+        compact = CompactTLValue(
+            TLState.EPISTEMIC_HOLD, 0.4, "Compact",
+            timestamp_ns=1_700_000_000_123_456_789,
+            profile='fx-desk', threshold_epoch=3
+        )
+        frozen = FrozenTLValue(
+            TLState.PROCEED, 0.8, "Frozen", metadata={'k': 'v'},
+            timestamp_ns=1_700_000_000_987_654_321
+        )
+        for value in (compact, frozen):
+            decoded = decode_record(value.to_bytes())
+            assert type(decoded) is type(value)
+            assert decoded == value
+            assert decoded.timestamp_ns == value.timestamp_ns
+        assert decode_record(compact.to_bytes())._metadata is None
+
+    @pytest.mark.parametrize("resolved", [False, True])
+    def test_hold_event(self, resolved):
+        event = _hold_event()
+        if resolved:
+            event.resolution_action = "Escalated to desk head"
+            event.resolution_timestamp = datetime(2026, 3, 14, 10, 0, 0, 1)
+        decoded = EpistemicHoldEvent.from_bytes(event.to_bytes())
+        assert decoded == event
+        assert decoded.to_dict() == event.to_dict()
+
+    def test_binary_is_smaller_than_json(self):
+        value = TLValue(
+            TLState.EPISTEMIC_HOLD, 0.52, "Confidence in uncertainty band",
+            metadata={'desk': 'rates'}, threshold_epoch=2
+        )
+        assert len(value.to_bytes()) < len(value.to_json()) / 2
+
+
+class TestFraming:
+    """Test stream decoding and rejection of malformed input."""
+
+    def test_iterates_concatenated_records(self):
+        records = [
+            TLValue(TLState.PROCEED, 0.9, "a"),
+            _hold_event(),
+            CompactTLValue(TLState.REFUSE, 0.1, "c", timestamp_ns=5),
+        ]
+        blob = b''.join(r.to_bytes() for r in records)
+        assert list(iter_decode_records(blob)) == records
+        assert list(iter_decode_records(io.BytesIO(blob))) == records
+
+    def test_rejects_malformed_records(self):
+        blob = TLValue(TLState.PROCEED, 0.9, "a").to_bytes()
+        with pytest.raises(ValueError, match="Not a TL binary record"):
+            decode_record(b'XX' + blob[2:])
+        with pytest.raises(ValueError, match="Unsupported .* version"):
+            decode_record(blob[:2] + bytes([VERSION + 1]) + blob[3:])
+        with pytest.raises(ValueError, match="length mismatch"):
+            decode_record(blob + b'\x00')
+        with pytest.raises(ValueError, match="Truncated"):
+            list(iter_decode_records(blob[:-1]))
+        with pytest.raises(ValueError, match="Truncated"):
+            decode_record(blob[:HEADER_SIZE - 1])
+        with pytest.raises(ValueError, match="Unknown TL record kind"):
+            decode_record(blob[:3] + bytes([99]) + blob[4:])
+
+    def test_from_bytes_checks_record_type(self):
+        blob = _hold_event().to_bytes()
+        with pytest.raises(ValueError, match="not a TLValue"):
+            TLValue.from_bytes(blob)
@@ -0,0 +1,71 @@
+"""
+Unit tests for slotted TL values.
+
+Test philosophy:
+    CompactTLValue and FrozenTLValue are representations of the same
+    decision record as TLValue. Their serialized form must be
+    interchangeable with TLValue's.
+"""
+import json
+import pytest
+from dataclasses import FrozenInstanceError
+from ternary_logic import (
+    TLEngine, TLState, TLValue, CompactTLValue, FrozenTLValue,
+    ColumnarDecisionLog,
+)
+
+
+class TestCompactTLValue:
+    """Test CompactTLValue, FrozenTLValue and engine integration."""
+
+    def test_serializes_like_tlvalue(self):
+        """to_dict has the same keys and values as TLValue's."""
+        compact = CompactTLValue(TLState.PROCEED, 0.9, "clear", {'k': 1})
+        reference = TLValue(
+            state=TLState.PROCEED, confidence=0.9, reasoning="clear",
+            metadata={'k': 1}, timestamp=compact.timestamp
+        )
+        assert compact.to_dict() == reference.to_dict()
+        assert json.loads(compact.to_json())['position'] == "above_proceed_threshold"
+
+    def test_slotted_and_lazy_metadata(self):
+        """No __dict__, and no metadata dict until one is needed."""
+        value = CompactTLValue(TLState.REFUSE, 0.1, "failed")
+        assert not hasattr(value, '__dict__')
+        assert value._metadata is None
+        assert value.metadata == {}
+
+    def test_timestamps_are_monotonic(self):
+        """Successive values never go back in time."""
+        stamps = [
+            CompactTLValue(TLState.PROCEED, 1.0, "t").timestamp_ns
+            for _ in range(1000)
+        ]
+        assert stamps == sorted(stamps)
+
+    def test_frozen_value_rejects_assignment(self):
+        """FrozenTLValue is immutable."""
+        value = FrozenTLValue(TLState.EPISTEMIC_HOLD, 0.5, "hold")
+        with pytest.raises(FrozenInstanceError):
+            value.confidence = 0.9
+
+    def test_confidence_is_validated(self):
+        """Out-of-range confidence raises as in TLValue."""
+        with pytest.raises(ValueError):
+            CompactTLValue(TLState.PROCEED, 1.5, "bad")
+
+    def test_engine_value_class(self):
+        """evaluate returns the configured value class, holds still work."""
+        engine = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35,
+            value_class=FrozenTLValue, decision_log=ColumnarDecisionLog()
+        )
+        value = engine.evaluate(0.5, "hold", metadata={'inputs': {'a': 1}})
+        assert isinstance(value, FrozenTLValue)
+        assert engine.epistemic_holds[0].data_inputs == {'a': 1}
+        assert engine.decision_log[0].timestamp == value.timestamp
+
+    def test_rejects_unknown_value_class(self):
+        """Only TLValue and CompactTLValue subclasses are accepted."""
+        with pytest.raises(ValueError):
+            TLEngine(proceed_threshold=0.75, hold_threshold=0.35, value_class=dict)
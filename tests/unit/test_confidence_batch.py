@@ -0,0 +1,163 @@
+"""
+Unit tests for calculate_confidence_batch.
+
+Test philosophy:
+    The batch function must be a drop-in for calling calculate_confidence
+    per candidate: results are compared bit-for-bit, not approximately,
+    across every layout and fallback.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from ternary_logic import calculate_confidence, calculate_confidence_batch
+
+SOURCE_DTYPE = [
+    ('quality', 'f8'), ('signal_strength', 'f8'), ('historical_accuracy', 'f8')
+]
+
+
+def _random_candidates(rng, n, max_sources=6, max_models=5):
+    """Random candidates as (sources, models) lists of dicts."""
+    candidates = []
+    for _ in range(n):
+        sources = [
+            {
+                'quality': rng.random(),
+                'signal_strength': rng.random() * 1.5,
+                'historical_accuracy': rng.random(),
+            }
+            for _ in range(rng.integers(0, max_sources + 1))
+        ]
+        models = [
+            {'output': rng.random()}
+            for _ in range(rng.integers(0, max_models + 1))
+        ]
+        candidates.append((sources, models))
+    return candidates
+
+
+def _expected(candidates):
+    return np.array([calculate_confidence(s, m) for s, m in candidates])
+
+
+def _long_form(candidates, index):
+    """One row per entry, candidates in reverse order to test grouping."""
+    return [
+        {'candidate': i, **entry}
+        for i in reversed(range(len(candidates)))
+        for entry in candidates[i][index]
+    ]
+
+
+class TestBatchMatchesScalar:
+    """Test bit-for-bit agreement with calculate_confidence."""
+
+    def test_padded_structured_arrays(self):
+        rng = np.random.default_rng(7)
+        candidates = _random_candidates(rng, 2_000)
+        n = len(candidates)
+        sources = np.zeros((n, 6), dtype=SOURCE_DTYPE)
+        outputs = np.zeros((n, 5))
+        source_counts = np.zeros(n, dtype=int)
+        model_counts = np.zeros(n, dtype=int)
+        for i, (s, m) in enumerate(candidates):
+            source_counts[i] = len(s)
+            model_counts[i] = len(m)
+            for j, src in enumerate(s):
+                sources[i, j] = (
+                    src['quality'], src['signal_strength'],
+                    src['historical_accuracy']
+                )
+            for j, model in enumerate(m):
+                outputs[i, j] = model['output']
+
+        result = calculate_confidence_batch(
+            sources, outputs,
+            source_counts=source_counts, model_counts=model_counts
+        )
+
+        np.testing.assert_array_equal(result, _expected(candidates))
+
+    def test_long_form_dataframe(self):
+        rng = np.random.default_rng(11)
+        candidates = _random_candidates(rng, 1_000)
+        # Candidates need not be contiguous or ordered; the row order
+        # within one candidate is its source order.
+        sources = pd.DataFrame(_long_form(candidates, 0))
+        models = pd.DataFrame(_long_form(candidates, 1))
+
+        result = calculate_confidence_batch(sources, models)
+
+        np.testing.assert_array_equal(result, _expected(candidates))
+
+    def test_missing_fields_use_scalar_defaults(self):
+        candidates = [
+            ([{}, {}], [{}, {}, {}]),
+            ([{}], []),
+            ([], [{}]),
+        ]
+        result = calculate_confidence_batch(
+            {'quality': np.full((3, 2), 0.5)},
+            {'output': np.full((3, 3), 0.5)},
+            source_counts=[2, 1, 0], model_counts=[3, 0, 1]
+        )
+
+        np.testing.assert_array_equal(result, _expected(candidates))
+        assert result[2] == 0.25 * (0.0 + 0.5 + 0.5 + 0.0)
+
+    def test_clamp(self):
+        candidates = [
+            ([{'quality': 3.0, 'signal_strength': 3.0}], []),
+            ([{'quality': -3.0, 'signal_strength': -3.0,
+               'historical_accuracy': -1.0}], []),
+        ]
+        sources = np.array(
+            [[(3.0, 3.0, 0.75)], [(-3.0, -3.0, -1.0)]], dtype=SOURCE_DTYPE
+        )
+
+        result = calculate_confidence_batch(sources)
+
+        np.testing.assert_array_equal(result, _expected(candidates))
+        assert list(result) == [1.0, 0.0]
+
+    def test_cancellation_sensitive_sums(self):
+        """Sums whose rounding depends on the summation algorithm."""
+        values = [1e16, 1.0, -1e16, 0.1, 0.2, 0.3]
+        candidates = [([{'quality': v} for v in values], [])]
+
+        result = calculate_confidence_batch(
+            {'quality': np.array([values])}
+        )
+
+        np.testing.assert_array_equal(result, _expected(candidates))
+
+    def test_model_variance_squares_like_python(self):
+        """x ** 2 on a Python float can differ from x * x in the last bit."""
+        a = 0.21336057186512053
+        candidates = [([], [{'output': a}, {'output': -a}])]
+
+        result = calculate_confidence_batch(
+            {'quality': np.zeros((1, 0))}, np.array([[a, -a]])
+        )
+
+        np.testing.assert_array_equal(result, _expected(candidates))
+
+
+class TestBatchValidation:
+    """Test layout validation."""
+
+    def test_rejects_mismatched_candidate_counts(self):
+        with pytest.raises(ValueError, match="different numbers"):
+            calculate_confidence_batch(
+                {'quality': np.zeros((3, 2))}, np.zeros((4, 2))
+            )
+
+    def test_rejects_bad_counts(self):
+        with pytest.raises(ValueError, match="counts must be"):
+            calculate_confidence_batch(
+                {'quality': np.zeros((2, 2))}, source_counts=[1, 3]
+            )
+
+    def test_rejects_one_dimensional_columns(self):
+        with pytest.raises(ValueError, match="candidate"):
+            calculate_confidence_batch({'quality': np.zeros(3)})
@@ -0,0 +1,98 @@
+"""
+Unit tests for conflict detection in analyze_uncertainty.
+
+Test philosophy:
+    The sort-based search must report exactly the pairs a full pairwise
+    scan reports, in the same order and with the same values, including
+    borderline differences, ties, infinities and NaN.
+"""
+import numpy as np
+import pytest
+from ternary_logic import analyze_uncertainty
+
+
+def _pairwise(data_sources, conflict_threshold):
+    """Reference O(n^2) scan."""
+    conflicts = []
+    for i, src1 in enumerate(data_sources):
+        for src2 in data_sources[i + 1:]:
+            diff = abs(src1['confidence'] - src2['confidence'])
+            if diff >= conflict_threshold:
+                conflicts.append({
+                    'sources': [src1['name'], src2['name']],
+                    'difference': diff,
+                    'values': [src1['confidence'], src2['confidence']]
+                })
+    return conflicts
+
+
+def _sources(values):
+    return [
+        {'name': f"source_{i}", 'confidence': v} for i, v in enumerate(values)
+    ]
+
+
+@pytest.mark.parametrize("n", [3, 15, 16, 40, 300])
+@pytest.mark.parametrize("threshold", [0.0, 0.1, 0.3, 0.9])
+def test_matches_pairwise_scan(n, threshold):
+    rng = np.random.default_rng(n)
+    sources = _sources(rng.random(n).tolist())
+
+    result = analyze_uncertainty(sources, threshold)
+    expected = _pairwise(sources, threshold)
+
+    assert result['conflicts'] == expected
+    assert result['conflict_count'] == len(expected)
+    assert result['has_conflicts'] == bool(expected)
+    assert result['source_count'] == n
+
+
+def test_borderline_differences_and_ties():
+    # Many differences land exactly on, or one rounding away from, 0.1.
+    values = [round(0.1 * k, 1) for k in range(11)] * 3 + [0.30000000000000004]
+    sources = _sources(values)
+
+    result = analyze_uncertainty(sources, 0.1)
+
+    assert result['conflicts'] == _pairwise(sources, 0.1)
+
+
+def test_non_finite_confidences():
+    values = [0.5, float('nan'), float('inf'), 0.1, float('-inf'),
+              float('inf'), 0.9] * 4
+    sources = _sources(values)
+
+    result = analyze_uncertainty(sources, 0.3)
+
+    expected = _pairwise(sources, 0.3)
+    assert result['conflict_count'] == len(expected)
+    assert [c['sources'] for c in result['conflicts']] == [
+        c['sources'] for c in expected
+    ]
+
+
+@pytest.mark.parametrize("values, threshold", [
+    ([0.5] * 20, 0.3),
+    ([0.5] * 20, 0.0),
+    ([0.1] + [0.5] * 20, 0.4),
+    ([float('nan')] * 20 + [0.2, 0.9], 0.5),
+    ([float('inf')] * 20, 0.1),
+])
+def test_count_and_any_modes(values, threshold):
+    sources = _sources(values)
+    expected = _pairwise(sources, threshold)
+
+    counted = analyze_uncertainty(sources, threshold, mode='count')
+    any_only = analyze_uncertainty(sources, threshold, mode='any')
+
+    assert counted['conflict_count'] == len(expected)
+    assert counted['conflicts'] is None
+    assert counted['has_conflicts'] == any_only['has_conflicts'] == bool(expected)
+    assert any_only['conflict_count'] is None
+
+
+def test_empty_and_invalid_mode():
+    assert analyze_uncertainty([])['conflicts'] == []
+    assert analyze_uncertainty([], mode='count')['conflicts'] is None
+    with pytest.raises(ValueError, match="mode"):
+        analyze_uncertainty(_sources([0.1, 0.9]), mode='all')
@@ -0,0 +1,150 @@
+"""
+Unit tests for the memoizing TLDecorator.
+
+Test philosophy:
+    Caching may skip the decision function, never the engine: every
+    call, hit or miss, must produce a fresh TLValue in the decision log.
+    The cache must stay bounded and honour its TTL.
+"""
+import asyncio
+import pytest
+from ternary_logic import AsyncTLEngine, DecisionCache, TLDecorator, TLEngine
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def engine():
+    return TLEngine(proceed_threshold=0.75, hold_threshold=0.35, log_mode='off')
+
+
+class TestDecisionCache:
+    """Test the LRU/TTL cache on its own."""
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            DecisionCache(maxsize=0)
+        with pytest.raises(ValueError):
+            DecisionCache(ttl=0)
+        with pytest.raises(ValueError):
+            TLDecorator(None, cache_ttl=1.0)
+
+    def test_lru_eviction(self):
+        cache = DecisionCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == (True, 1)
+        cache.put('c', 3)
+        assert cache.get('b') == (False, None)
+        assert cache.get('a') == (True, 1)
+        assert cache.stats()['evictions'] == 1
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = DecisionCache(maxsize=8, ttl=0.005, clock=clock)
+        cache.put('a', 1)
+        clock.now = 0.004
+        assert cache.get('a') == (True, 1)
+        clock.now = 0.010
+        assert cache.get('a') == (False, None)
+        stats = cache.stats()
+        assert stats['expirations'] == 1
+        assert stats['size'] == 0
+
+
+class TestMemoizingDecorator:
+    """Test TLDecorator with caching enabled."""
+
+    def test_hits_skip_function_but_not_engine(self, engine):
+        calls = []
+
+        @TLDecorator(engine, cache_size=16)
+        def signal(order):
+            calls.append(order)
+            return 0.8, "Re-priced", {'order': order['id']}
+
+        order = {'id': 7, 'qty': 100}
+        first = signal(order)
+        second = signal({'qty': 100, 'id': 7})
+
+        assert len(calls) == 1
+        assert len(engine.decision_log) == 2
+        assert first is not second
+        assert first.metadata == second.metadata
+        assert first.metadata is not second.metadata
+        assert signal.cache.stats()['hits'] == 1
+        assert signal.cache.stats()['misses'] == 1
+
+    def test_mutating_a_miss_does_not_poison_the_cache(self, engine):
+        @TLDecorator(engine, cache_size=16)
+        def signal(x):
+            return 0.8, "Re-priced", {'a': x}
+
+        first = signal(1)
+        first.metadata['poison'] = True
+        second = signal(1)
+
+        assert signal.cache.stats()['hits'] == 1
+        assert second.metadata == {'a': 1}
+
+    def test_different_arguments_miss(self, engine):
+        @TLDecorator(engine, cache_size=16)
+        def signal(x, scale=1.0):
+            return min(1.0, x * scale), "scaled"
+
+        signal(0.5)
+        signal(0.5, scale=1.0)
+        signal(0.5, scale=1.5)
+        assert signal.cache.stats()['misses'] == 3
+
+    def test_uncacheable_arguments_run_function(self, engine):
+        calls = []
+
+        @TLDecorator(engine, cache_size=16)
+        def signal(obj):
+            calls.append(obj)
+            return 0.5, "opaque"
+
+        marker = object()
+        signal(marker)
+        signal(marker)
+        assert len(calls) == 2
+        assert signal.cache.stats()['uncacheable'] == 2
+
+    def test_uncached_by_default(self, engine):
+        @TLDecorator(engine)
+        def signal():
+            return 0.9, "plain"
+
+        signal()
+        assert signal.cache is None
+        assert signal.__name__ == 'signal'
+
+    def test_async_functions_are_cached(self):
+        calls = []
+
+        async def main():
+            engine = AsyncTLEngine(
+                proceed_threshold=0.75, hold_threshold=0.35, log_mode='off'
+            )
+
+            @TLDecorator(engine, cache_size=4)
+            async def signal(tick):
+                calls.append(tick)
+                return 0.9, "Momentum confirmed"
+
+            await signal(1)
+            await signal(1)
+            await engine.aclose()
+            return engine, signal
+
+        engine, signal = asyncio.run(main())
+        assert calls == [1]
+        assert len(engine.decision_log) == 2
+        assert signal.cache.stats()['hits'] == 1
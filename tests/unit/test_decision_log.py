@@ -0,0 +1,118 @@
+"""
+Unit tests for the columnar decision log.
+
+Test philosophy:
+    The columnar log is a storage format, not a behavioural change.
+    Everything read back out of it must be indistinguishable from the
+    TLValue objects a plain list would have kept, and every engine API
+    that reads the log must keep working.
+"""
+import json
+import tracemalloc
+import pytest
+import numpy as np
+from ternary_logic import TLEngine, TLState, ColumnarDecisionLog
+
+
+@pytest.fixture
+def engine():
+    """Engine backed by a small-chunk columnar log."""
+    return TLEngine(
+        proceed_threshold=0.75,
+        hold_threshold=0.35,
+        decision_log=ColumnarDecisionLog(chunk_size=4)
+    )
+
+
+class TestColumnarDecisionLog:
+    """Test ColumnarDecisionLog storage and engine integration."""
+
+    def test_round_trip_matches_evaluate(self, engine):
+        """Values read back equal the values evaluate() returned."""
+        returned = [
+            engine.evaluate(0.9, "clear", metadata={'desk': 'fx'}),
+            engine.evaluate(0.5, "mixed"),
+            engine.evaluate(0.1, "failed"),
+        ]
+        assert len(engine.decision_log) == 3
+        for original, stored in zip(returned, engine.decision_log):
+            assert stored.state == original.state
+            assert stored.confidence == original.confidence
+            assert stored.reasoning == original.reasoning
+            assert stored.metadata == original.metadata
+            assert stored.timestamp == original.timestamp
+
+    def test_grows_across_chunks(self, engine):
+        """Appends spanning several chunks keep order and indexing."""
+        confidences = np.linspace(0.0, 1.0, 11)
+        engine.evaluate_batch(confidences, reasonings="sweep")
+        log = engine.decision_log
+        assert len(log) == 11
+        assert log[-1].confidence == 1.0
+        assert [v.confidence for v in log[2:5]] == confidences[2:5].tolist()
+        np.testing.assert_array_equal(log.column('confidence'), confidences)
+
+    def test_text_round_trips_across_chunks(self, engine):
+        """Reasoning and metadata read back exactly from open and
+        compressed chunks, whichever write path stored them."""
+        log = engine.decision_log
+        for i in range(6):
+            engine.evaluate(
+                0.9, f"décision {i} ✓" * (i % 3),
+                metadata={'i': i, 'tags': ['a', None]} if i % 2 else None
+            )
+        engine.evaluate_batch([0.2, 0.5, 0.8], reasonings="batch",
+                              metadata={'desk': 'fx'})
+        engine.evaluate_batch([0.1, 0.6], reasonings=["x", "yy"])
+        assert len(log) == 11
+        assert len(log._sealed) == 2
+
+        assert [v.reasoning for v in log] == (
+            [f"décision {i} ✓" * (i % 3) for i in range(6)]
+            + ["batch"] * 3 + ["x", "yy"]
+        )
+        assert [v.metadata for v in log[:6]] == [
+            {'i': i, 'tags': ['a', None]} if i % 2 else {} for i in range(6)
+        ]
+        assert log[7].metadata == {'desk': 'fx'}
+        assert log[-1].metadata == {}
+
+    def test_statistics_and_export_work(self, engine, tmp_path):
+        """get_statistics and export_audit_trail read the columnar log."""
+        engine.evaluate_batch([0.9, 0.5, 0.1, 0.95, 0.4])
+        stats = engine.get_statistics()
+        assert stats['total_decisions'] == 5
+        assert stats['hold_count'] == 2
+
+        path = tmp_path / "audit.json"
+        engine.export_audit_trail(str(path))
+        audit = json.loads(path.read_text())
+        assert len(audit['decision_log']) == 5
+        assert audit['decision_log'][1]['state'] == TLState.EPISTEMIC_HOLD.name
+
+    def test_footprint_is_compact(self):
+        """Unique reasoning and metadata take at least 10x less memory
+        than the TLValues a plain list would keep."""
+        n = 8192
+        log = ColumnarDecisionLog(chunk_size=1024)
+        engine = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, decision_log=log
+        )
+        for i, score in enumerate(np.random.default_rng(1).random(n)):
+            engine.evaluate(
+                float(score),
+                f"Order {100000 + i}: model score {score:.3f}, "
+                f"spread within limits",
+                metadata={'order_id': 100000 + i, 'desk': 'fx'}
+            )
+
+        tracemalloc.start()
+        try:
+            values = list(log)
+            list_bytes, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(values) == n
+        assert len({v.reasoning for v in values}) == n
+        assert log.nbytes * 10 <= list_bytes
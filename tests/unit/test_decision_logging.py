@@ -0,0 +1,69 @@
+"""
+Unit tests for per-decision logging strategies.
+
+Test philosophy:
+    Logging modes only change how many log lines are produced and on
+    which thread. The decision log and hold records must be identical in
+    every mode.
+"""
+import logging
+import pytest
+from ternary_logic import TLEngine
+
+CORE_LOGGER = "ternary_logic.core"
+
+
+def make_engine(**kwargs):
+    """Engine with sample thresholds and the given logging options."""
+    return TLEngine(proceed_threshold=0.75, hold_threshold=0.35, **kwargs)
+
+
+def decision_lines(caplog):
+    return [r for r in caplog.records if r.getMessage().startswith("TL Decision")]
+
+
+class TestDecisionLogging:
+    """Test the log_mode options of TLEngine."""
+
+    def test_all_mode_logs_structured_records(self, caplog):
+        """Default mode logs every decision with structured fields."""
+        caplog.set_level(logging.INFO, logger=CORE_LOGGER)
+        engine = make_engine()
+        engine.evaluate(0.9, "proceed")
+        engine.evaluate(0.5, "hold")
+        lines = decision_lines(caplog)
+        assert len(lines) == 2
+        assert lines[0].tl_state == "PROCEED"
+        assert lines[0].getMessage() == "TL Decision: PROCEED (confidence: 0.900)"
+        assert any(r.levelno == logging.WARNING for r in caplog.records)
+
+    def test_off_mode_still_records_audit_trail(self, caplog):
+        """'off' suppresses log lines but not decisions or holds."""
+        caplog.set_level(logging.INFO, logger=CORE_LOGGER)
+        engine = make_engine(log_mode='off')
+        engine.evaluate(0.5, "hold")
+        assert decision_lines(caplog) == []
+        assert len(engine.decision_log) == 1
+        assert len(engine.epistemic_holds) == 1
+
+    def test_sampled_mode(self, caplog):
+        """'sampled' logs one in log_sample_rate decisions."""
+        caplog.set_level(logging.INFO, logger=CORE_LOGGER)
+        engine = make_engine(log_mode='sampled', log_sample_rate=10)
+        for _ in range(35):
+            engine.evaluate(0.9, "sampled")
+        assert len(decision_lines(caplog)) == 3
+
+    def test_queued_mode_delivers_after_close(self, caplog):
+        """'queued' hands every record to the background listener."""
+        caplog.set_level(logging.INFO, logger=CORE_LOGGER)
+        engine = make_engine(log_mode='queued')
+        for _ in range(5):
+            engine.evaluate(0.1, "queued")
+        engine.close()
+        assert len(decision_lines(caplog)) == 5
+
+    def test_rejects_unknown_mode(self):
+        """Unknown log modes raise ValueError."""
+        with pytest.raises(ValueError, match="log_mode"):
+            make_engine(log_mode='verbose')
@@ -0,0 +1,127 @@
+"""
+Unit tests for the windowed hold-rate monitor.
+
+Test philosophy:
+    Windowed rates must reflect only recent decisions, react to a hold
+    storm long before the lifetime rate does, and stay exact under a
+    controlled clock. Memory must not grow with the number of decisions.
+"""
+import pytest
+import numpy as np
+from ternary_logic import HoldRateMonitor, TLEngine
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def monitor(clock):
+    return HoldRateMonitor(clock=clock)
+
+
+class TestHoldRateMonitor:
+    """Test HoldRateMonitor windows and EWMA."""
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            HoldRateMonitor(windows=())
+        with pytest.raises(ValueError):
+            HoldRateMonitor(buckets=0)
+        with pytest.raises(ValueError):
+            HoldRateMonitor(ewma_alpha=0.0)
+        with pytest.raises(ValueError):
+            HoldRateMonitor(windows=(('bad', 0),))
+        with pytest.raises(ValueError):
+            HoldRateMonitor().window('1d')
+
+    def test_window_rates(self, monitor):
+        for state in (1, 1, 0, -1):
+            monitor.record(state)
+        report = monitor.window('1m')
+        assert report['decisions'] == 4
+        assert report['proceed_rate'] == 0.5
+        assert report['epistemic_hold_rate'] == 0.25
+        assert report['refuse_rate'] == 0.25
+
+    def test_old_decisions_expire(self, monitor, clock):
+        for _ in range(10):
+            monitor.record(0)
+        clock.now += 120
+        monitor.record(1)
+        assert monitor.window('1m')['decisions'] == 1
+        assert monitor.window('5m')['decisions'] == 11
+        clock.now += 3600
+        snapshot = monitor.snapshot()
+        assert snapshot['1h']['decisions'] == 0
+        assert snapshot['1h']['epistemic_hold_rate'] == 0.0
+
+    def test_batch_counts_match_single_records(self, clock):
+        single = HoldRateMonitor(clock=clock)
+        batch = HoldRateMonitor(clock=clock)
+        for state in [1] * 7 + [0] * 2 + [-1]:
+            single.record(state)
+        batch.record_counts(7, 2, 1)
+        assert single.window('5m') == batch.window('5m')
+
+    def test_ewma_tracks_recent_regime(self, monitor):
+        for _ in range(5_000):
+            monitor.record(1)
+        assert monitor.ewma_hold_rate < 0.01
+        for _ in range(500):
+            monitor.record(0)
+        assert monitor.ewma_hold_rate > 0.99
+        rates = monitor.ewma()
+        assert sum(rates.values()) == pytest.approx(1.0)
+
+    def test_constant_memory(self, monitor, clock):
+        for i in range(20_000):
+            clock.now += 0.5
+            monitor.record(i % 3 - 1)
+        window = monitor._windows['1h']
+        assert len(window.counts) == 60
+        assert monitor.window('1h')['decisions'] <= 7_200
+
+
+class TestEngineMonitor:
+    """Test TLEngine feeding its monitor."""
+
+    def test_hold_storm_visible_in_window(self, clock):
+        engine = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, log_mode='off',
+            monitor=HoldRateMonitor(clock=clock)
+        )
+        engine.evaluate_batch(np.full(10_000, 0.9))
+        clock.now += 7_200
+        for _ in range(100):
+            engine.evaluate(0.5, "storm")
+
+        windowed = engine.get_windowed_statistics()
+        assert windowed['1m']['epistemic_hold_rate'] == 1.0
+        assert windowed['1h']['decisions'] == 100
+        assert windowed['target_hold_rate'] == engine.epistemic_hold_rate_target
+        assert engine.epistemic_hold_rate < 0.01
+
+    def test_unrecorded_batches_are_not_counted(self, clock):
+        engine = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, log_mode='off',
+            monitor=HoldRateMonitor(clock=clock)
+        )
+        engine.evaluate_batch([0.5, 0.5], record=False)
+        assert engine.get_windowed_statistics()['1m']['decisions'] == 0
+
+    def test_engine_without_monitor(self):
+        engine = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, log_mode='off'
+        )
+        with pytest.raises(ValueError):
+            engine.get_windowed_statistics()
@@ -0,0 +1,63 @@
+"""
+Unit tests for the Epistemic Hold registry.
+
+Test philosophy:
+    The registry is an index over the engine's hold records. Tests check
+    that every lookup it serves agrees with what a scan of
+    engine.epistemic_holds would return.
+"""
+import pytest
+from ternary_logic import TLEngine
+
+
+@pytest.fixture
+def engine():
+    """Engine with sample thresholds for hold registry tests."""
+    return TLEngine(proceed_threshold=0.75, hold_threshold=0.35)
+
+
+class TestHoldRegistry:
+    """Test indexed hold resolution and review ordering."""
+
+    def test_resolve_by_event_id(self, engine):
+        """resolve_hold finds the event through the index."""
+        engine.evaluate(0.5, "hold a")
+        engine.evaluate(0.6, "hold b")
+        target = engine.epistemic_holds[1]
+        engine.resolve_hold(target.event_id, "approved")
+        assert target.resolution_action == "approved"
+        assert engine.epistemic_holds[0].resolution_action is None
+
+    def test_unknown_event_raises(self, engine):
+        """Unknown event ids raise ValueError as before."""
+        with pytest.raises(ValueError, match="not found"):
+            engine.resolve_hold("missing", "approved")
+
+    def test_oldest_unresolved(self, engine):
+        """The oldest unresolved hold advances as holds are resolved."""
+        engine.evaluate_batch([0.5, 0.6, 0.7], reasonings=["a", "b", "c"])
+        first, second, _ = engine.epistemic_holds
+        assert engine.oldest_unresolved_hold() is first
+        engine.resolve_hold(first.event_id, "rejected")
+        assert engine.oldest_unresolved_hold() is second
+
+    def test_next_hold_to_review_is_closest_to_proceed(self, engine):
+        """Review order follows distance_to_proceed, skipping resolved holds."""
+        engine.evaluate_batch([0.4, 0.7, 0.55], reasonings=["a", "b", "c"])
+        far, near, middle = engine.epistemic_holds
+        assert engine.next_hold_to_review() is near
+        engine.resolve_hold(near.event_id, "approved")
+        assert engine.next_hold_to_review() is middle
+        engine.resolve_hold(middle.event_id, "approved")
+        engine.resolve_hold(far.event_id, "approved")
+        assert engine.next_hold_to_review() is None
+        assert engine.oldest_unresolved_hold() is None
+
+    def test_unresolved_count_matches_scan(self, engine):
+        """unresolved_holds equals a scan of the hold records."""
+        engine.evaluate_batch([0.4, 0.5, 0.6, 0.7])
+        engine.resolve_hold(engine.epistemic_holds[2].event_id, "approved")
+        expected = sum(
+            1 for e in engine.epistemic_holds if not e.resolution_action
+        )
+        assert engine.get_statistics()['unresolved_holds'] == expected == 3
@@ -0,0 +1,129 @@
+"""
+Unit tests for the durable SQLite hold store.
+
+Test philosophy:
+    Every hold and resolution the engine records must reach the store,
+    open holds must survive an engine restart, and paged queries must
+    return each matching hold exactly once, in timestamp order.
+"""
+import pytest
+from datetime import datetime, timedelta
+from ternary_logic import (
+    ConcurrentTLEngine, EpistemicHoldEvent, SQLiteHoldStore, TLEngine
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteHoldStore(str(tmp_path / 'holds.sqlite3'), batch_size=7)
+    yield store
+    store.close()
+
+
+def make_engine(store, engine_class=TLEngine):
+    return engine_class(
+        proceed_threshold=0.75, hold_threshold=0.35, log_mode='off',
+        hold_store=store
+    )
+
+
+def make_event(i, when, reason="Conflicting signals"):
+    return EpistemicHoldEvent(
+        event_id=f"evt-{i:05d}", trigger_reason=reason, data_inputs={},
+        model_outputs={}, signal_conflicts=[],
+        uncertainty_metrics={'confidence': 0.5}, timestamp=when
+    )
+
+
+class TestSQLiteHoldStore:
+    """Test write-through, restart recovery and paging."""
+
+    def test_write_through(self, store):
+        engine = make_engine(store)
+        for i in range(20):
+            engine.evaluate(0.5, f"hold {i % 3}")
+        engine.evaluate(0.9, "proceed")
+        event = engine.epistemic_holds[4]
+        engine.resolve_hold(event.event_id, "Reviewed")
+        store.flush()
+
+        assert store.count() == 20
+        assert store.count(resolved=True) == 1
+        record = store.get(event.event_id)
+        assert record['resolution_action'] == "Reviewed"
+        assert record == event.to_dict()
+
+    def test_open_holds_survive_restart(self, tmp_path):
+        path = str(tmp_path / 'holds.sqlite3')
+        store = SQLiteHoldStore(path)
+        engine = make_engine(store)
+        engine.evaluate_batch([0.5] * 10, reasonings="batch hold")
+        resolved = engine.epistemic_holds[0].event_id
+        engine.resolve_hold(resolved, "Cleared")
+        engine.close()
+        store.close()
+
+        store = SQLiteHoldStore(path)
+        restarted = make_engine(store)
+        assert restarted.get_statistics()['total_decisions'] == 0
+        assert len(restarted.epistemic_holds) == 9
+        assert restarted.hold_registry.unresolved_count == 9
+        assert resolved not in restarted.hold_registry
+        pending = restarted.oldest_unresolved_hold()
+        restarted.resolve_hold(pending.event_id, "Cleared after restart")
+        store.flush()
+        assert store.count(resolved=False) == 8
+        # Restored holds are not written a second time.
+        assert store.count() == 10
+        store.close()
+
+    def test_paging_visits_each_hold_once(self, store):
+        start = datetime(2026, 1, 1)
+        for i in range(250):
+            event = make_event(
+                i, start + timedelta(seconds=i // 2),
+                "Stale data" if i % 5 == 0 else "Conflicting signals"
+            )
+            store.add(event)
+            if i % 4 == 0:
+                event.resolve("Reviewed")
+                store.resolve(event)
+        store.flush()
+
+        seen, cursor = [], None
+        while True:
+            page = store.page(limit=30, after=cursor)
+            seen.extend(r['event_id'] for r in page.records)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == [f"evt-{i:05d}" for i in range(250)]
+
+        unresolved = list(store.iter_unresolved(page_size=16))
+        assert len(unresolved) == 250 - 63
+        assert all(r['resolution_action'] is None for r in unresolved)
+
+        stale = store.page(limit=1000, trigger_reason="Stale data")
+        assert len(stale.records) == 50
+        assert stale.next_cursor is None
+
+        window = store.page(
+            limit=1000, since=start + timedelta(seconds=10),
+            until=start + timedelta(seconds=20)
+        )
+        assert len(window.records) == 20
+
+    def test_invalid_arguments(self, store):
+        with pytest.raises(ValueError):
+            store.page(limit=0)
+        with pytest.raises(ValueError):
+            store.page(after="not-a-cursor")
+        with pytest.raises(ValueError):
+            SQLiteHoldStore(store.path, batch_size=0)
+
+    def test_concurrent_engine_writes_through(self, store):
+        engine = make_engine(store, ConcurrentTLEngine)
+        for _ in range(5):
+            engine.evaluate(0.5, "concurrent hold")
+        engine.close()
+        assert store.count() == 5
@@ -0,0 +1,155 @@
+"""
+Unit tests for durable ledger storage.
+
+Test philosophy:
+    A commit that returned must survive: it is synced before commit()
+    returns, it reads back exactly, and reopening the directory resumes
+    the sequence after it. Bytes no commit returned for (a torn tail)
+    are discarded on reopen; damage to a sealed segment is reported,
+    never skipped.
+"""
+import os
+import threading
+
+import pytest
+from ternary_logic import DurableLedger
+from ternary_logic import ledger_store
+
+
+def _entry(i):
+    return {
+        'logId': f"log-{i}", 'currentState': i % 3 - 1,
+        'logHash': f"{i:064x}"
+    }
+
+
+class TestCommitAndRead:
+    """Test commits, reads and segment rotation."""
+
+    def test_entries_read_back_across_segments(self, tmp_path):
+        store = DurableLedger(tmp_path, segment_bytes=1024)
+        seqs = [store.commit(_entry(i)) for i in range(100)]
+
+        assert seqs == list(range(100))
+        assert len(store) == 100
+        assert len(store.segments) > 1
+        assert list(store.iter_entries()) == [_entry(i) for i in range(100)]
+        assert list(store.iter_entries(start=63)) == [
+            _entry(i) for i in range(63, 100)
+        ]
+        assert store.last_entry == _entry(99)
+
+    def test_reopen_resumes_sequence(self, tmp_path):
+        store = DurableLedger(tmp_path, segment_bytes=1024)
+        for i in range(40):
+            store.commit(_entry(i))
+        store.close()
+
+        reopened = DurableLedger(tmp_path, segment_bytes=1024)
+        assert len(reopened) == 40
+        assert reopened.last_entry == _entry(39)
+        assert reopened.commit(_entry(40)) == 40
+        assert list(reopened.iter_entries()) == [_entry(i) for i in range(41)]
+
+    def test_commit_returns_after_sync(self, tmp_path, monkeypatch):
+        store = DurableLedger(tmp_path)
+        synced = []
+        real_sync = ledger_store._fdatasync
+
+        def recording_sync(fd):
+            real_sync(fd)
+            synced.append(os.fstat(fd).st_size)
+
+        monkeypatch.setattr(ledger_store, '_fdatasync', recording_sync)
+        for i in range(5):
+            store.commit(_entry(i))
+            assert synced and synced[-1] == store.segments[-1].stat().st_size
+
+    def test_concurrent_commits_share_syncs(self, tmp_path):
+        store = DurableLedger(tmp_path, group_commit_window=0.005)
+        results = []
+
+        def committer(k):
+            for i in range(50):
+                seq = store.commit(_entry(k * 50 + i))
+                results.append((seq, seq < store._durable))
+
+        threads = [
+            threading.Thread(target=committer, args=(k,)) for k in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(seq for seq, _ in results) == list(range(400))
+        assert all(durable for _, durable in results)
+        assert store.sync_count < 400
+        assert sorted(e['logId'] for e in store.iter_entries()) == sorted(
+            _entry(i)['logId'] for i in range(400)
+        )
+
+
+class TestRecovery:
+    """Test reopening after crashes and corruption."""
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        store = DurableLedger(tmp_path)
+        for i in range(3):
+            store.commit(_entry(i))
+        store.close()
+        segment = store.segments[-1]
+        intact = segment.stat().st_size
+        with open(segment, 'ab') as f:
+            f.write(b'\x40\x00\x00\x00\x00\x00\x00\x00{"partial"')
+
+        reopened = DurableLedger(tmp_path)
+
+        assert len(reopened) == 3
+        assert segment.stat().st_size == intact
+        assert reopened.commit(_entry(3)) == 3
+        assert list(reopened.iter_entries()) == [_entry(i) for i in range(4)]
+
+    def test_corrupt_sealed_segment_raises(self, tmp_path):
+        store = DurableLedger(tmp_path, segment_bytes=512)
+        for i in range(20):
+            store.commit(_entry(i))
+        first = store.segments[0]
+        data = bytearray(first.read_bytes())
+        data[40] ^= 0xFF
+        first.write_bytes(bytes(data))
+
+        with pytest.raises(ValueError, match="Corrupt record"):
+            list(store.iter_entries())
+
+    def test_rejects_foreign_files_and_bad_options(self, tmp_path):
+        (tmp_path / "ledger-00000000.tll").write_bytes(b'NOPE' + bytes(12))
+        with pytest.raises(ValueError, match="Not a TL ledger segment"):
+            DurableLedger(tmp_path)
+        with pytest.raises(ValueError, match="segment_bytes"):
+            DurableLedger(tmp_path / "other", segment_bytes=8)
+        with pytest.raises(ValueError, match="group_commit_window"):
+            DurableLedger(tmp_path / "other", group_commit_window=-1)
+
+    def test_failed_write_leaves_no_partial_record(self, tmp_path, monkeypatch):
+        store = DurableLedger(tmp_path)
+        store.commit(_entry(0))
+        real_write = ledger_store._write
+        calls = []
+
+        def failing_write(fd, data):
+            calls.append(len(data))
+            if len(calls) == 1:
+                return real_write(fd, data[:10])    # short write
+            if len(calls) == 2:
+                raise OSError(28, "No space left on device")
+            return real_write(fd, data)
+
+        monkeypatch.setattr(ledger_store, '_write', failing_write)
+        with pytest.raises(OSError, match="No space"):
+            store.commit(_entry(1))
+        assert store.commit(_entry(2)) == 1
+        store.close()
+
+        reopened = DurableLedger(tmp_path)
+        assert list(reopened.iter_entries()) == [_entry(0), _entry(2)]
@@ -0,0 +1,122 @@
+"""
+Unit tests for incremental ledger summaries.
+
+Test philosophy:
+    A running summary must always equal what a full scan of the same
+    entries would report, whatever order the entries arrive in, and
+    time bucket queries must return exactly the buckets in range.
+"""
+from datetime import datetime, timezone
+
+import pytest
+from ternary_logic import LedgerSummary
+
+GENESIS = "00" * 32
+LABELS = {1: "PROCEED", 0: "EPISTEMIC_HOLD", -1: "REFUSE"}
+
+
+def _entry(i, minute=0, second=None):
+    return {
+        "logId": f"log-{i}",
+        "currentState": i % 3 - 1,
+        "merkleRoot": f"{i:064x}",
+        "committedAt": (
+            f"2026-01-01T00:{minute:02d}:"
+            f"{i % 60 if second is None else second:02d}+00:00"
+        ),
+    }
+
+
+def _scan(entries):
+    """The full-scan summary the example ledgers used to compute."""
+    return {
+        label: sum(1 for e in entries if e["currentState"] == state)
+        for state, label in LABELS.items()
+    }
+
+
+class TestRunningTotals:
+    """Test counters, latest root and first/last commit times."""
+
+    def test_empty_summary(self):
+        summary = LedgerSummary(genesis_hash=GENESIS).to_dict()
+
+        assert summary == {
+            "totalEntries": 0,
+            "latestMerkleRoot": GENESIS,
+            "states": {"PROCEED": 0, "EPISTEMIC_HOLD": 0, "REFUSE": 0},
+            "firstCommittedAt": None,
+            "lastCommittedAt": None,
+        }
+
+    def test_matches_full_scan(self):
+        summary = LedgerSummary(genesis_hash=GENESIS)
+        entries = [_entry(i, minute=i // 60) for i in range(250)]
+        for entry in entries:
+            summary.add(entry)
+
+        result = summary.to_dict()
+        assert result["states"] == _scan(entries)
+        assert result["totalEntries"] == summary.total == 250
+        assert result["latestMerkleRoot"] == entries[-1]["merkleRoot"]
+        assert result["firstCommittedAt"] == entries[0]["committedAt"]
+        assert result["lastCommittedAt"] == entries[-1]["committedAt"]
+
+    def test_out_of_order_times(self):
+        summary = LedgerSummary()
+        for entry in [_entry(1, 5), _entry(2, 1), _entry(3, 9), _entry(4, 3)]:
+            summary.add(entry)
+
+        result = summary.to_dict()
+        assert result["firstCommittedAt"] == _entry(2, 1)["committedAt"]
+        assert result["lastCommittedAt"] == _entry(3, 9)["committedAt"]
+        assert result["latestMerkleRoot"] == _entry(4)["merkleRoot"]
+
+    def test_rejects_unknown_state_and_bad_options(self):
+        summary = LedgerSummary()
+        with pytest.raises(ValueError, match="Unknown ledger entry state"):
+            summary.add(dict(_entry(0), currentState=2))
+        assert summary.total == 0
+        with pytest.raises(ValueError, match="bucket_seconds"):
+            LedgerSummary(bucket_seconds=0)
+        with pytest.raises(ValueError, match="max_buckets"):
+            LedgerSummary(max_buckets=0)
+
+
+class TestBuckets:
+    """Test per-state time bucket counts."""
+
+    def test_bucket_counts_and_ranges(self):
+        summary = LedgerSummary()
+        for minute in (0, 2, 3):
+            for i in range(6):
+                summary.add(_entry(i, minute))
+        summary.add(_entry(1, 1))      # late arrival for an earlier minute
+
+        buckets = summary.bucket_counts()
+        assert [b["bucketStart"] for b in buckets] == [
+            f"2026-01-01T00:{m:02d}:00+00:00" for m in range(4)
+        ]
+        assert buckets[0] == {
+            "bucketStart": "2026-01-01T00:00:00+00:00",
+            "totalEntries": 6,
+            "PROCEED": 2, "EPISTEMIC_HOLD": 2, "REFUSE": 2,
+        }
+        assert buckets[1]["EPISTEMIC_HOLD"] == 1
+
+        in_range = summary.bucket_counts(
+            since="2026-01-01T00:01:30+00:00",
+            until=datetime(2026, 1, 1, 0, 3, tzinfo=timezone.utc),
+        )
+        assert [b["bucketStart"][11:16] for b in in_range] == ["00:01", "00:02"]
+        assert summary.bucket_counts(since="2026-01-01T01:00:00") == []
+
+    def test_max_buckets_keeps_most_recent(self):
+        summary = LedgerSummary(bucket_seconds=60, max_buckets=3)
+        for minute in range(6):
+            summary.add(_entry(minute, minute))
+        summary.add(_entry(9, 0))      # older than everything kept
+
+        starts = [b["bucketStart"][11:16] for b in summary.bucket_counts()]
+        assert starts == ["00:03", "00:04", "00:05"]
+        assert summary.total == 7
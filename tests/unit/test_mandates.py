@@ -0,0 +1,248 @@
+"""
+Unit tests for the mandate registry and batch mandate verification.
+
+Test philosophy:
+    A mandate failure must always force an Epistemic Hold. The batch path
+    is a faster route to the same answer: every record must get exactly
+    the state, confidence, reasoning and metadata verify_mandate gives it.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from ternary_logic import (
+    UNFORCED,
+    Mandate,
+    MandateCheck,
+    MandateRegistry,
+    TLEngine,
+    TLState,
+    verify_mandate,
+    verify_mandate_batch,
+)
+
+ECONOMIC_RIGHTS = [
+    'ownership_verified', 'consent_obtained',
+    'provenance_signed', 'regulatory_access'
+]
+
+
+def _assert_same_decisions(mandate_type, records, result, registry=None):
+    assert len(result) == len(records)
+    for i, record in enumerate(records):
+        expected = verify_mandate(mandate_type, record, registry=registry)
+        actual = result[i]
+        assert actual.state == expected.state
+        assert actual.confidence == expected.confidence
+        assert actual.reasoning == expected.reasoning
+        assert actual.metadata == expected.metadata
+
+
+class TestBuiltInMandates:
+    """Test that verify_mandate keeps its behaviour."""
+
+    def test_all_checks_pass(self):
+        value = verify_mandate(
+            'economic_rights', {name: True for name in ECONOMIC_RIGHTS}
+        )
+        assert value.state == TLState.PROCEED
+        assert value.confidence == 1.0
+        assert value.reasoning == "economic_rights verified"
+
+    def test_failure_forces_hold(self):
+        value = verify_mandate('sustainable_capital', {'esg_verified': True})
+        assert value.state == TLState.EPISTEMIC_HOLD
+        assert value.confidence == 0.0
+        assert value.metadata == {
+            'failed_checks': ['emissions_anchored', 'use_of_proceeds_tracked'],
+            'mandate': 'sustainable_capital'
+        }
+        assert value.reasoning == (
+            "sustainable_capital mandate failed: "
+            "['emissions_anchored', 'use_of_proceeds_tracked']"
+        )
+
+    def test_unknown_mandate(self):
+        with pytest.raises(ValueError, match="Unknown mandate type: nope"):
+            verify_mandate('nope', {})
+        with pytest.raises(ValueError, match="Unknown mandate type: nope"):
+            verify_mandate_batch('nope', [])
+
+
+class TestBatchVerification:
+    """Test batch results against verify_mandate record by record."""
+
+    def test_dataframe_matches_scalar(self):
+        rng = np.random.default_rng(3)
+        frame = pd.DataFrame({
+            name: rng.random(500) < 0.9 for name in ECONOMIC_RIGHTS
+        })
+        records = frame.to_dict('records')
+
+        result = verify_mandate_batch('economic_rights', frame)
+
+        _assert_same_decisions('economic_rights', records, result)
+        assert result.passed.sum() == sum(
+            verify_mandate('economic_rights', r).state == TLState.PROCEED
+            for r in records
+        )
+
+    def test_missing_columns_and_mixed_values(self):
+        frame = pd.DataFrame({
+            'esg_verified': [True, None, 1, 0, 'yes', '', float('nan')],
+            'emissions_anchored': [1.0, 1.0, 0.0, 2.0, 1.0, 1.0, 1.0],
+        })
+
+        result = verify_mandate_batch('sustainable_capital', frame)
+
+        _assert_same_decisions(
+            'sustainable_capital', frame.to_dict('records'), result
+        )
+        assert result.check_failure_counts()['use_of_proceeds_tracked'] == 7
+
+    def test_missing_values_fail_in_both_paths(self):
+        frame = pd.DataFrame({
+            'esg_verified': pd.array([True, pd.NA, False, True],
+                                     dtype='boolean'),
+            'emissions_anchored': [1.0, 1.0, 1.0, float('nan')],
+            'use_of_proceeds_tracked': [True, True, True, None],
+        })
+
+        result = verify_mandate_batch('sustainable_capital', frame)
+
+        _assert_same_decisions(
+            'sustainable_capital', frame.to_dict('records'), result
+        )
+        assert result.failed_check_names() == [
+            [],
+            ['esg_verified'],
+            ['esg_verified'],
+            ['emissions_anchored', 'use_of_proceeds_tracked'],
+        ]
+
+    def test_structured_array_mapping_and_dicts(self):
+        records = [
+            {name: bool((i >> bit) & 1) for bit, name in enumerate(ECONOMIC_RIGHTS)}
+            for i in range(16)
+        ]
+        structured = np.array(
+            [tuple(r.values()) for r in records],
+            dtype=[(name, '?') for name in ECONOMIC_RIGHTS]
+        )
+        columns = {name: [r[name] for r in records] for name in ECONOMIC_RIGHTS}
+
+        for source in (structured, columns, records):
+            result = verify_mandate_batch('economic_rights', source)
+            _assert_same_decisions('economic_rights', records, result)
+            assert result.failures[15] == 0
+            assert result.failures[0] == 0b1111
+
+    def test_failed_check_names_on_demand(self):
+        records = [
+            {'esg_verified': True, 'emissions_anchored': True},
+            {'use_of_proceeds_tracked': True},
+            {'esg_verified': True, 'emissions_anchored': True,
+             'use_of_proceeds_tracked': True},
+        ]
+
+        result = verify_mandate_batch('sustainable_capital', records)
+
+        assert result.failed_check_names() == [
+            ['use_of_proceeds_tracked'],
+            ['esg_verified', 'emissions_anchored'],
+            [],
+        ]
+        assert result.failed_checks(1) == ['esg_verified', 'emissions_anchored']
+        assert result.counts()['hold_count'] == 2
+
+    def test_force_states_gate_engine_batch(self):
+        records = [
+            {name: True for name in ECONOMIC_RIGHTS},
+            {'ownership_verified': True},
+        ]
+        result = verify_mandate_batch('economic_rights', records)
+        assert result.force_states().tolist() == [
+            UNFORCED, TLState.EPISTEMIC_HOLD.value
+        ]
+
+        engine = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, log_mode='off'
+        )
+        states = engine.evaluate_batch(
+            [0.99, 0.99], force_states=result.force_states()
+        )
+        assert states.tolist() == [
+            TLState.PROCEED.value, TLState.EPISTEMIC_HOLD.value
+        ]
+
+
+class TestDeclaredMandates:
+    """Test mandates declared with comparison and membership checks."""
+
+    @pytest.fixture
+    def registry(self):
+        return MandateRegistry([Mandate('sustainable_capital.eu', (
+            'esg_verified',
+            MandateCheck('taxonomy_aligned', field='taxonomy_share',
+                         op='>=', value=0.5),
+            MandateCheck('eligible_region', field='region', op='in',
+                         value={'EU', 'EEA'}),
+            MandateCheck('not_sanctioned', field='sanction_score',
+                         op='<', value=1),
+        ))])
+
+    def test_batch_matches_scalar(self, registry):
+        frame = pd.DataFrame({
+            'esg_verified': [True, True, False, True, True],
+            'taxonomy_share': [0.7, 0.5, 0.9, float('nan'), 0.2],
+            'region': ['EU', 'US', 'EEA', 'EU', None],
+            'sanction_score': [0, 0, 3, 0, 0],
+        })
+
+        result = verify_mandate_batch(
+            'sustainable_capital.eu', frame, registry=registry
+        )
+
+        _assert_same_decisions(
+            'sustainable_capital.eu', frame.to_dict('records'), result,
+            registry=registry
+        )
+        assert result.passed.tolist() == [True, False, False, False, False]
+
+    def test_missing_values_fail_every_op(self):
+        registry = MandateRegistry([Mandate('gaps', (
+            MandateCheck('ne', field='score', op='!=', value=1.0),
+            MandateCheck('not_in', field='score', op='not in', value={1.0}),
+            MandateCheck('ge', field='share', op='>=', value=0.0),
+        ))])
+        frame = pd.DataFrame({
+            'score': [float('nan'), 2.0, 3.0],
+            'share': pd.array([0.5, pd.NA, 0.1], dtype='Float64'),
+        })
+
+        result = verify_mandate_batch('gaps', frame, registry=registry)
+
+        _assert_same_decisions(
+            'gaps', frame.to_dict('records'), result, registry=registry
+        )
+        assert result.failed_check_names() == [['ne', 'not_in'], ['ge'], []]
+
+    def test_empty_custom_registry_is_not_replaced(self):
+        empty = MandateRegistry()
+        with pytest.raises(ValueError, match="Unknown mandate type"):
+            verify_mandate('economic_rights', {}, registry=empty)
+        with pytest.raises(ValueError, match="Unknown mandate type"):
+            verify_mandate_batch('economic_rights', [{}], registry=empty)
+
+    def test_registry_validation(self, registry):
+        mandate = registry.get('sustainable_capital.eu')
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register(mandate)
+        registry.register(mandate, replace=True)
+        with pytest.raises(ValueError, match="op"):
+            MandateCheck('x', op='~=', value=1)
+        with pytest.raises(ValueError, match="needs a value"):
+            MandateCheck('x', op='<')
+        with pytest.raises(ValueError, match="at most 64"):
+            Mandate('wide', tuple(f"check_{i}" for i in range(65)))
+        with pytest.raises(ValueError, match="repeats"):
+            Mandate('dup', ('a', 'a'))
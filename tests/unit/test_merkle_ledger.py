@@ -0,0 +1,199 @@
+"""
+Unit tests for the Merkle ledger.
+
+Test philosophy:
+    Every root must equal the one a plain recursive build of the same
+    leaves gives, however the leaves arrived (one at a time or in
+    batches), and every proof must verify under the exact fold the
+    on-chain verifier runs. A proof must never verify a different leaf,
+    position or root.
+"""
+import hashlib
+
+import pytest
+from ternary_logic import MerkleLedger, keccak256, verify_merkle_proof
+
+
+def _leaf(i):
+    return hashlib.sha256(f"entry-{i}".encode()).digest()
+
+
+def _reference_root(leaves):
+    """Recursive build: sorted-pair SHA-256, unpaired nodes promoted."""
+    level = list(leaves)
+    while len(level) > 1:
+        paired = [
+            hashlib.sha256(b''.join(sorted(level[i:i + 2]))).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def _sha256(data):
+    return hashlib.sha256(data).digest()
+
+
+def _solidity_verify(leaf, root, proof, digest=_sha256):
+    """TL_Ledger_Core.verifyMerkleInclusion with the bridge's
+    hex-to-bytes32 conversion; digest stands in for keccak256."""
+    computed = leaf
+    for element in (bytes.fromhex(p[2:]) for p in proof):
+        if computed <= element:
+            computed = digest(computed + element)
+        else:
+            computed = digest(element + computed)
+    return computed == root
+
+
+class TestRoots:
+    """Test roots against a reference build."""
+
+    def test_incremental_and_batched_roots_match_reference(self):
+        leaves = [_leaf(i) for i in range(70)]
+        one_by_one = MerkleLedger()
+        batched = MerkleLedger()
+        assert one_by_one.root is None
+
+        for n, leaf in enumerate(leaves, start=1):
+            one_by_one.append_leaf(leaf)
+            assert one_by_one.root == _reference_root(leaves[:n])
+
+        for start, stop in ((0, 1), (1, 4), (4, 5), (5, 33), (33, 70)):
+            assert batched.extend_leaves(leaves[start:stop]) == range(start, stop)
+            assert batched.root == _reference_root(leaves[:stop])
+        assert batched._levels == one_by_one._levels
+
+    def test_earlier_roots_stay_reproducible(self):
+        leaves = [_leaf(i) for i in range(37)]
+        tree = MerkleLedger()
+        tree.extend_leaves(leaves)
+        for size in range(1, 38):
+            assert tree.root_at(size) == _reference_root(leaves[:size])
+        assert tree.root_at(0) is None
+        with pytest.raises(ValueError, match="out of range"):
+            tree.root_at(38)
+
+    def test_records_and_hex_leaves(self):
+        records = [f"record-{i}".encode() for i in range(5)]
+        tree = MerkleLedger()
+        assert tree.extend(records) == range(5)
+        assert tree.append(b"record-5") == 5
+
+        hex_tree = MerkleLedger()
+        for i, record in enumerate(records + [b"record-5"]):
+            digest = hashlib.sha256(record).hexdigest()
+            hex_tree.append_leaf(digest if i % 2 else '0x' + digest)
+        assert hex_tree.root == tree.root
+        assert tree.root_hex == '0x' + tree.root.hex()
+
+    def test_custom_digest(self):
+        digest = lambda data: hashlib.sha3_256(data).digest()
+        tree = MerkleLedger(digest=digest)
+        tree.extend([b"a", b"b", b"c"])
+        assert tree.leaf(0) == digest(b"a")
+        assert tree.root != MerkleLedger().root
+        assert verify_merkle_proof(
+            tree.leaf(2), tree.proof(2), tree.root, digest=digest
+        )
+        assert not verify_merkle_proof(tree.leaf(2), tree.proof(2), tree.root)
+
+
+class TestProofs:
+    """Test inclusion proofs."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13, 31, 32, 33, 100])
+    def test_every_leaf_verifies(self, size):
+        leaves = [_leaf(i) for i in range(size)]
+        tree = MerkleLedger()
+        tree.extend_leaves(leaves)
+        for index, leaf in enumerate(leaves):
+            proof = tree.proof_hex(index)
+            assert len(proof) <= max(size - 1, 0).bit_length()
+            assert verify_merkle_proof(leaf, proof, tree.root)
+            assert _solidity_verify(leaf, tree.root, proof)
+
+    def test_proofs_against_earlier_roots(self):
+        tree = MerkleLedger()
+        tree.extend_leaves([_leaf(i) for i in range(50)])
+        for size in (1, 7, 16, 29, 50):
+            root = tree.root_at(size)
+            for index in range(size):
+                assert verify_merkle_proof(
+                    tree.leaf(index), tree.proof(index, size=size), root
+                )
+        with pytest.raises(IndexError):
+            tree.proof(7, size=7)
+
+    def test_proof_rejects_other_leaves_and_roots(self):
+        tree = MerkleLedger()
+        tree.extend_leaves([_leaf(i) for i in range(9)])
+        proof = tree.proof(4)
+        assert not verify_merkle_proof(tree.leaf(5), proof, tree.root)
+        assert not verify_merkle_proof(tree.leaf(4), proof, tree.root_at(8))
+        tampered = [proof[0][:-1] + bytes([proof[0][-1] ^ 1])] + proof[1:]
+        assert not verify_merkle_proof(tree.leaf(4), tampered, tree.root)
+
+    def test_hex_keeps_leading_zero_digits(self):
+        tree = MerkleLedger()
+        tree.append_leaf(bytes(32))
+        tree.append_leaf(_leaf(1))
+        proof = tree.proof_hex(1)
+        assert proof == ['0x' + '00' * 32]
+        assert all(len(p) == 66 for p in proof)
+        assert verify_merkle_proof(_leaf(1), proof, tree.root_hex)
+
+
+class TestOnChainAnchoring:
+    """Test keccak256 trees and the (root, proof) pairs tokens carry."""
+
+    @pytest.mark.parametrize("data, expected", [
+        (b"", "c5d2460186f7233c927e7db2dcc703c0"
+              "e500b653ca82273b7bfad8045d85a470"),
+        (b"abc", "4e03657aea45a94fc7d47ba826c8d667"
+                 "c0d1e6e33a64a036ec44f58fa12d6c45"),
+        (b"Transfer(address,address,uint256)",
+         "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"),
+    ])
+    def test_keccak256_vectors(self, data, expected):
+        assert keccak256(data).hex() == expected
+        assert keccak256(bytearray(data)).hex() == expected
+        assert keccak256(data) != hashlib.sha3_256(data).digest()
+
+    def test_token_root_verifies_its_proof(self):
+        log_hashes = [_leaf(i).hex() for i in range(11)]
+        tree = MerkleLedger(digest=keccak256)
+        tokens = []
+        for index, log_hash in enumerate(log_hashes):
+            tree.append_leaf(log_hash)
+            merkle_root, merkle_proof = tree.anchor(index)
+            tokens.append(
+                ({"logHash": log_hash, "merkleRoot": merkle_root}, merkle_proof)
+            )
+
+        # Each pair stays valid as the ledger grows past it
+        for token, merkle_proof in tokens:
+            assert verify_merkle_proof(
+                token["logHash"], merkle_proof, token["merkleRoot"],
+                digest=keccak256
+            )
+            assert _solidity_verify(
+                bytes.fromhex(token["logHash"]),
+                bytes.fromhex(token["merkleRoot"][2:]),
+                merkle_proof,
+                digest=keccak256
+            )
+
+        token, merkle_proof = tokens[4]
+        assert token["merkleRoot"] == '0x' + tree.root_at(5).hex()
+        assert merkle_proof == tree.proof_hex(4, size=5)
+        sha_tree = MerkleLedger()
+        sha_tree.extend_leaves(log_hashes[:5])
+        assert not verify_merkle_proof(
+            token["logHash"], sha_tree.proof_hex(4), token["merkleRoot"],
+            digest=keccak256
+        )
+        with pytest.raises(IndexError):
+            tree.anchor(5, size=5)
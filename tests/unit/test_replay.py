@@ -0,0 +1,146 @@
+"""
+Unit tests for parallel replay of historical decision inputs.
+
+Test philosophy:
+    A parallel replay must be indistinguishable from evaluating the same
+    inputs sequentially with one engine: same states in the same order,
+    same statistics, same decision log and one Epistemic Hold per hold.
+"""
+import json
+import pytest
+import numpy as np
+from ternary_logic import (
+    ColumnarDecisionLog, ParallelReplay, TLEngine, TLState, UNFORCED
+)
+
+PROCEED, HOLD = 0.75, 0.35
+
+
+@pytest.fixture
+def confidences():
+    return np.random.default_rng(11).random(5_000)
+
+
+def sequential(confidences, **kwargs):
+    engine = TLEngine(
+        proceed_threshold=PROCEED, hold_threshold=HOLD, log_mode='off',
+        decision_log=ColumnarDecisionLog()
+    )
+    states = engine.evaluate_batch(confidences, **kwargs)
+    return states, engine
+
+
+def replay(**kwargs):
+    kwargs.setdefault('chunk_size', 700)
+    kwargs.setdefault('max_workers', 2)
+    return ParallelReplay(
+        proceed_threshold=PROCEED, hold_threshold=HOLD, **kwargs
+    )
+
+
+class TestParallelReplay:
+    """Test ParallelReplay against a sequential engine."""
+
+    def test_requires_thresholds(self):
+        with pytest.raises(ValueError):
+            ParallelReplay()
+        with pytest.raises(ValueError):
+            replay(chunk_size=0)
+
+    def test_arrays_match_sequential(self, confidences):
+        """States, statistics and logs merge back in input order."""
+        result = replay().run_arrays(confidences, reasonings="look-back")
+        states, engine = sequential(confidences, reasonings="look-back")
+
+        np.testing.assert_array_equal(result.states, states)
+        expected = engine.get_statistics()
+        actual = result.statistics
+        assert actual['average_confidence'] == pytest.approx(
+            expected.pop('average_confidence')
+        )
+        for key, value in expected.items():
+            assert actual[key] == value
+        np.testing.assert_array_equal(
+            result.decision_log.column('state'), states
+        )
+        np.testing.assert_array_equal(
+            result.decision_log.column('confidence'), confidences
+        )
+        assert result.decision_log[0].reasoning == "look-back"
+
+    def test_one_unique_hold_per_hold_decision(self, confidences):
+        result = replay().run_arrays(confidences)
+        holds = int((result.states == TLState.EPISTEMIC_HOLD.value).sum())
+        assert len(result.epistemic_holds) == holds
+        assert len({e.event_id for e in result.epistemic_holds}) == holds
+        assert result.statistics['unresolved_holds'] == holds
+        confidences_in_order = [
+            e.uncertainty_metrics['confidence'] for e in result.epistemic_holds
+        ]
+        mask = result.states == TLState.EPISTEMIC_HOLD.value
+        assert confidences_in_order == confidences[mask].tolist()
+
+    def test_holds_can_be_resolved_on_merged_engine(self, confidences):
+        result = replay().run_arrays(confidences)
+        event = result.epistemic_holds[0]
+        result.engine.resolve_hold(event.event_id, "Reviewed in look-back")
+        assert event.resolution_action == "Reviewed in look-back"
+
+    def test_force_states(self, confidences):
+        forced = np.full(len(confidences), UNFORCED, dtype=np.int8)
+        forced[::3] = TLState.REFUSE.value
+        result = replay().run_arrays(confidences, force_states=forced)
+        states, _ = sequential(confidences, force_states=forced)
+        np.testing.assert_array_equal(result.states, states)
+
+    def test_record_false_keeps_statistics(self, confidences):
+        result = replay(record=False).run_arrays(confidences)
+        states, engine = sequential(confidences)
+        np.testing.assert_array_equal(result.states, states)
+        assert len(result.decision_log) == 0
+        assert result.epistemic_holds == []
+        assert (
+            result.statistics['hold_count']
+            == engine.get_statistics()['hold_count']
+        )
+
+    def test_ndjson_input(self, tmp_path, confidences):
+        """NDJSON lines replay like arrays; non-decision records are skipped."""
+        path = tmp_path / 'archive.ndjson'
+        with open(path, 'w') as f:
+            for i, c in enumerate(confidences[:1000]):
+                record = {'confidence': float(c), 'reasoning': f"tick {i}"}
+                if i == 5:
+                    record['force_state'] = 'REFUSE'
+                f.write(json.dumps(record) + '\n')
+                if i % 100 == 0:
+                    f.write(json.dumps(
+                        {'record_type': 'epistemic_hold', 'event_id': 'x'}
+                    ) + '\n')
+
+        result = replay().run_ndjson(str(path))
+        assert len(result.states) == 1000
+        assert result.states[5] == TLState.REFUSE.value
+        expected, _ = sequential(confidences[:1000])
+        expected[5] = TLState.REFUSE.value
+        np.testing.assert_array_equal(result.states, expected)
+        assert result.decision_log[999].reasoning == "tick 999"
+
+    def test_empty_input(self):
+        result = replay().run_arrays([])
+        assert len(result.states) == 0
+        assert result.statistics['total_decisions'] == 0
+
+    def test_append_log_merges_columnar_logs(self):
+        first, second = ColumnarDecisionLog(8), ColumnarDecisionLog(8)
+        for log, tag in ((first, 'a'), (second, 'b')):
+            engine = TLEngine(
+                proceed_threshold=PROCEED, hold_threshold=HOLD,
+                log_mode='off', decision_log=log
+            )
+            for i in range(10):
+                engine.evaluate(0.5, f"{tag}{i % 2}", metadata={'i': i})
+        first.append_log(second)
+        assert len(first) == 20
+        assert [v.reasoning for v in first][9:12] == ['a1', 'b0', 'b1']
+        assert first[15].metadata == {'i': 5}
@@ -0,0 +1,122 @@
+"""
+Unit tests for bounded retention with spill-to-disk segments.
+
+Test philosophy:
+    Retention changes where records live, never what the audit trail
+    contains. Statistics must stay exact over the whole history and the
+    exported trail must contain every decision and hold exactly once.
+"""
+import json
+import pytest
+from ternary_logic import TLEngine, RetentionPolicy
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engine keeping five records in memory, three per segment."""
+    return TLEngine(
+        proceed_threshold=0.75,
+        hold_threshold=0.35,
+        retention=RetentionPolicy(
+            str(tmp_path / "segments"), max_entries=5, segment_size=3
+        )
+    )
+
+
+class TestRetention:
+    """Test the retention mode of TLEngine."""
+
+    def test_memory_window_is_bounded(self, engine):
+        """Only the most recent decisions stay in memory."""
+        for i in range(20):
+            engine.evaluate(0.9, f"decision {i}")
+        assert len(engine.decision_log) == 5
+        assert engine.decision_log[0].reasoning == "decision 15"
+        assert len(engine.decision_log.segments) == 5
+
+    def test_statistics_cover_full_history(self, engine):
+        """Counters include spilled decisions."""
+        for c in (0.9, 0.5, 0.1) * 10:
+            engine.evaluate(c, "history")
+        stats = engine.get_statistics()
+        assert stats['total_decisions'] == 30
+        assert stats['hold_count'] == 10
+        assert engine.epistemic_hold_rate == pytest.approx(1 / 3)
+
+    def test_export_streams_segments(self, engine, tmp_path):
+        """The exported trail contains every decision in order."""
+        for i in range(12):
+            engine.evaluate(0.9 if i % 2 else 0.5, f"decision {i}")
+        path = tmp_path / "audit.json"
+        engine.export_audit_trail(str(path))
+        audit = json.loads(path.read_text())
+        assert [d['reasoning'] for d in audit['decision_log']] == [
+            f"decision {i}" for i in range(12)
+        ]
+        assert len(audit['epistemic_holds']) == 6
+        assert audit['statistics']['total_decisions'] == 12
+
+    def test_unresolved_holds_are_not_spilled(self, engine):
+        """Unresolved holds stay resolvable after leaving the window."""
+        first = engine.evaluate(0.5, "oldest hold")
+        for i in range(10):
+            engine.evaluate(0.6, f"hold {i}")
+        oldest = engine.oldest_unresolved_hold()
+        assert oldest.trigger_reason == first.reasoning
+        assert oldest not in list(engine.epistemic_holds)
+
+        engine.resolve_hold(oldest.event_id, "approved")
+        spilled = list(engine.epistemic_holds.iter_records())
+        resolved = [h for h in spilled if h['trigger_reason'] == "oldest hold"]
+        assert resolved[0]['resolution_action'] == "approved"
+        assert engine.get_statistics()['unresolved_holds'] == 10
+
+    def test_rejects_decision_log_with_retention(self, tmp_path):
+        """retention provides its own log and cannot be combined."""
+        with pytest.raises(ValueError):
+            TLEngine(
+                proceed_threshold=0.75,
+                hold_threshold=0.35,
+                decision_log=[],
+                retention=RetentionPolicy(str(tmp_path), max_entries=1)
+            )
+
+    def test_policy_requires_a_bound(self, tmp_path):
+        """A policy without any bound is rejected."""
+        with pytest.raises(ValueError):
+            RetentionPolicy(str(tmp_path))
+
+    def test_binary_segments_export_the_same_trail(self, tmp_path):
+        """Binary segments round-trip to the same exported records."""
+        trails = {}
+        for fmt in ('ndjson', 'binary'):
+            engine = TLEngine(
+                proceed_threshold=0.75,
+                hold_threshold=0.35,
+                retention=RetentionPolicy(
+                    str(tmp_path / fmt), max_entries=2, segment_size=3,
+                    segment_format=fmt
+                )
+            )
+            for i in range(10):
+                engine.evaluate(0.9 if i % 2 else 0.5, f"decision {i}")
+            for hold in list(engine.epistemic_holds.iter_records())[:3]:
+                engine.resolve_hold(hold['event_id'], "approved")
+            trails[fmt] = (
+                list(engine.decision_log.iter_records()),
+                list(engine.epistemic_holds.iter_records())
+            )
+        suffixes = {p.suffix for p in (tmp_path / 'binary').iterdir()}
+        assert suffixes == {'.tlb'}
+        decisions, holds = trails['binary']
+        assert [d['reasoning'] for d in decisions] == [
+            d['reasoning'] for d in trails['ndjson'][0]
+        ]
+        assert decisions[0].keys() == trails['ndjson'][0][0].keys()
+        assert [h['resolution_action'] for h in holds] == [
+            h['resolution_action'] for h in trails['ndjson'][1]
+        ]
+
+    def test_rejects_unknown_segment_format(self, tmp_path):
+        with pytest.raises(ValueError, match="segment_format"):
+            RetentionPolicy(str(tmp_path), max_entries=1, segment_format='xml')
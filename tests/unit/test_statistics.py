@@ -0,0 +1,72 @@
+"""
+Unit tests for engine statistics.
+
+Test philosophy:
+    Statistics are served from running counters. Every test checks that
+    the counters agree with a direct recount of the decision log and
+    hold records, which is what get_statistics used to compute.
+"""
+import pytest
+import numpy as np
+from ternary_logic import TLEngine, TLState
+
+
+@pytest.fixture
+def engine():
+    """Engine with sample thresholds for statistics tests."""
+    return TLEngine(proceed_threshold=0.75, hold_threshold=0.35)
+
+
+def recount(engine):
+    """Recompute statistics by scanning the logs."""
+    log = list(engine.decision_log)
+    return {
+        'proceed_count': sum(1 for d in log if d.state == TLState.PROCEED),
+        'hold_count': sum(1 for d in log if d.state == TLState.EPISTEMIC_HOLD),
+        'refuse_count': sum(1 for d in log if d.state == TLState.REFUSE),
+        'average_confidence': sum(d.confidence for d in log) / len(log),
+        'unresolved_holds': sum(
+            1 for e in engine.epistemic_holds if not e.resolution_action
+        ),
+    }
+
+
+class TestIncrementalStatistics:
+    """Test that counters track evaluate, evaluate_batch and resolve_hold."""
+
+    def test_empty_engine(self, engine):
+        """An unused engine reports zero decisions."""
+        stats = engine.get_statistics()
+        assert stats['total_decisions'] == 0
+        assert engine.epistemic_hold_rate == 0.0
+
+    def test_counters_match_recount(self, engine):
+        """Scalar and batch decisions are both counted."""
+        for c in (0.9, 0.5, 0.1, 0.6):
+            engine.evaluate(c, "scalar")
+        engine.evaluate_batch(np.random.default_rng(3).random(200))
+        engine.evaluate(0.95, "forced", force_state=TLState.EPISTEMIC_HOLD)
+
+        stats = engine.get_statistics()
+        expected = recount(engine)
+        for key in ('proceed_count', 'hold_count', 'refuse_count',
+                    'unresolved_holds'):
+            assert stats[key] == expected[key]
+        assert stats['average_confidence'] == pytest.approx(
+            expected['average_confidence']
+        )
+        assert stats['total_decisions'] == 205
+        assert engine.epistemic_hold_rate == pytest.approx(
+            expected['hold_count'] / 205
+        )
+
+    def test_resolution_updates_unresolved_count(self, engine):
+        """Resolving a hold decrements the unresolved count exactly once."""
+        engine.evaluate(0.5, "first hold")
+        engine.evaluate(0.6, "second hold")
+        event_id = engine.epistemic_holds[0].event_id
+
+        engine.resolve_hold(event_id, "approved after review")
+        assert engine.get_statistics()['unresolved_holds'] == 1
+        engine.resolve_hold(event_id, "re-documented")
+        assert engine.get_statistics()['unresolved_holds'] == 1
@@ -0,0 +1,163 @@
+"""
+Unit tests for per-profile threshold routing.
+
+Test philosophy:
+    A decision evaluated under a profile must get exactly the state an
+    engine configured with that profile's thresholds would give it,
+    whether evaluated one at a time or in a vectorized batch, and
+    per-profile statistics must add up to the engine totals.
+"""
+import json
+import pytest
+import numpy as np
+from ternary_logic import (
+    ColumnarDecisionLog, CompactTLValue, TLEngine, TLState,
+    ThresholdProfileTable
+)
+
+PROFILES = {
+    'rates': (0.80, 0.40),
+    'fx': (0.65, 0.30),
+    'credit': (0.90, 0.60),
+}
+
+
+@pytest.fixture
+def table():
+    return ThresholdProfileTable(PROFILES)
+
+
+@pytest.fixture
+def engine(table):
+    return TLEngine(
+        proceed_threshold=0.75, hold_threshold=0.35, log_mode='off',
+        profiles=table
+    )
+
+
+def reference_states(confidences, profile_ids):
+    states = []
+    for c, pid in zip(confidences, profile_ids):
+        proceed, hold = PROFILES[pid]
+        states.append(1 if c >= proceed else -1 if c < hold else 0)
+    return np.array(states, dtype=np.int8)
+
+
+class TestThresholdProfileTable:
+    """Test the profile table itself."""
+
+    def test_profiles_are_validated(self):
+        with pytest.raises(ValueError):
+            ThresholdProfileTable({'bad': (0.40, 0.80)})
+        with pytest.raises(ValueError):
+            ThresholdProfileTable({'bad': (None, 0.30)})
+
+    def test_unknown_profile_raises(self, table):
+        with pytest.raises(ValueError):
+            table.get('equities')
+        with pytest.raises(ValueError):
+            table.codes(['rates', 'equities'])
+
+    def test_classify_matches_reference(self, table):
+        rng = np.random.default_rng(12)
+        confidences = rng.random(2_000)
+        ids = rng.choice(list(PROFILES), 2_000)
+        np.testing.assert_array_equal(
+            table.classify(confidences, ids),
+            reference_states(confidences, ids)
+        )
+
+    def test_recalibration_does_not_touch_snapshots(self, table):
+        before = table.snapshot()
+        table.set('fx', 0.70, 0.20)
+        table.set('commodities', 0.85, 0.50)
+        assert before[1][before[0]['fx']] == 0.65
+        assert 'commodities' not in before[0]
+        assert table.get('fx').hold_threshold == 0.20
+        assert table.profile_ids[-1] == 'commodities'
+
+
+class TestEngineProfiles:
+    """Test TLEngine routing decisions to profiles."""
+
+    def test_evaluate_uses_profile_thresholds(self, engine):
+        # 0.70 is below the engine and rates proceed thresholds, above fx.
+        assert engine.evaluate(0.70, "t").state == TLState.EPISTEMIC_HOLD
+        assert engine.evaluate(0.70, "t", profile='fx').state == TLState.PROCEED
+        decision = engine.evaluate(0.70, "t", profile='credit')
+        assert decision.state == TLState.EPISTEMIC_HOLD
+        assert decision.profile == 'credit'
+        assert decision.to_dict()['profile'] == 'credit'
+
+    def test_profile_without_table_raises(self):
+        engine = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, log_mode='off'
+        )
+        with pytest.raises(ValueError):
+            engine.evaluate(0.5, "t", profile='fx')
+        with pytest.raises(ValueError):
+            engine.evaluate_batch([0.5], profiles='fx')
+
+    def test_batch_matches_single_evaluation(self, engine):
+        rng = np.random.default_rng(13)
+        confidences = rng.random(3_000)
+        ids = rng.choice(list(PROFILES), 3_000)
+        states = engine.evaluate_batch(confidences, profiles=ids)
+        np.testing.assert_array_equal(states, reference_states(confidences, ids))
+        assert engine.decision_log[7].profile == ids[7]
+
+    def test_batch_single_profile_and_length_check(self, engine):
+        states = engine.evaluate_batch([0.62, 0.70], profiles='fx')
+        assert states.tolist() == [0, 1]
+        with pytest.raises(ValueError):
+            engine.evaluate_batch([0.5, 0.6], profiles=['fx'])
+
+    def test_hold_distance_uses_profile(self, engine):
+        engine.evaluate(0.70, "t", profile='credit')
+        event = engine.epistemic_holds[-1]
+        assert event.uncertainty_metrics['distance_to_proceed'] == pytest.approx(0.20)
+
+    def test_profile_statistics_add_up(self, engine):
+        rng = np.random.default_rng(14)
+        ids = rng.choice(list(PROFILES), 1_000)
+        engine.evaluate_batch(rng.random(1_000), profiles=ids)
+        for c in rng.random(50):
+            engine.evaluate(float(c), "t", profile='rates')
+
+        per_profile = engine.get_profile_statistics()
+        assert set(per_profile) == set(PROFILES)
+        assert sum(s['total_decisions'] for s in per_profile.values()) == 1_050
+        assert sum(s['hold_count'] for s in per_profile.values()) == (
+            engine.get_statistics()['hold_count']
+        )
+        rates = engine.get_profile_statistics('rates')
+        assert rates['total_decisions'] == int((ids == 'rates').sum()) + 50
+        assert rates['proceed_threshold'] == 0.80
+
+    def test_profiles_in_columnar_log_and_compact_values(self, table):
+        engine = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, log_mode='off',
+            profiles=table, decision_log=ColumnarDecisionLog()
+        )
+        engine.evaluate(0.5, "single", profile='fx')
+        engine.evaluate(0.5, "none")
+        engine.evaluate_batch([0.5, 0.9], profiles=['rates', 'credit'])
+        assert [v.profile for v in engine.decision_log] == [
+            'fx', None, 'rates', 'credit'
+        ]
+
+        compact = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, log_mode='off',
+            profiles=table, value_class=CompactTLValue
+        )
+        assert compact.evaluate(0.5, "t", profile='fx').profile == 'fx'
+
+    def test_export_includes_profiles(self, engine, tmp_path):
+        engine.evaluate(0.5, "t", profile='fx')
+        path = tmp_path / 'audit.json'
+        engine.export_audit_trail(str(path))
+        data = json.loads(path.read_text())
+        assert data['engine_config']['threshold_profiles']['fx'] == {
+            'proceed_threshold': 0.65, 'hold_threshold': 0.30
+        }
+        assert data['decision_log'][0]['profile'] == 'fx'
@@ -0,0 +1,165 @@
+"""
+Unit tests for hot-swapping thresholds on a live engine.
+
+Test philosophy:
+    Recalibration must be validated like construction, must never lose
+    accumulated statistics, and every decision must be attributable to
+    exactly one threshold version. A batch is classified entirely under
+    the version current when it started.
+"""
+import json
+import threading
+import pytest
+import numpy as np
+from ternary_logic import (
+    ColumnarDecisionLog, CompactTLValue, NDJSONAuditExporter, TLEngine,
+    TLState, ThresholdProfileTable
+)
+
+
+@pytest.fixture
+def engine():
+    return TLEngine(proceed_threshold=0.75, hold_threshold=0.35, log_mode='off')
+
+
+class TestThresholdVersions:
+    """Test update_thresholds and per-decision epochs."""
+
+    def test_initial_epoch(self, engine):
+        assert engine.threshold_epoch == 0
+        assert engine.evaluate(0.9, "t").threshold_epoch == 0
+        assert engine.thresholds.proceed_threshold == 0.75
+
+    def test_update_applies_and_keeps_statistics(self, engine):
+        engine.evaluate(0.70, "before")
+        version = engine.update_thresholds(proceed_threshold=0.65)
+        decision = engine.evaluate(0.70, "after")
+
+        assert version.epoch == 1
+        assert engine.proceed_threshold == 0.65
+        assert engine.hold_threshold == 0.35
+        assert decision.state == TLState.PROCEED
+        assert decision.threshold_epoch == 1
+        assert engine.decision_log[0].threshold_epoch == 0
+        assert engine.get_statistics()['total_decisions'] == 2
+
+    def test_invalid_update_changes_nothing(self, engine):
+        with pytest.raises(ValueError):
+            engine.update_thresholds(proceed_threshold=0.30)
+        with pytest.raises(ValueError):
+            engine.update_thresholds(profiles={'fx': (0.6, 0.3)})
+        assert engine.threshold_epoch == 0
+        assert engine.proceed_threshold == 0.75
+
+    def test_profile_update_is_all_or_nothing(self):
+        table = ThresholdProfileTable({'fx': (0.65, 0.30)})
+        engine = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, log_mode='off',
+            profiles=table
+        )
+        with pytest.raises(ValueError):
+            engine.update_thresholds(
+                profiles={'fx': (0.70, 0.30), 'rates': (0.20, 0.40)}
+            )
+        assert table.get('fx').proceed_threshold == 0.65
+        assert 'rates' not in table
+
+        engine.update_thresholds(profiles={'fx': (0.70, 0.30)})
+        decision = engine.evaluate(0.68, "t", profile='fx')
+        assert decision.state == TLState.EPISTEMIC_HOLD
+        assert decision.threshold_epoch == 1
+
+    def test_direct_table_change_gets_an_epoch(self):
+        table = ThresholdProfileTable({'fx': (0.65, 0.30)})
+        engine = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, log_mode='off',
+            profiles=table
+        )
+        table.set('fx', 0.60, 0.30)
+        decision = engine.evaluate(0.62, "t", profile='fx')
+        assert decision.state == TLState.PROCEED
+        assert decision.threshold_epoch == 1
+        assert engine.evaluate(0.62, "t", profile='fx').threshold_epoch == 1
+
+    def test_batch_records_one_epoch(self, engine):
+        engine.update_thresholds(hold_threshold=0.40)
+        result = engine.evaluate_batch(
+            np.linspace(0, 1, 50), return_view=True
+        )
+        assert result.threshold_epoch == 1
+        assert {v.threshold_epoch for v in engine.decision_log} == {1}
+
+    def test_batches_see_consistent_snapshots(self, engine):
+        """Concurrent swaps never mix two versions inside one batch."""
+        pairs = [(0.75, 0.35), (0.55, 0.15)]
+        confidences = np.linspace(0.0, 0.999, 2_000)
+        expected = {}
+        for epoch_parity, (proceed, hold) in enumerate(pairs):
+            states = np.zeros(len(confidences), dtype=np.int8)
+            states[confidences >= proceed] = 1
+            states[confidences < hold] = -1
+            expected[epoch_parity] = states
+        stop = threading.Event()
+
+        def swapper():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                proceed, hold = pairs[i % 2]
+                engine.update_thresholds(proceed, hold)
+
+        thread = threading.Thread(target=swapper)
+        thread.start()
+        try:
+            for _ in range(200):
+                result = engine.evaluate_batch(
+                    confidences, record=False, return_view=True
+                )
+                np.testing.assert_array_equal(
+                    result.states, expected[result.threshold_epoch % 2]
+                )
+        finally:
+            stop.set()
+            thread.join()
+
+    def test_epoch_in_logs_and_values(self, engine):
+        columnar = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, log_mode='off',
+            decision_log=ColumnarDecisionLog()
+        )
+        columnar.evaluate(0.5, "a")
+        columnar.update_thresholds(0.80, 0.30)
+        columnar.evaluate_batch([0.5, 0.9])
+        assert [v.threshold_epoch for v in columnar.decision_log] == [0, 1, 1]
+
+        compact = TLEngine(
+            proceed_threshold=0.75, hold_threshold=0.35, log_mode='off',
+            value_class=CompactTLValue
+        )
+        compact.update_thresholds(0.80, 0.30)
+        value = compact.evaluate(0.5, "t")
+        assert value.threshold_epoch == 1
+        assert value.to_dict()['threshold_epoch'] == 1
+
+    def test_history_in_audit_trail(self, engine, tmp_path):
+        engine.update_thresholds(0.80, 0.30)
+        engine.evaluate(0.5, "t")
+        path = tmp_path / 'audit.json'
+        engine.export_audit_trail(str(path))
+        config = json.loads(path.read_text())['engine_config']
+        assert config['threshold_epoch'] == 1
+        assert [v['epoch'] for v in config['threshold_history']] == [0, 1]
+        assert config['threshold_history'][1]['proceed_threshold'] == 0.80
+
+    def test_updates_reach_audit_listeners(self, engine, tmp_path):
+        exporter = NDJSONAuditExporter(str(tmp_path))
+        exporter.attach(engine)
+        engine.update_thresholds(0.80, 0.30)
+        exporter.close()
+        lines = [
+            json.loads(line)
+            for line in next(tmp_path.glob('audit-*.ndjson')).read_text().splitlines()
+        ]
+        assert lines[-1]['record_type'] == 'threshold_update'
+        assert lines[-1]['epoch'] == 1
+        assert exporter.offsets['threshold_updates'] == 1